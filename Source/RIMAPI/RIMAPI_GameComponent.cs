@@ -1,5 +1,6 @@
 ﻿using System;
 using RIMAPI.Core;
+using RIMAPI.Helpers;
 using UnityEngine;
 using Verse;
 
@@ -33,7 +34,11 @@ namespace RIMAPI
         /// </summary>
         private static int _staticTickCounter;
 
-        public RIMAPI_GameComponent(Game game) : base() { }
+        public RIMAPI_GameComponent(Game game) : base()
+        {
+            // Per-map fog history belongs to the previous game
+            FogChangeTracker.Clear();
+        }
 
         /// <summary>
         /// Initializes and starts the HTTP listener and API services.
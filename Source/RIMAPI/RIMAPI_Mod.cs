@@ -133,6 +133,45 @@ namespace RIMAPI
                 60 // Minimum 60 seconds
             );
 
+            list.Label("RIMAPI.CacheMaxMemoryMb".Translate());
+            string bufferCacheMaxMemoryMb = Settings.CacheMaxMemoryMb.ToString();
+            list.TextFieldNumeric(ref Settings.CacheMaxMemoryMb, ref bufferCacheMaxMemoryMb, 1, 16384);
+
+            list.GapLine();
+
+            // --- Compression Configuration ---
+            list.CheckboxLabeled("RIMAPI.EnableCompression".Translate(), ref Settings.EnableCompression);
+
+            list.Label("RIMAPI.CompressionMinBytes".Translate());
+            string bufferCompressionMinBytes = Settings.CompressionMinBytes.ToString();
+            list.TextFieldNumeric(ref Settings.CompressionMinBytes, ref bufferCompressionMinBytes, 0, 100000000);
+
+            list.GapLine();
+
+            // --- SSE Configuration ---
+            list.Label("RIMAPI.SseClientQueueSize".Translate());
+            string bufferSseClientQueueSize = Settings.SseClientQueueSize.ToString();
+            list.TextFieldNumeric(ref Settings.SseClientQueueSize, ref bufferSseClientQueueSize, 1, 100000);
+
+            list.CheckboxLabeled("RIMAPI.SseDisconnectSlowClients".Translate(), ref Settings.SseDisconnectSlowClients);
+
+            list.Label("RIMAPI.SseReplayBufferSize".Translate());
+            string bufferSseReplayBufferSize = Settings.SseReplayBufferSize.ToString();
+            list.TextFieldNumeric(ref Settings.SseReplayBufferSize, ref bufferSseReplayBufferSize, 0, 100000);
+
+            list.GapLine();
+
+            // --- Request Scheduling Configuration ---
+            list.Label("RIMAPI.RequestFrameBudgetMs".Translate());
+            string bufferRequestFrameBudgetMs = Settings.RequestFrameBudgetMs.ToString();
+            list.TextFieldNumeric(ref Settings.RequestFrameBudgetMs, ref bufferRequestFrameBudgetMs, 0.5f, 100f);
+
+            list.Label("RIMAPI.RequestMaxWaitMs".Translate());
+            string bufferRequestMaxWaitMs = Settings.RequestMaxWaitMs.ToString();
+            list.TextFieldNumeric(ref Settings.RequestMaxWaitMs, ref bufferRequestMaxWaitMs, 10, 60000);
+
+            list.CheckboxLabeled("RIMAPI.EnableSnapshotReads".Translate(), ref Settings.EnableSnapshotReads);
+
             list.End();
         }
 
@@ -79,6 +79,75 @@ namespace RIMAPI
         /// </summary>
         public int CacheDefaultExpirationSeconds = 10;
 
+        /// <summary>
+        /// Upper bound on the bytes held by the response cache. Least recently used entries
+        /// of the lowest priority are evicted first when it is exceeded.
+        /// <para>Default: 64 MB</para>
+        /// </summary>
+        public int CacheMaxMemoryMb = 64;
+
+
+        // --- Compression Configuration ---
+
+        /// <summary>
+        /// Compresses JSON responses with gzip or deflate when the client's Accept-Encoding allows it.
+        /// <para>Default: true</para>
+        /// </summary>
+        public bool EnableCompression = true;
+
+        /// <summary>
+        /// Responses smaller than this are sent uncompressed, since compressing them saves less
+        /// than it costs.
+        /// <para>Default: 1024 bytes</para>
+        /// </summary>
+        public int CompressionMinBytes = 1024;
+
+
+        // --- SSE Configuration ---
+
+        /// <summary>
+        /// Maximum number of events buffered per SSE client while its writer catches up.
+        /// <para>Default: 256 events</para>
+        /// </summary>
+        public int SseClientQueueSize = 256;
+
+        /// <summary>
+        /// What to do when a client's queue is full: disconnect it (true) or drop its oldest queued event (false).
+        /// <para>Default: false (drop oldest)</para>
+        /// </summary>
+        public bool SseDisconnectSlowClients = false;
+
+        /// <summary>
+        /// Number of recent events kept for replay to clients reconnecting with Last-Event-ID (0 disables replay).
+        /// <para>Default: 1024 events. Requires a server restart.</para>
+        /// </summary>
+        public int SseReplayBufferSize = 1024;
+
+
+        // --- Request Scheduling Configuration ---
+
+        /// <summary>
+        /// Main-thread time per frame that queued HTTP requests may use. At least one request is
+        /// dispatched every frame, so a single slow request can still exceed it.
+        /// <para>Default: 4 ms</para>
+        /// </summary>
+        public float RequestFrameBudgetMs = 4f;
+
+        /// <summary>
+        /// Queue wait after which a request is served ahead of higher priority classes, so bulk
+        /// reads are delayed but never starved.
+        /// <para>Default: 500 ms</para>
+        /// </summary>
+        public int RequestMaxWaitMs = 500;
+
+        /// <summary>
+        /// Serves hot reads (colonists, map pawns, resource summary, game state) from snapshots
+        /// captured every <see cref="refreshIntervalTicks"/>, off the main thread. Responses carry
+        /// the <c>snapshot_tick</c> they were captured at.
+        /// <para>Default: false</para>
+        /// </summary>
+        public bool EnableSnapshotReads = false;
+
 
         // --- Properties with Change Triggers ---
 
@@ -149,6 +218,21 @@ namespace RIMAPI
             Scribe_Values.Look(ref EnableCaching, "enableCaching", true);
             Scribe_Values.Look(ref CacheLogStatistics, "cacheLogStatistics", true);
             Scribe_Values.Look(ref CacheDefaultExpirationSeconds, "cacheDefaultExpirationSeconds", 60);
+            Scribe_Values.Look(ref CacheMaxMemoryMb, "cacheMaxMemoryMb", 64);
+
+            // Compression Settings
+            Scribe_Values.Look(ref EnableCompression, "enableCompression", true);
+            Scribe_Values.Look(ref CompressionMinBytes, "compressionMinBytes", 1024);
+
+            // SSE Settings
+            Scribe_Values.Look(ref SseClientQueueSize, "sseClientQueueSize", 256);
+            Scribe_Values.Look(ref SseDisconnectSlowClients, "sseDisconnectSlowClients", false);
+            Scribe_Values.Look(ref SseReplayBufferSize, "sseReplayBufferSize", 1024);
+
+            // Request Scheduling Settings
+            Scribe_Values.Look(ref RequestFrameBudgetMs, "requestFrameBudgetMs", 4f);
+            Scribe_Values.Look(ref RequestMaxWaitMs, "requestMaxWaitMs", 500);
+            Scribe_Values.Look(ref EnableSnapshotReads, "enableSnapshotReads", false);
 
             // Post-Load Initialization
             // Ensure the static logger is updated immediately after settings are loaded from disk.
@@ -1,19 +1,32 @@
 using System.Net;
 using System.Threading.Tasks;
 using RIMAPI.Core;
+using RIMAPI.Helpers;
 using RIMAPI.Http;
 using RIMAPI.Models;
 using RIMAPI.Services;
+using Verse;
 
 namespace RIMAPI.Controllers
 {
     public class DevToolsController
     {
+        private const int MaxBenchmarkIterations = 1000;
+        private const int MaxBenchmarkItems = 500000;
+        private const int MaxEmitCount = 10000;
+        private const int MaxEmitSize = 64 * 1024;
+        // Synthetic events can never be mistaken for, or filtered as, real game events
+        private const string TestEventPrefix = "test.";
+
         private readonly IDevToolsService _devToolsService;
+        private readonly Router _router;
+        private readonly SseService _sseService;
 
-        public DevToolsController(IDevToolsService gameStateService)
+        public DevToolsController(IDevToolsService gameStateService, Router router, SseService sseService)
         {
             _devToolsService = gameStateService;
+            _router = router;
+            _sseService = sseService;
         }
 
         [Post("/api/v1/dev/console")]
@@ -69,5 +82,120 @@ namespace RIMAPI.Controllers
             var result = _devToolsService.GetEndpoints();
             await context.SendJsonResponse(result);
         }
+
+        [Post("/api/v1/dev/events/emit")]
+        [EndpointMetadata("Broadcast synthetic SSE events for load testing")]
+        public async Task EmitTestEvents(HttpListenerContext context)
+        {
+            string type = RequestParser.GetStringParameter(context, "type", false) ?? TestEventPrefix + "event";
+            int count = RequestParser.HasParameter(context, "count")
+                ? RequestParser.GetIntParameter(context, "count")
+                : 1;
+            int size = RequestParser.HasParameter(context, "size")
+                ? RequestParser.GetIntParameter(context, "size")
+                : 0;
+
+            if (!type.StartsWith(TestEventPrefix) || type.Length == TestEventPrefix.Length)
+            {
+                await context.SendJsonResponse(ApiResult.Fail($"type must start with '{TestEventPrefix}'"));
+                return;
+            }
+            if (count < 1 || count > MaxEmitCount)
+            {
+                await context.SendJsonResponse(ApiResult.Fail($"count must be between 1 and {MaxEmitCount}"));
+                return;
+            }
+            if (size < 0 || size > MaxEmitSize)
+            {
+                await context.SendJsonResponse(ApiResult.Fail($"size must be between 0 and {MaxEmitSize}"));
+                return;
+            }
+
+            string padding = new string('x', size);
+            int ticks = Current.Game != null ? Find.TickManager.TicksGame : 0;
+            for (int i = 0; i < count; i++)
+            {
+                _sseService.BroadcastTestEvent(type, new { index = i, ticks, padding });
+            }
+
+            await context.SendJsonResponse(ApiResult<object>.Ok(new { type, count, size }));
+        }
+
+        [Get("/api/v1/dev/router/benchmark")]
+        [EndpointMetadata("Benchmark route lookup against the full route table")]
+        public async Task GetRouterBenchmark(HttpListenerContext context)
+        {
+            int iterations = RequestParser.HasParameter(context, "iterations")
+                ? RequestParser.GetIntParameter(context, "iterations")
+                : 20;
+            if (iterations < 1 || iterations > MaxBenchmarkIterations)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"iterations must be between 1 and {MaxBenchmarkIterations}")
+                );
+                return;
+            }
+
+            var result = ApiResult<RouterBenchmarkDto>.Ok(RouterBenchmark.Run(_router, iterations));
+            await context.SendJsonResponse(result);
+        }
+
+        [Get("/api/v1/dev/cache/expiration/benchmark")]
+        [EndpointMetadata("Benchmark cache expiration cleanup lock time against entry count")]
+        public async Task GetCacheExpirationBenchmark(HttpListenerContext context)
+        {
+            int maxEntries = RequestParser.HasParameter(context, "max_entries")
+                ? RequestParser.GetIntParameter(context, "max_entries")
+                : 100000;
+
+            var result = ApiResult<CacheExpirationBenchmarkDto>.Ok(CacheExpirationBenchmark.Run(maxEntries));
+            await context.SendJsonResponse(result);
+        }
+
+        [Get("/api/v1/dev/serialization/benchmark")]
+        [EndpointMetadata("Benchmark response serialization time, memory and GC on a synthetic thing list")]
+        public async Task GetSerializationBenchmark(HttpListenerContext context)
+        {
+            int items = RequestParser.HasParameter(context, "items")
+                ? RequestParser.GetIntParameter(context, "items")
+                : 20000;
+            if (items < 1 || items > MaxBenchmarkItems)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"items must be between 1 and {MaxBenchmarkItems}")
+                );
+                return;
+            }
+
+            var result = ApiResult<SerializationBenchmarkDto>.Ok(SerializationBenchmark.Run(items));
+            await context.SendJsonResponse(result);
+        }
+
+        [Get("/api/v1/dev/thing-index/benchmark")]
+        [EndpointMetadata("Benchmark thing lookups by ID through the index against a scan of the map")]
+        public async Task GetThingIdIndexBenchmark(HttpListenerContext context)
+        {
+            int mapId = RequestParser.GetMapId(context);
+            int lookups = RequestParser.HasParameter(context, "lookups")
+                ? RequestParser.GetIntParameter(context, "lookups")
+                : 1000;
+            if (lookups < 1 || lookups > MaxBenchmarkItems)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"lookups must be between 1 and {MaxBenchmarkItems}")
+                );
+                return;
+            }
+
+            var map = MapHelper.GetMapByID(mapId);
+            if (map == null)
+            {
+                await context.SendJsonResponse(ApiResult.Fail($"Map with ID={mapId} not found"));
+                return;
+            }
+
+            var result = ApiResult<ThingIdIndexBenchmarkDto>.Ok(ThingIdIndexBenchmark.Run(map, lookups));
+            await context.SendJsonResponse(result);
+        }
     }
 }
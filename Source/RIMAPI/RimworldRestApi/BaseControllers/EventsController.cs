@@ -0,0 +1,26 @@
+using System;
+using System.Net;
+using System.Threading.Tasks;
+using RIMAPI.Core;
+using RIMAPI.Http;
+
+namespace RIMAPI.Controllers
+{
+    public class EventsController
+    {
+        private readonly SseService _sseService;
+
+        public EventsController(SseService sseService)
+        {
+            _sseService = sseService;
+        }
+
+        [Get("/api/v1/events/stats")]
+        [EndpointMetadata("Get SSE broadcast statistics")]
+        public async Task GetEventStats(HttpListenerContext context)
+        {
+            var result = ApiResult<SseStatistics>.Ok(_sseService.GetStatistics());
+            await context.SendJsonResponse(result);
+        }
+    }
+}
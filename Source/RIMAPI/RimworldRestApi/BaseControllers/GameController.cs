@@ -153,9 +153,14 @@ namespace RIMAPI.Controllers
                 }
             }
 
+            // Filters from the body are not part of the query string, so they go into the key
+            string cacheKey = "/api/v1/def/all";
+            if (body?.Filters != null && body.Filters.Count > 0)
+                cacheKey += ":" + string.Join(",", body.Filters.OrderBy(f => f, StringComparer.Ordinal));
+
             await _cachingService.CacheAwareResponseAsync(
                 context,
-                "/api/v1/def/all",
+                cacheKey,
                 dataFactory: () => Task.FromResult(_gameStateService.GetAllDefs(body)),
                 expiration: TimeSpan.FromMinutes(5),
                 priority: CachePriority.Normal,
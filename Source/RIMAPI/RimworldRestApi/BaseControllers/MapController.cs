@@ -2,6 +2,7 @@ using System.Collections.Generic;
 using System.Net;
 using System.Threading.Tasks;
 using RIMAPI.Core;
+using RIMAPI.Helpers;
 using RIMAPI.Http;
 using RIMAPI.Models;
 using RIMAPI.Services;
@@ -13,13 +14,15 @@ namespace RIMAPI.Controllers
         private readonly IMapService _mapService;
         private readonly IBuildingService _buildingService;
         private readonly IPawnInfoService _pawnInfoService;
+        private readonly ICachingService _cachingService;
 
         public MapController(IMapService mapService, IBuildingService buildingService,
-                             IPawnInfoService pawnInfoService)
+                             IPawnInfoService pawnInfoService, ICachingService cachingService)
         {
             _mapService = mapService;
             _buildingService = buildingService;
             _pawnInfoService = pawnInfoService;
+            _cachingService = cachingService;
         }
 
         [Get("/api/v1/maps")]
@@ -156,7 +159,13 @@ namespace RIMAPI.Controllers
         public async Task GetMapTerrain(HttpListenerContext context)
         {
             var mapId = RequestParser.GetMapId(context);
-            var result = _mapService.GetMapTerrain(mapId);
+            if (!TryGetGridEncoding(context, out var encoding))
+            {
+                await context.SendJsonResponse(UnknownEncoding(context));
+                return;
+            }
+
+            var result = _mapService.GetMapTerrain(mapId, encoding);
             await context.SendJsonResponse(result);
         }
 
@@ -164,16 +173,41 @@ namespace RIMAPI.Controllers
         public async Task GetMapFogGrid(HttpListenerContext context)
         {
             var mapId = RequestParser.GetMapId(context);
-            var result = _mapService.GetFogGrid(mapId);
-            await context.SendJsonResponse(result);
+            if (!TryGetGridEncoding(context, out var encoding))
+            {
+                await context.SendJsonResponse(UnknownEncoding(context));
+                return;
+            }
+
+            if (RequestParser.HasParameter(context, "since_tick"))
+            {
+                var sinceTick = RequestParser.GetIntParameter(context, "since_tick");
+                await context.SendJsonResponse(_mapService.GetFogGridDelta(mapId, sinceTick, encoding));
+                return;
+            }
+
+            await _cachingService.CacheAwareResponseAsync(
+                context,
+                "/api/v1/map/fog-grid/" + mapId,
+                dataFactory: () => Task.FromResult(_mapService.GetFogGrid(mapId, encoding)),
+                expirationType: CacheExpirationType.GameTick,
+                gameTicksExpiration: 60000,
+                tags: new[] { CacheTags.MapFog(mapId) }
+            );
         }
 
         [Get("/api/v1/map/buildings")]
         public async Task GetMapBuildings(HttpListenerContext context)
         {
             var mapId = RequestParser.GetMapId(context);
-            var result = _mapService.GetMapBuildings(mapId);
-            await context.SendJsonResponse(result);
+            await _cachingService.CacheAwareResponseAsync(
+                context,
+                "/api/v1/map/buildings/" + mapId,
+                dataFactory: () => Task.FromResult(_mapService.GetMapBuildings(mapId)),
+                expirationType: CacheExpirationType.GameTick,
+                gameTicksExpiration: 60000,
+                tags: new[] { CacheTags.MapBuildings(mapId) }
+            );
         }
 
         [Get("/api/v1/map/building/info")]
@@ -287,5 +321,17 @@ namespace RIMAPI.Controllers
             var result = _mapService.UpdateStockpile(body);
             await context.SendJsonResponse(result);
         }
+
+        private static bool TryGetGridEncoding(HttpListenerContext context, out GridEncoding encoding)
+        {
+            var value = RequestParser.GetStringParameter(context, "encoding", false);
+            return GridEncodingHelper.TryParse(value, out encoding);
+        }
+
+        private static ApiResult UnknownEncoding(HttpListenerContext context)
+        {
+            var value = RequestParser.GetStringParameter(context, "encoding", false);
+            return ApiResult.Fail($"Unknown encoding '{value}'. Use varint, bitpacked or deflate.");
+        }
     }
 }
@@ -28,7 +28,8 @@ namespace RIMAPI.Controllers
                 dataFactory: () => Task.FromResult(_colonistService.GetColonists()),
                 priority: CachePriority.Normal,
                 expirationType: CacheExpirationType.GameTick,
-                gameTicksExpiration: 1800
+                gameTicksExpiration: 1800,
+                tags: new[] { CacheTags.Colonists }
             );
         }
 
@@ -41,7 +42,8 @@ namespace RIMAPI.Controllers
                 dataFactory: () => Task.FromResult(_colonistService.GetColonistPositions()),
                 priority: CachePriority.High,
                 expirationType: CacheExpirationType.GameTick,
-                gameTicksExpiration: 1800
+                gameTicksExpiration: 1800,
+                tags: new[] { CacheTags.Colonists }
            );
         }
 
@@ -62,7 +64,8 @@ namespace RIMAPI.Controllers
                 dataFactory: () => Task.FromResult(_colonistService.GetColonistsDetailedV1()),
                 priority: CachePriority.Normal,
                 expirationType: CacheExpirationType.GameTick,
-                gameTicksExpiration: 1800
+                gameTicksExpiration: 1800,
+                tags: new[] { CacheTags.Colonists }
             );
         }
 
@@ -84,7 +87,8 @@ namespace RIMAPI.Controllers
                 dataFactory: () => Task.FromResult(_colonistService.GetColonistsDetailed()),
                 priority: CachePriority.Normal,
                 expirationType: CacheExpirationType.GameTick,
-                gameTicksExpiration: 1800
+                gameTicksExpiration: 1800,
+                tags: new[] { CacheTags.Colonists }
             );
         }
 
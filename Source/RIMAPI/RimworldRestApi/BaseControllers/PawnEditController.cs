@@ -10,6 +10,8 @@ namespace RIMAPI.Controllers
 {
     public class PawnEditController
     {
+        private const int MaxBatchPawns = 500;
+
         private readonly IPawnEditService _pawnEditService;
 
         public PawnEditController(IPawnEditService pawnEditService)
@@ -96,5 +98,21 @@ namespace RIMAPI.Controllers
             var result = _pawnEditService.UpdateFaction(body);
             await context.SendJsonResponse(result);
         }
+
+        [Post("/api/v1/pawns/edit/batch")]
+        public async Task EditBatch(HttpListenerContext context)
+        {
+            var body = await context.Request.ReadBodyAsync<PawnEditBatchRequest>();
+            if (body?.Pawns == null || body.Pawns.Count == 0 || body.Pawns.Count > MaxBatchPawns)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"pawns must list between 1 and {MaxBatchPawns} pawns")
+                );
+                return;
+            }
+
+            var result = _pawnEditService.UpdateBatch(body);
+            await context.SendJsonResponse(result);
+        }
     }
-}
\ No newline at end of file
+}
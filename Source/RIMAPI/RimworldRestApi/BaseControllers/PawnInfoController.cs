@@ -8,6 +8,8 @@ namespace RIMAPI.Controllers
 {
     public class PawnInfoController
     {
+        private const int MaxBatchPawns = 500;
+
         private readonly IPawnInfoService _pawnInfoService;
 
         public PawnInfoController(IPawnInfoService pawnInfoService)
@@ -18,11 +20,35 @@ namespace RIMAPI.Controllers
         [Get("/api/v1/pawns/details")]
         public async Task GetPawnDetails(HttpListenerContext context)
         {
+            if (RequestParser.HasParameter(context, "ids"))
+            {
+                await GetPawnsDetails(context);
+                return;
+            }
+
             int pawnId = RequestParser.GetIntParameter(context, "id");
             var result = _pawnInfoService.GetPawnDetails(pawnId);
             await context.SendJsonResponse(result);
         }
 
+        private async Task GetPawnsDetails(HttpListenerContext context)
+        {
+            var pawnIds = RequestParser.GetIntListParameter(context, "ids");
+            if (pawnIds.Count == 0 || pawnIds.Count > MaxBatchPawns)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"ids must list between 1 and {MaxBatchPawns} pawns")
+                );
+                return;
+            }
+
+            var fields = FieldProjection.ParseFields(
+                RequestParser.GetStringParameter(context, "fields", required: false)
+            );
+            var result = _pawnInfoService.GetPawnsDetails(pawnIds, fields);
+            await context.SendJsonResponse(result);
+        }
+
         [Get("/api/v1/pawns/inventory")]
         public async Task GetPawnInventory(HttpListenerContext context)
         {
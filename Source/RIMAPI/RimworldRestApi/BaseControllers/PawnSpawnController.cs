@@ -10,6 +10,8 @@ namespace RIMAPI.Controllers
 {
     public class PawnSpawnController
     {
+        private const int MaxBatchPawns = 500;
+
         private readonly IPawnSpawnService _pawnSpawnService;
 
         public PawnSpawnController(IPawnSpawnService pawnSpawnService)
@@ -24,5 +26,21 @@ namespace RIMAPI.Controllers
             var result = _pawnSpawnService.SpawnPawn(body);
             await context.SendJsonResponse(result);
         }
+
+        [Post("/api/v1/pawns/spawn/batch")]
+        public async Task SpawnPawns(HttpListenerContext context)
+        {
+            var body = await context.Request.ReadBodyAsync<PawnSpawnBatchRequestDto>();
+            if (body?.Pawns == null || body.Pawns.Count == 0 || body.Pawns.Count > MaxBatchPawns)
+            {
+                await context.SendJsonResponse(
+                    ApiResult.Fail($"pawns must list between 1 and {MaxBatchPawns} pawns")
+                );
+                return;
+            }
+
+            var result = _pawnSpawnService.SpawnPawns(body);
+            await context.SendJsonResponse(result);
+        }
     }
 }
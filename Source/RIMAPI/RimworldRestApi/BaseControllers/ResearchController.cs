@@ -10,10 +10,12 @@ namespace RIMAPI.Controllers
     public class ResearchController
     {
         private readonly IResearchService _researchService;
+        private readonly ICachingService _cachingService;
 
-        public ResearchController(IResearchService researchService)
+        public ResearchController(IResearchService researchService, ICachingService cachingService)
         {
             _researchService = researchService;
+            _cachingService = cachingService;
         }
 
         [Get("/api/v1/research/progress")]
@@ -33,8 +35,16 @@ namespace RIMAPI.Controllers
         [Get("/api/v1/research/tree")]
         public async Task GetResearchTree(HttpListenerContext context)
         {
-            var result = _researchService.GetResearchTree();
-            await context.SendJsonResponse(result);
+            // Invalidated by the research hooks whenever progress or projects change; the
+            // hour-long expiry bounds staleness from progress sources no hook covers
+            await _cachingService.CacheAwareResponseAsync(
+                context,
+                "/api/v1/research/tree",
+                dataFactory: () => Task.FromResult(_researchService.GetResearchTree()),
+                expirationType: CacheExpirationType.GameTick,
+                gameTicksExpiration: 2500,
+                tags: new[] { CacheTags.Research }
+            );
         }
 
         [Get("/api/v1/research/project")]
@@ -0,0 +1,25 @@
+using System.Net;
+using System.Threading.Tasks;
+using RIMAPI.Core;
+using RIMAPI.Http;
+
+namespace RIMAPI.Controllers
+{
+    public class SchedulerController
+    {
+        private readonly RequestScheduler _scheduler;
+
+        public SchedulerController(RequestScheduler scheduler)
+        {
+            _scheduler = scheduler;
+        }
+
+        [Get("/api/v1/scheduler/stats")]
+        [EndpointMetadata("Get request scheduler queue depth, wait times and learned route costs")]
+        public async Task GetSchedulerStats(HttpListenerContext context)
+        {
+            var result = ApiResult<RequestSchedulerStatistics>.Ok(_scheduler.GetStatistics());
+            await context.SendJsonResponse(result);
+        }
+    }
+}
@@ -0,0 +1,25 @@
+using System.Net;
+using System.Threading.Tasks;
+using RIMAPI.Core;
+using RIMAPI.Http;
+
+namespace RIMAPI.Controllers
+{
+    public class SnapshotController
+    {
+        private readonly SnapshotService _snapshotService;
+
+        public SnapshotController(SnapshotService snapshotService)
+        {
+            _snapshotService = snapshotService;
+        }
+
+        [Get("/api/v1/snapshots/stats")]
+        [EndpointMetadata("Get snapshot read path counters and captured routes")]
+        public async Task GetSnapshotStats(HttpListenerContext context)
+        {
+            var result = ApiResult<SnapshotStatistics>.Ok(_snapshotService.GetStatistics());
+            await context.SendJsonResponse(result);
+        }
+    }
+}
@@ -11,11 +11,17 @@ namespace RIMAPI.Controllers
     {
         private readonly IResourceService _resourcesService;
         private readonly IThingsService _thingsService;
+        private readonly ICachingService _cachingService;
 
-        public ThingController(IResourceService resourcesService, IThingsService thingsService)
+        public ThingController(
+            IResourceService resourcesService,
+            IThingsService thingsService,
+            ICachingService cachingService
+        )
         {
             _resourcesService = resourcesService;
             _thingsService = thingsService;
+            _cachingService = cachingService;
         }
 
         [Get("/api/v1/resources/summary")]
@@ -34,13 +40,26 @@ namespace RIMAPI.Controllers
 
             if (string.IsNullOrEmpty(categoryDef))
             {
-                var result = _resourcesService.GetAllStoredResources(mapId);
-                await context.SendJsonResponse(result);
+                await _cachingService.CacheAwareResponseAsync(
+                    context,
+                    "/api/v1/resources/stored/" + mapId,
+                    dataFactory: () => Task.FromResult(_resourcesService.GetAllStoredResources(mapId)),
+                    expirationType: CacheExpirationType.GameTick,
+                    gameTicksExpiration: 250,
+                    tags: new[] { CacheTags.MapThings(mapId) }
+                );
             }
             else
             {
-                var result = _resourcesService.GetAllStoredResourcesByCategory(mapId, categoryDef);
-                await context.SendJsonResponse(result);
+                await _cachingService.CacheAwareResponseAsync(
+                    context,
+                    "/api/v1/resources/stored/" + mapId,
+                    dataFactory: () =>
+                        Task.FromResult(_resourcesService.GetAllStoredResourcesByCategory(mapId, categoryDef)),
+                    expirationType: CacheExpirationType.GameTick,
+                    gameTicksExpiration: 250,
+                    tags: new[] { CacheTags.MapThings(mapId) }
+                );
             }
         }
 
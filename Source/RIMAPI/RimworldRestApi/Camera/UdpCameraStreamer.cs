@@ -20,13 +20,22 @@ namespace RIMAPI.CameraStreamer
         private int frameHeight = 720;
         private int targetFPS = 15;
         private int jpegQuality = 50;
+        private int protocolVersion = 1;
         private float lastFrameTime;
+        private uint frameSequence;
         public bool IsStreaming = false;
 
         // UDP packet settings
         private const int MAX_PACKET_SIZE = 60000; // Safe size below 65,507 limit
         private const int HEADER_SIZE = 10; // Increased header for chunking info
 
+        // v2 header: "RWC" | version | frame seq | chunk index | chunk total | frame length |
+        // chunk offset | payload length | capture tick | capture time (unix microseconds)
+        private const int V2_HEADER_SIZE = 36;
+        private static readonly byte[] V1_MAGIC = System.Text.Encoding.ASCII.GetBytes("CAM");
+        private static readonly byte[] V2_MAGIC = System.Text.Encoding.ASCII.GetBytes("RWC");
+        private static readonly long UnixEpochTicks = new DateTime(1970, 1, 1, 0, 0, 0, DateTimeKind.Utc).Ticks;
+
         public void SetConfig(StreamConfigDto setup)
         {
             streamPort = setup.Port;
@@ -35,6 +44,12 @@ namespace RIMAPI.CameraStreamer
             frameHeight = setup.FrameHeight;
             targetFPS = setup.TargetFps;
             jpegQuality = setup.JpegQuality;
+            if (setup.ProtocolVersion != 0)
+            {
+                if (setup.ProtocolVersion != 1 && setup.ProtocolVersion != 2)
+                    throw new ArgumentException($"Unsupported protocol_version {setup.ProtocolVersion}, use 1 or 2");
+                protocolVersion = setup.ProtocolVersion;
+            }
         }
 
         public StreamConfigDto GetConfig()
@@ -47,6 +62,7 @@ namespace RIMAPI.CameraStreamer
                 FrameHeight = frameHeight,
                 TargetFps = targetFPS,
                 JpegQuality = jpegQuality,
+                ProtocolVersion = protocolVersion,
             };
         }
 
@@ -125,6 +141,10 @@ namespace RIMAPI.CameraStreamer
 
             try
             {
+                // Stamped before rendering so the receiver's latency includes capture and encoding
+                long captureTimeUs = (DateTime.UtcNow.Ticks - UnixEpochTicks) / 10;
+                int captureTick = Find.TickManager?.TicksGame ?? 0;
+
                 // Use existing render texture instead of reassigning
                 RenderTexture previousTarget = camera.targetTexture;
                 camera.targetTexture = renderTexture;
@@ -139,14 +159,21 @@ namespace RIMAPI.CameraStreamer
                 // Encode to JPEG
                 byte[] jpegData = ImageConversion.EncodeToJPG(captureTexture, jpegQuality);
 
-                // Send data based on size
-                if (jpegData.Length > MAX_PACKET_SIZE - HEADER_SIZE)
+                if (protocolVersion == 1)
                 {
-                    SendDataInChunks(jpegData);
+                    // Send data based on size
+                    if (jpegData.Length > MAX_PACKET_SIZE - HEADER_SIZE)
+                    {
+                        SendDataInChunks(jpegData);
+                    }
+                    else
+                    {
+                        SendSinglePacket(jpegData);
+                    }
                 }
                 else
                 {
-                    SendSinglePacket(jpegData);
+                    SendFrameV2(jpegData, frameSequence++, captureTick, captureTimeUs);
                 }
             }
             catch (System.Exception ex)
@@ -182,7 +209,7 @@ namespace RIMAPI.CameraStreamer
         private byte[] CreateDataPacket(byte[] imageData, int chunkIndex, int totalChunks)
         {
             // Packet structure: [3 bytes header][4 bytes data length][2 bytes chunk info][image data]
-            byte[] header = System.Text.Encoding.ASCII.GetBytes("CAM");
+            byte[] header = V1_MAGIC;
             byte[] lengthBytes = BitConverter.GetBytes(imageData.Length);
             byte[] chunkInfo = new byte[] { (byte)chunkIndex, (byte)totalChunks };
 
@@ -203,6 +230,56 @@ namespace RIMAPI.CameraStreamer
             return packet;
         }
 
+        private void SendFrameV2(byte[] imageData, uint sequence, int captureTick, long captureTimeUs)
+        {
+            int maxChunkSize = MAX_PACKET_SIZE - V2_HEADER_SIZE;
+            int totalChunks = Math.Max(1, (imageData.Length + maxChunkSize - 1) / maxChunkSize);
+            if (totalChunks > ushort.MaxValue)
+                throw new InvalidOperationException($"Frame of {imageData.Length} bytes needs more than {ushort.MaxValue} chunks");
+
+            // One packet buffer reused for every chunk of the frame; UdpClient.Send copies it out
+            byte[] packet = new byte[V2_HEADER_SIZE + Math.Min(maxChunkSize, imageData.Length)];
+            for (int chunkIndex = 0; chunkIndex < totalChunks; chunkIndex++)
+            {
+                int chunkOffset = chunkIndex * maxChunkSize;
+                int chunkSize = Math.Min(maxChunkSize, imageData.Length - chunkOffset);
+
+                WriteV2Header(packet, sequence, chunkIndex, totalChunks, imageData.Length, chunkOffset, chunkSize, captureTick, captureTimeUs);
+                Buffer.BlockCopy(imageData, chunkOffset, packet, V2_HEADER_SIZE, chunkSize);
+                udpClient?.Send(packet, V2_HEADER_SIZE + chunkSize, targetIP, streamPort);
+            }
+        }
+
+        private static void WriteV2Header(
+            byte[] packet,
+            uint sequence,
+            int chunkIndex,
+            int totalChunks,
+            int frameLength,
+            int chunkOffset,
+            int chunkSize,
+            int captureTick,
+            long captureTimeUs
+        )
+        {
+            // All fields little-endian, matching BitConverter on every platform RimWorld runs on
+            Buffer.BlockCopy(V2_MAGIC, 0, packet, 0, 3);
+            packet[3] = 2;
+            WriteBytes(packet, 4, BitConverter.GetBytes(sequence));
+            WriteBytes(packet, 8, BitConverter.GetBytes((ushort)chunkIndex));
+            WriteBytes(packet, 10, BitConverter.GetBytes((ushort)totalChunks));
+            WriteBytes(packet, 12, BitConverter.GetBytes(frameLength));
+            WriteBytes(packet, 16, BitConverter.GetBytes(chunkOffset));
+            WriteBytes(packet, 20, BitConverter.GetBytes(chunkSize));
+            WriteBytes(packet, 24, BitConverter.GetBytes(captureTick));
+            WriteBytes(packet, 28, BitConverter.GetBytes(captureTimeUs));
+        }
+
+        private static void WriteBytes(byte[] packet, int offset, byte[] value)
+        {
+            Buffer.BlockCopy(value, 0, packet, offset, value.Length);
+        }
+
         // Method to adjust quality dynamically if needed
         public void SetQuality(int quality)
         {
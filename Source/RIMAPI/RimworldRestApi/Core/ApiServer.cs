@@ -16,8 +16,9 @@ namespace RIMAPI.Core
         private readonly Router _router;
         private readonly SseService _sseService;
         public SseService SseService => _sseService;
-        private readonly Queue<HttpListenerContext> _requestQueue;
-        private readonly object _queueLock = new object();
+        private readonly RequestScheduler _scheduler;
+        private readonly SnapshotService _snapshotService;
+        private readonly ICachingService _cachingService;
         private bool _isRunning;
         private bool _disposed = false;
 
@@ -47,6 +48,9 @@ namespace RIMAPI.Core
                 LogApi.Info("Initializing extension registry...");
                 _extensionRegistry = new ExtensionRegistry();
 
+                // Created before the service provider so controllers can resolve it
+                _router = new Router();
+
                 // Build service provider
                 LogApi.Info("Creating service provider...");
                 _serviceProvider = serviceProvider ?? CreateDefaultServiceProvider();
@@ -57,6 +61,10 @@ namespace RIMAPI.Core
                 _sseService = (SseService)_serviceProvider.GetService(typeof(SseService));
                 LogApi.Info($"SseService resolved: {_sseService != null}");
 
+                _scheduler = _serviceProvider.GetService<RequestScheduler>() ?? new RequestScheduler(settings);
+                _snapshotService = _serviceProvider.GetService<SnapshotService>();
+                _cachingService = _serviceProvider.GetService<ICachingService>();
+
                 LogApi.Info("Resolving EventRegistry...");
                 _eventRegistry = (EventRegistry)_serviceProvider.GetService(typeof(IEventRegistry));
                 LogApi.Info($"EventRegistry resolved: {_eventRegistry != null}");
@@ -68,9 +76,6 @@ namespace RIMAPI.Core
                 string listenerPrefix = $"http://{hostBinding}:{Port}/";
                 _listener.Prefixes.Add(listenerPrefix);
 
-                _router = new Router();
-                _requestQueue = new Queue<HttpListenerContext>();
-
                 LogApi.Info("Initializing route registry...");
                 _routeRegistry = new AutoRouteRegistry(_serviceProvider, _router);
 
@@ -78,6 +83,7 @@ namespace RIMAPI.Core
                 var eventPublisher = _serviceProvider.GetService<IEventPublisher>();
                 LogApi.Info($"EventPublisher resolved: {eventPublisher != null}");
                 EventPublisherAccess.Initialize(eventPublisher);
+                CacheInvalidationAccess.Initialize(_cachingService);
 
                 LogApi.Info("Initializing extensions...");
                 InitializeExtensions();
@@ -104,6 +110,8 @@ namespace RIMAPI.Core
 
                 // Register core services
                 services.AddSingleton<RIMAPI_Settings>(Settings);
+                services.AddSingleton<Router>(_router);
+                services.AddSingleton<RequestScheduler>(new RequestScheduler(Settings));
 
                 var cachingService = new CachingService(Settings);
                 services.AddSingleton<ICachingService>(cachingService);
@@ -114,7 +122,7 @@ namespace RIMAPI.Core
 
                 // Create instances first to avoid any DI issues
                 var gameStateService = new GameStateService(cachingService);
-                var sseService = new SseService(gameStateService);
+                var sseService = new SseService(gameStateService, Settings);
                 var eventRegistry = new EventRegistry(sseService);
 
                 services.AddSingleton<ICameraStream, UdpCameraStream>();
@@ -124,6 +132,7 @@ namespace RIMAPI.Core
                 services.AddSingleton<IEventRegistry>(eventRegistry);
                 services.AddSingleton<IEventPublisher, EventPublisher>();
                 services.AddSingleton<ExtensionDocumentationService>();
+                services.AddSingleton<SnapshotService>();
 
                 // Create DocumentationService
                 services.AddSingleton<IDocumentationService, DocumentationService>();
@@ -131,6 +140,10 @@ namespace RIMAPI.Core
                 // Auto-discover and register all controllers and services
                 RegisterDiscoveredComponents(services);
 
+                // Discovery registers ICachingService -> CachingService again; keep the instance
+                // GameStateService holds so there is one cache to invalidate and clean up
+                services.AddSingleton<ICachingService>(cachingService);
+
                 // Register extension services
                 RegisterExtensionServices(services);
 
@@ -329,10 +342,10 @@ namespace RIMAPI.Core
                 try
                 {
                     var context = await _listener.GetContextAsync();
-                    lock (_queueLock)
-                    {
-                        _requestQueue.Enqueue(context);
-                    }
+                    ResponseCompression.Negotiate(context);
+                    if (_snapshotService?.TryServe(context) == true)
+                        continue;
+                    _scheduler.Enqueue(context);
                 }
                 catch (HttpListenerException)
                 {
@@ -349,35 +362,7 @@ namespace RIMAPI.Core
 
         public void ProcessQueuedRequests()
         {
-            List<HttpListenerContext> requestsToProcess;
-
-            lock (_queueLock)
-            {
-                if (_requestQueue.Count == 0)
-                    return;
-
-                requestsToProcess = new List<HttpListenerContext>(_requestQueue);
-                _requestQueue.Clear();
-            }
-
-            var maxRequests = Math.Min(10, requestsToProcess.Count);
-
-            for (int i = 0; i < maxRequests; i++)
-            {
-                var context = requestsToProcess[i];
-                _ = ProcessRequestAsync(context);
-            }
-
-            if (maxRequests < requestsToProcess.Count)
-            {
-                lock (_queueLock)
-                {
-                    for (int i = maxRequests; i < requestsToProcess.Count; i++)
-                    {
-                        _requestQueue.Enqueue(requestsToProcess[i]);
-                    }
-                }
-            }
+            _scheduler.Dispatch(ProcessRequestAsync);
         }
 
         private async Task ProcessRequestAsync(HttpListenerContext context)
@@ -399,7 +384,8 @@ namespace RIMAPI.Core
 
         public void RefreshDataCache()
         {
-            // Optional: Refresh extension data caches if needed
+            _cachingService?.Update();
+            _snapshotService?.Capture();
         }
 
         public void ProcessBroadcastQueue()
@@ -485,17 +471,13 @@ namespace RIMAPI.Core
                 _listener?.Close();
                 _sseService?.Dispose();
 
-                lock (_queueLock)
+                foreach (var context in _scheduler.DrainAll())
                 {
-                    while (_requestQueue.Count > 0)
+                    try
                     {
-                        var context = _requestQueue.Dequeue();
-                        try
-                        {
-                            context.Response?.Close();
-                        }
-                        catch { }
+                        context.Response?.Close();
                     }
+                    catch { }
                 }
 
                 LogApi.Info("API server disposed successfully");
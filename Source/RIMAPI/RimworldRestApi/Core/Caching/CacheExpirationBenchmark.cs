@@ -0,0 +1,64 @@
+using System;
+using System.Collections.Generic;
+using RIMAPI.Models;
+using Verse;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Measures how long expired entry cleanup holds the cache lock as the cache grows,
+    /// comparing the expiration heaps against the previous scan over every entry.
+    /// <para>Each size gets a fresh <see cref="CachingService"/> filled with long-lived entries,
+    /// half wall-clock and half game-tick. Every round adds <see cref="DueEntries"/> entries that
+    /// are already due at the cleanup time and times both approaches.</para>
+    /// </summary>
+    public static class CacheExpirationBenchmark
+    {
+        public const int DueEntries = 100;
+        private const int Rounds = 5;
+        private static readonly int[] EntryCounts = { 100, 1000, 10000, 100000 };
+
+        public static CacheExpirationBenchmarkDto Run(int maxEntries)
+        {
+            var settings = new RIMAPI_Settings { EnableCaching = true, CacheMaxMemoryMb = 16384 };
+            int baseTick = Current.Game != null ? Find.TickManager.TicksGame : 0;
+            var rows = new List<CacheExpirationBenchmarkRowDto>();
+
+            foreach (int count in EntryCounts)
+            {
+                if (count > maxEntries)
+                    break;
+
+                using (var cache = new CachingService(settings))
+                {
+                    for (int i = 0; i < count; i++)
+                        AddEntry(cache, "bench/live/" + i, i, TimeSpan.FromHours(1), 10000000);
+
+                    var row = new CacheExpirationBenchmarkRowDto { Entries = count, DueEntries = DueEntries };
+                    for (int round = 0; round < Rounds; round++)
+                    {
+                        for (int i = 0; i < DueEntries; i++)
+                            AddEntry(cache, $"bench/due/{round}/{i}", i, TimeSpan.FromSeconds(1), 60);
+
+                        var now = DateTime.UtcNow.AddMinutes(1);
+                        int tick = baseTick + 600;
+                        row.FullScanLockMs += cache.MeasureFullScanLockMs(now, tick) / Rounds;
+                        row.Removed += cache.CleanupExpiredEntries(now, tick);
+                        row.HeapLockMs += cache.GetStatistics().LastCleanupLockMs / Rounds;
+                    }
+                    rows.Add(row);
+                }
+            }
+
+            return new CacheExpirationBenchmarkDto { Rounds = Rounds, Rows = rows };
+        }
+
+        private static void AddEntry(CachingService cache, string key, int i, TimeSpan expiration, int ticks)
+        {
+            if (i % 2 == 0)
+                cache.SetWithExpirationType(key, key, CacheExpirationType.Absolute, expiration);
+            else
+                cache.SetWithExpirationType(key, key, CacheExpirationType.GameTick, gameTicksExpiration: ticks);
+        }
+    }
+}
@@ -0,0 +1,33 @@
+using System;
+using RIMAPI.Core;
+
+/// <summary>
+/// Static access to the cache for Harmony patches, which cannot take constructor dependencies.
+/// </summary>
+public static class CacheInvalidationAccess
+{
+    private static ICachingService _cachingService;
+
+    public static void Initialize(ICachingService cachingService)
+    {
+        _cachingService = cachingService;
+        LogApi.Info("CachingService initialized for patches");
+    }
+
+    public static void Invalidate(params string[] tags)
+    {
+        // Patches might run before DI is set up, e.g. while a map is generated
+        var cachingService = _cachingService;
+        if (cachingService == null)
+            return;
+
+        try
+        {
+            cachingService.InvalidateTags(tags);
+        }
+        catch (Exception ex)
+        {
+            LogApi.Error($"[Cache] Error in CacheInvalidationAccess.Invalidate: {ex}");
+        }
+    }
+}
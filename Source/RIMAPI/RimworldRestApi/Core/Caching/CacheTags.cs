@@ -0,0 +1,25 @@
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Dependency tags attached to cache entries (see <see cref="ICachingService.InvalidateTags"/>).
+    /// Game hooks invalidate the tags of what they changed, so tagged entries can live long.
+    /// </summary>
+    public static class CacheTags
+    {
+        /// <summary>Research progress, finished and current projects.</summary>
+        public const string Research = "research";
+
+        /// <summary>The colonist list and anything every colonist contributes to.</summary>
+        public const string Colonists = "colonists";
+
+        public static string Pawn(int pawnId) => "pawn:" + pawnId;
+
+        /// <summary>Items spawned on or removed from a map.</summary>
+        public static string MapThings(int mapId) => $"map:{mapId}:things";
+
+        /// <summary>Buildings built, deconstructed or destroyed on a map.</summary>
+        public static string MapBuildings(int mapId) => $"map:{mapId}:buildings";
+
+        public static string MapFog(int mapId) => $"map:{mapId}:fog";
+    }
+}
@@ -0,0 +1,119 @@
+using System;
+using System.Text;
+using System.Threading.Tasks;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// A fully encoded JSON response kept by <see cref="CachingService.CacheAwareResponseAsync{T}"/>,
+    /// so cache hits are written without serializing again.
+    /// <para>The ETag is a strong validator: a 64-bit FNV-1a hash of the body up to its
+    /// trailing <c>timestamp</c>, so a regenerated entry with unchanged data keeps its ETag.</para>
+    /// <para>Gzip and deflate bodies are compressed the first time a client asks for them and kept
+    /// alongside <see cref="Body"/>; each encoding gets its own ETag, suffixed with the encoding.</para>
+    /// </summary>
+    public class CachedResponse
+    {
+        private const ulong FnvOffset = 14695981039346656037;
+        private const ulong FnvPrime = 1099511628211;
+
+        // ApiResult serializes "timestamp" after its data, errors and warnings
+        private static readonly byte[] TimestampMarker = Encoding.UTF8.GetBytes(",\"timestamp\":");
+
+        public byte[] Body { get; }
+        public string ETag { get; }
+
+        private byte[] _gzipBody;
+        private byte[] _deflateBody;
+
+        /// <summary>Bytes held by the body and the compressed variants made so far.</summary>
+        public long Size => Body.Length + (_gzipBody?.Length ?? 0) + (_deflateBody?.Length ?? 0);
+
+        public CachedResponse(byte[] body)
+        {
+            Body = body;
+            ETag = ComputeETag(body);
+        }
+
+        public static CachedResponse FromResult<T>(ApiResult<T> result)
+        {
+            return new CachedResponse(ResponseBuilder.SerializeToBytes(result));
+        }
+
+        public string GetETag(string encoding)
+        {
+            return encoding == null ? ETag : ETag.Insert(ETag.Length - 1, "-" + encoding);
+        }
+
+        /// <summary>
+        /// Returns the body in <paramref name="encoding"/> (null for uncompressed), compressing it
+        /// off the calling thread on first use.
+        /// </summary>
+        public async Task<byte[]> GetBodyAsync(string encoding)
+        {
+            if (encoding == null)
+                return Body;
+
+            var compressed = encoding == ResponseCompression.Gzip ? _gzipBody : _deflateBody;
+            if (compressed != null)
+                return compressed;
+
+            // Concurrent first requests may both compress; either result is valid
+            compressed = await ResponseCompression.CompressAsync(Body, encoding).ConfigureAwait(false);
+            if (encoding == ResponseCompression.Gzip)
+                _gzipBody = compressed;
+            else
+                _deflateBody = compressed;
+            return compressed;
+        }
+
+        /// <summary>
+        /// Checks an <c>If-None-Match</c> header value (a list of ETags or <c>*</c>) against this response.
+        /// </summary>
+        public bool Matches(string ifNoneMatch)
+        {
+            if (string.IsNullOrEmpty(ifNoneMatch))
+                return false;
+
+            foreach (var candidate in ifNoneMatch.Split(','))
+            {
+                string tag = candidate.Trim();
+                // Weak comparison, as RFC 7232 asks for If-None-Match
+                if (tag.StartsWith("W/"))
+                    tag = tag.Substring(2);
+                if (tag == "*" || tag == ETag
+                    || tag == GetETag(ResponseCompression.Gzip) || tag == GetETag(ResponseCompression.Deflate))
+                    return true;
+            }
+            return false;
+        }
+
+        private static string ComputeETag(byte[] body)
+        {
+            int length = LastIndexOf(body, TimestampMarker);
+            if (length < 0)
+                length = body.Length;
+
+            ulong hash = FnvOffset;
+            for (int i = 0; i < length; i++)
+            {
+                hash ^= body[i];
+                hash *= FnvPrime;
+            }
+            return "\"" + hash.ToString("x16") + "\"";
+        }
+
+        private static int LastIndexOf(byte[] data, byte[] pattern)
+        {
+            for (int i = data.Length - pattern.Length; i >= 0; i--)
+            {
+                int j = 0;
+                while (j < pattern.Length && data[i + j] == pattern[j])
+                    j++;
+                if (j == pattern.Length)
+                    return i;
+            }
+            return -1;
+        }
+    }
+}
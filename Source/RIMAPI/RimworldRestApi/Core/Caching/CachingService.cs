@@ -1,6 +1,8 @@
 // CachingService.cs
 using System;
 using System.Collections.Generic;
+using System.Collections.Specialized;
+using System.Diagnostics;
 using System.Linq;
 using System.Linq.Expressions;
 using System.Net;
@@ -27,6 +29,13 @@ namespace RIMAPI.Core
             public int? GameTickExpiration { get; set; }
 
             public int HitCount { get; set; }
+
+            // Recorded at insert and again when a compressed body is added, see EstimateEntrySize
+            public string Key { get; set; }
+            public string Prefix { get; set; }
+            public long Size { get; set; }
+            public string[] Tags { get; set; }
+            public LinkedListNode<CacheEntry> LruNode { get; set; }
         }
 
         // Generic Property Setter Cache
@@ -118,6 +127,34 @@ namespace RIMAPI.Core
         private readonly LinkedList<RecentHitDetail> _recentActivity = new LinkedList<RecentHitDetail>(); // Circular buffer logic
         private const int MaxRecentActivity = 50;
 
+        // Dictionary slot, entry object and bookkeeping per cached value, roughly
+        private const long EntryOverheadBytes = 128;
+
+        // Eviction picks the entry with the largest idle time divided by its priority weight,
+        // so a High entry is kept four times as long as a Low one that was last used as late
+        private static readonly double[] PriorityWeights = { 1, 2, 4, 16 };
+
+        // One list per CachePriority, most recently used first
+        private readonly LinkedList<CacheEntry>[] _lru = new LinkedList<CacheEntry>[PriorityWeights.Length];
+        private readonly Dictionary<string, long> _bytesByPrefix = new Dictionary<string, long>();
+        private long _totalBytes;
+        private long _evictions;
+        private long _evictedBytes;
+
+        // Entries by due time, wall clock (DateTime ticks) and game tick separately. Stale
+        // items of removed or replaced entries stay until they come due or the heaps are rebuilt.
+        private readonly ExpirationHeap<CacheEntry> _timeExpirations = new ExpirationHeap<CacheEntry>();
+        private readonly ExpirationHeap<CacheEntry> _tickExpirations = new ExpirationHeap<CacheEntry>();
+        private const int ExpirationRebuildSlack = 1024;
+
+        // Dependency tag -> keys of the entries carrying it
+        private readonly Dictionary<string, HashSet<string>> _tagIndex = new Dictionary<string, HashSet<string>>();
+        private long _tagInvalidations;
+
+        // Responses being generated, so concurrent misses on a key share one dataFactory call
+        private readonly Dictionary<string, Task<CachedResponse>> _inFlight = new Dictionary<string, Task<CachedResponse>>();
+        private long _coalesced;
+
         private readonly object _cacheLock = new object();
         private bool _disposed = false;
         private bool _enabled = true;
@@ -128,7 +165,8 @@ namespace RIMAPI.Core
         private int _hits = 0;
         private int _misses = 0;
         private DateTime _lastCleanup = DateTime.UtcNow;
-        private int _lastCleanupTick;
+        private double _lastCleanupLockMs;
+        private double _maxCleanupLockMs;
         private int _compiledDelegateHits = 0;
         private int _compiledDelegateMisses = 0;
         private readonly RIMAPI_Settings _settings;
@@ -136,17 +174,13 @@ namespace RIMAPI.Core
         public CachingService(RIMAPI_Settings settings)
         {
             LogApi.Info("[CachingService] Initialized");
-            if (Current.ProgramState == ProgramState.Playing)
-            {
-                _lastCleanupTick = Find.TickManager.TicksGame;
-            }
-            else
-            {
-                _lastCleanupTick = 0;
-            }
             _settings = settings;
 
             _enabled = _settings.EnableCaching;
+            for (int i = 0; i < _lru.Length; i++)
+            {
+                _lru[i] = new LinkedList<CacheEntry>();
+            }
         }
 
         // Public Compiled Delegate Cache API (Generic)
@@ -194,26 +228,50 @@ namespace RIMAPI.Core
             (_compiledDelegateHits, _compiledDelegateMisses);
 
         // Main Cache Methods
+        /// <summary>
+        /// Removes expired entries. Called from the main thread every <c>refreshIntervalTicks</c>;
+        /// only entries that are due are looked at, so the cost does not grow with the cache size.
+        /// </summary>
         public void Update()
         {
-            var currentTick = Find.TickManager?.TicksGame ?? 0;
+            CleanupExpiredEntries(DateTime.UtcNow, Current.Game != null ? Find.TickManager.TicksGame : 0);
+        }
 
-            // Cleanup every 10 seconds (600 ticks at 60 TPS)
-            if (currentTick - _lastCleanupTick >= 600)
+        internal int CleanupExpiredEntries(DateTime now, int currentTick)
+        {
+            lock (_cacheLock)
             {
-                _lastCleanupTick = currentTick;
-                CleanupExpiredEntries();
+                long start = Stopwatch.GetTimestamp();
+                int removed =
+                    RemoveDue(_timeExpirations, now.Ticks, now, currentTick)
+                    + RemoveDue(_tickExpirations, currentTick, now, currentTick);
+
+                if (removed > 0)
+                {
+                    LogApi.Message(
+                        $"[Cache] Cleaned up {removed} expired entries",
+                        LoggingLevels.DEBUG
+                    );
+                }
+
+                _lastCleanup = now;
+                _lastCleanupLockMs = (Stopwatch.GetTimestamp() - start) * 1000.0 / Stopwatch.Frequency;
+                if (_lastCleanupLockMs > _maxCleanupLockMs)
+                    _maxCleanupLockMs = _lastCleanupLockMs;
+                return removed;
             }
         }
 
-        private void CleanupExpiredEntries()
+        /// <summary>
+        /// Times the previous cleanup, which checked every entry under the lock, without removing
+        /// anything. Only used by <see cref="CacheExpirationBenchmark"/>.
+        /// </summary>
+        internal double MeasureFullScanLockMs(DateTime now, int currentTick)
         {
             lock (_cacheLock)
             {
+                long start = Stopwatch.GetTimestamp();
                 var expiredKeys = new List<string>();
-                var now = DateTime.UtcNow;
-                var currentTick = Find.TickManager?.TicksGame ?? 0;
-
                 foreach (var kvp in _cache)
                 {
                     if (IsExpired(kvp.Value, now, currentTick))
@@ -221,21 +279,66 @@ namespace RIMAPI.Core
                         expiredKeys.Add(kvp.Key);
                     }
                 }
+                return (Stopwatch.GetTimestamp() - start) * 1000.0 / Stopwatch.Frequency;
+            }
+        }
 
-                foreach (var key in expiredKeys)
+        private int RemoveDue(ExpirationHeap<CacheEntry> heap, long due, DateTime now, int currentTick)
+        {
+            int removed = 0;
+            while (heap.TryPopDue(due, out var entry))
+            {
+                // Removed or replaced since it was scheduled
+                if (!_cache.TryGetValue(entry.Key, out var current) || current != entry)
+                    continue;
+
+                if (IsExpired(entry, now, currentTick))
+                {
+                    RemoveEntry(entry.Key);
+                    removed++;
+                }
+                else
                 {
-                    _cache.Remove(key);
+                    // A sliding entry that was accessed after it was scheduled
+                    PushExpiration(entry);
                 }
+            }
+            return removed;
+        }
+
+        private void ScheduleExpiration(CacheEntry entry)
+        {
+            PushExpiration(entry);
 
-                if (expiredKeys.Count > 0)
+            if (_timeExpirations.Count + _tickExpirations.Count > 2 * _cache.Count + ExpirationRebuildSlack)
+            {
+                _timeExpirations.Clear();
+                _tickExpirations.Clear();
+                foreach (var live in _cache.Values)
                 {
-                    LogApi.Message(
-                        $"[Cache] Cleaned up {expiredKeys.Count} expired entries",
-                        LoggingLevels.DEBUG
-                    );
+                    PushExpiration(live);
                 }
+            }
+        }
 
-                _lastCleanup = now;
+        private void PushExpiration(CacheEntry entry)
+        {
+            switch (entry.ExpirationType)
+            {
+                case CacheExpirationType.Absolute:
+                    if (entry.AbsoluteExpiration.HasValue)
+                        _timeExpirations.Push(entry.AbsoluteExpiration.Value.Ticks, entry);
+                    break;
+
+                case CacheExpirationType.Sliding:
+                    if (entry.SlidingExpiration.HasValue)
+                        _timeExpirations.Push(entry.LastAccessed.Add(entry.SlidingExpiration.Value).Ticks, entry);
+                    break;
+
+                case CacheExpirationType.GameTick:
+                    if (entry.GameTickExpiration.HasValue)
+                        _tickExpirations.Push(entry.GameTickAdded + (long)entry.GameTickExpiration.Value, entry);
+                    break;
             }
         }
 
@@ -301,20 +404,16 @@ namespace RIMAPI.Core
                 {
                     if (IsExpired(entry))
                     {
-                        _cache.Remove(key);
+                        RemoveEntry(key);
                         _misses++;
                         RecordActivity(key, false); // Expired counts as miss/re-fetch
                         value = default;
                         return false;
                     }
 
-                    if (entry.ExpirationType == CacheExpirationType.Sliding && entry.SlidingExpiration.HasValue)
-                    {
-                        entry.LastAccessed = DateTime.UtcNow;
-                    }
-
                     _hits++;
                     entry.HitCount++;
+                    Touch(entry);
                     RecordActivity(key, true);
                     value = (T)entry.Value;
                     return true;
@@ -355,7 +454,7 @@ namespace RIMAPI.Core
                     entry.AbsoluteExpiration = now.Add(expiration.Value);
                 }
 
-                _cache[key] = entry;
+                AddEntry(key, entry);
             }
         }
 
@@ -365,7 +464,8 @@ namespace RIMAPI.Core
             CacheExpirationType expirationType = CacheExpirationType.Absolute,
             TimeSpan? expiration = null,
             int? gameTicksExpiration = null,
-            CachePriority priority = CachePriority.Normal
+            CachePriority priority = CachePriority.Normal,
+            IEnumerable<string> tags = null
         )
         {
             if (!_enabled)
@@ -382,6 +482,7 @@ namespace RIMAPI.Core
                     Priority = priority,
                     ExpirationType = expirationType,
                     GameTickAdded = Find.TickManager?.TicksGame ?? 0,
+                    Tags = tags?.ToArray(),
                 };
 
                 switch (expirationType)
@@ -406,7 +507,7 @@ namespace RIMAPI.Core
                         break;
                 }
 
-                _cache[key] = entry;
+                AddEntry(key, entry);
             }
         }
 
@@ -414,7 +515,7 @@ namespace RIMAPI.Core
         {
             lock (_cacheLock)
             {
-                _cache.Remove(key);
+                RemoveEntry(key);
             }
         }
 
@@ -424,6 +525,15 @@ namespace RIMAPI.Core
             {
                 int count = _cache.Count;
                 _cache.Clear();
+                foreach (var list in _lru)
+                {
+                    list.Clear();
+                }
+                _bytesByPrefix.Clear();
+                _totalBytes = 0;
+                _timeExpirations.Clear();
+                _tickExpirations.Clear();
+                _tagIndex.Clear();
                 LogApi.Message($"[Cache] Cleared {count} entries", LoggingLevels.DEBUG);
                 return ApiResult<ServerCacheResponseDto>.Ok(new ServerCacheResponseDto
                 {
@@ -439,36 +549,88 @@ namespace RIMAPI.Core
             TimeSpan? expiration = null,
             CachePriority priority = CachePriority.Normal,
             CacheExpirationType expirationType = CacheExpirationType.Absolute,
-            int? gameTicksExpiration = null
+            int? gameTicksExpiration = null,
+            IEnumerable<string> tags = null
         )
         {
             try
             {
-                // Try to get from cache
-                if (TryGet(cacheKey, out ApiResult<T> cachedResult))
+                // Filters change the body, so each query variant is cached as its own encoded response
+                string variantKey = GetVariantKey(cacheKey, context.Request.QueryString);
+                string ifNoneMatch = context.Request.Headers["If-None-Match"];
+
+                CachedResponse cached;
+                Task<CachedResponse> pending;
+                TaskCompletionSource<CachedResponse> flight = null;
+                lock (_cacheLock)
+                {
+                    // A request for the same key is already generating it: wait for its result
+                    if (_inFlight.TryGetValue(variantKey, out pending))
+                    {
+                        _coalesced++;
+                    }
+                    else if (!TryGet(variantKey, out cached))
+                    {
+                        // Waiters resume on their own, not inside the owner's SetResult
+                        flight = new TaskCompletionSource<CachedResponse>(
+                            TaskCreationOptions.RunContinuationsAsynchronously
+                        );
+                        _inFlight[variantKey] = flight.Task;
+                    }
+                    else
+                    {
+                        pending = Task.FromResult(cached);
+                    }
+                }
+
+                if (flight == null)
                 {
-                    // Cache hit - return the cached ApiResult
-                    // Use SendJsonResponse extension to apply query filters
-                    await context.SendJsonResponse(cachedResult);
-                    LogApi.Message($"[Cache] Hit for key: {cacheKey}", LoggingLevels.DEBUG);
+                    cached = await pending;
+                    if (cached != null)
+                    {
+                        await SendCachedResponse(context, variantKey, cached, ifNoneMatch);
+                        LogApi.Message($"[Cache] Hit for key: {variantKey}", LoggingLevels.DEBUG);
+                        return;
+                    }
+
+                    // The request we waited for failed; generate our own response
+                    await context.SendJsonResponse(await dataFactory());
                     return;
                 }
 
-                // Cache miss - generate data
-                LogApi.Message(
-                    $"[Cache] Miss for key: {cacheKey}, generating...",
-                    LoggingLevels.DEBUG
-                );
-                var result = await dataFactory();
+                CachedResponse response = null;
+                try
+                {
+                    // Cache miss - generate data
+                    LogApi.Message(
+                        $"[Cache] Miss for key: {variantKey}, generating...",
+                        LoggingLevels.DEBUG
+                    );
+                    var result = await dataFactory();
+
+                    // Only cache successful responses
+                    if (!result.Success)
+                    {
+                        await context.SendJsonResponse(result);
+                        return;
+                    }
 
-                // Only cache successful responses
-                if (result.Success)
+                    context.ApplyQueryFilters(result);
+                    response = CachedResponse.FromResult(result);
+                    // Compress for this client before inserting, so the recorded size includes it
+                    string encoding = ResponseCompression.SelectEncoding(context.Response, response.Body.Length);
+                    await response.GetBodyAsync(encoding).ConfigureAwait(false);
+                    SetWithExpirationType(variantKey, response, expirationType, expiration, gameTicksExpiration, priority, tags);
+                }
+                finally
                 {
-                    SetWithExpirationType(cacheKey, result, expirationType, expiration, gameTicksExpiration, priority);
+                    lock (_cacheLock)
+                    {
+                        _inFlight.Remove(variantKey);
+                    }
+                    flight.SetResult(response);
                 }
-
-                // Return response using SendJsonResponse extension to apply query filters
-                await context.SendJsonResponse(result);
+                await SendCachedResponse(context, variantKey, response, ifNoneMatch);
             }
             catch (Exception ex)
             {
@@ -478,6 +640,66 @@ namespace RIMAPI.Core
             }
         }
 
+        private async Task SendCachedResponse(HttpListenerContext context, string key, CachedResponse response, string ifNoneMatch)
+        {
+            string encoding = ResponseCompression.SelectEncoding(context.Response, response.Body.Length);
+            string etag = response.GetETag(encoding);
+            if (response.Matches(ifNoneMatch))
+            {
+                ResponseBuilder.SendNotModified(context.Response, etag);
+                return;
+            }
+
+            long size = response.Size;
+            var body = await response.GetBodyAsync(encoding).ConfigureAwait(false);
+            if (response.Size != size)
+            {
+                lock (_cacheLock)
+                {
+                    UpdateEntrySize(key, response);
+                }
+            }
+            await ResponseBuilder.SendEncodedJson(context.Response, body, etag, encoding: encoding);
+        }
+
+        private static string GetVariantKey(string cacheKey, NameValueCollection query)
+        {
+            if (query.Count == 0)
+                return cacheKey;
+
+            var keys = query.AllKeys.Where(k => k != null).OrderBy(k => k, StringComparer.Ordinal);
+            return cacheKey + "?" + string.Join("&", keys.Select(k => k + "=" + query[k]));
+        }
+
+        public void InvalidateTags(params string[] tags)
+        {
+            lock (_cacheLock)
+            {
+                int removed = 0;
+                foreach (var tag in tags)
+                {
+                    if (!_tagIndex.TryGetValue(tag, out var keys))
+                        continue;
+
+                    // RemoveEntry drops the keys from this set
+                    foreach (var key in keys.ToList())
+                    {
+                        if (RemoveEntry(key))
+                            removed++;
+                    }
+                    _tagInvalidations++;
+                }
+
+                if (removed > 0)
+                {
+                    LogApi.Message(
+                        $"[Cache] Invalidated {removed} entries by tags: {string.Join(", ", tags)}",
+                        LoggingLevels.DEBUG
+                    );
+                }
+            }
+        }
+
         public void InvalidateByPattern(string pattern)
         {
             lock (_cacheLock)
@@ -487,7 +709,7 @@ namespace RIMAPI.Core
 
                 foreach (var key in keysToRemove)
                 {
-                    _cache.Remove(key);
+                    RemoveEntry(key);
                 }
 
                 LogApi.Info(
@@ -504,7 +726,7 @@ namespace RIMAPI.Core
 
                 foreach (var key in keysToRemove)
                 {
-                    _cache.Remove(key);
+                    RemoveEntry(key);
                 }
 
                 LogApi.Info(
@@ -521,7 +743,7 @@ namespace RIMAPI.Core
 
                 foreach (var key in keysToRemove)
                 {
-                    _cache.Remove(key);
+                    RemoveEntry(key);
                 }
 
                 LogApi.Info(
@@ -539,8 +761,19 @@ namespace RIMAPI.Core
                     TotalEntries = _cache.Count,
                     Hits = _hits,
                     Misses = _misses,
-                    MemoryUsageBytes = CalculateMemoryUsage(),
+                    Coalesced = _coalesced,
+                    InFlight = _inFlight.Count,
+                    MemoryUsageBytes = _totalBytes,
+                    MaxMemoryBytes = MaxBytes,
+                    Evictions = _evictions,
+                    EvictedBytes = _evictedBytes,
+                    BytesByPrefix = new Dictionary<string, long>(_bytesByPrefix),
                     LastCleanup = _lastCleanup,
+                    LastCleanupLockMs = _lastCleanupLockMs,
+                    MaxCleanupLockMs = _maxCleanupLockMs,
+                    PendingExpirations = _timeExpirations.Count + _tickExpirations.Count,
+                    Tags = _tagIndex.Count,
+                    TagInvalidations = _tagInvalidations,
                     CompiledDelegateCount = CompiledDelegateCount,
                     CompiledDelegateHits = _compiledDelegateHits,
                     CompiledDelegateMisses = _compiledDelegateMisses,
@@ -582,8 +815,9 @@ namespace RIMAPI.Core
                             AbsoluteExpiration = entry.AbsoluteExpiration,
                             RemainingSeconds = remaining > 0 ? remaining : 0,
                             Hits = entry.HitCount,
-                            EstimatedSize = EstimateObjectSize(entry.Value),
-                            Priority = entry.Priority.ToString()
+                            EstimatedSize = entry.Size,
+                            Priority = entry.Priority.ToString(),
+                            Tags = entry.Tags?.ToList() ?? new List<string>(),
                         });
                     }
 
@@ -631,7 +865,7 @@ namespace RIMAPI.Core
 
                     foreach (var key in keysToRemove)
                     {
-                        _cache.Remove(key);
+                        RemoveEntry(key);
                     }
 
                     LogApi.Info(
@@ -646,7 +880,7 @@ namespace RIMAPI.Core
 
                     foreach (var key in toRemove)
                     {
-                        _cache.Remove(key);
+                        RemoveEntry(key);
                     }
 
                     LogApi.Info($"[Cache] Trimmed {toRemove.Count} oldest entries");
@@ -661,19 +895,189 @@ namespace RIMAPI.Core
             return IsExpired(entry, now, currentTick);
         }
 
-        private long CalculateMemoryUsage()
+        private long MaxBytes => Math.Max(1, _settings.CacheMaxMemoryMb) * 1024L * 1024L;
+
+        // Callers hold _cacheLock for the AddEntry, RemoveEntry, Touch and Evict helpers
+
+        private void AddEntry(string key, CacheEntry entry)
         {
-            // Rough estimation
-            return _cache.Sum(kvp =>
-                System.Text.Encoding.UTF8.GetByteCount(kvp.Key) + EstimateObjectSize(kvp.Value)
-            );
+            RemoveEntry(key);
+
+            entry.Key = key;
+            entry.Prefix = GetSizePrefix(key);
+            entry.Size = EstimateEntrySize(key, entry.Value);
+            if (entry.Size > MaxBytes)
+            {
+                LogApi.Warning($"[Cache] Entry {key} ({entry.Size} bytes) exceeds the cache memory limit, not cached");
+                return;
+            }
+
+            _cache[key] = entry;
+            entry.LruNode = _lru[PriorityIndex(entry.Priority)].AddFirst(entry);
+            _totalBytes += entry.Size;
+            _bytesByPrefix.TryGetValue(entry.Prefix, out long prefixBytes);
+            _bytesByPrefix[entry.Prefix] = prefixBytes + entry.Size;
+            ScheduleExpiration(entry);
+
+            if (entry.Tags != null)
+            {
+                foreach (var tag in entry.Tags)
+                {
+                    if (!_tagIndex.TryGetValue(tag, out var keys))
+                    {
+                        keys = new HashSet<string>();
+                        _tagIndex[tag] = keys;
+                    }
+                    keys.Add(key);
+                }
+            }
+
+            Evict();
+        }
+
+        private bool RemoveEntry(string key)
+        {
+            if (!_cache.TryGetValue(key, out var entry))
+                return false;
+
+            _cache.Remove(key);
+            entry.LruNode.List.Remove(entry.LruNode);
+            _totalBytes -= entry.Size;
+            long prefixBytes = _bytesByPrefix[entry.Prefix] - entry.Size;
+            if (prefixBytes > 0)
+                _bytesByPrefix[entry.Prefix] = prefixBytes;
+            else
+                _bytesByPrefix.Remove(entry.Prefix);
+
+            if (entry.Tags != null)
+            {
+                foreach (var tag in entry.Tags)
+                {
+                    if (_tagIndex.TryGetValue(tag, out var keys) && keys.Remove(key) && keys.Count == 0)
+                        _tagIndex.Remove(tag);
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Re-records the size of a cached response that gained a compressed body after insert.
+        /// </summary>
+        private void UpdateEntrySize(string key, CachedResponse response)
+        {
+            // The entry may have been replaced or removed while compressing
+            if (!_cache.TryGetValue(key, out var entry) || entry.Value != response)
+                return;
+
+            long size = EstimateEntrySize(key, response);
+            if (size > MaxBytes)
+            {
+                LogApi.Warning($"[Cache] Entry {key} ({size} bytes) exceeds the cache memory limit, removed");
+                RemoveEntry(key);
+                return;
+            }
+
+            _totalBytes += size - entry.Size;
+            _bytesByPrefix[entry.Prefix] += size - entry.Size;
+            entry.Size = size;
+            Evict();
+        }
+
+        private void Touch(CacheEntry entry)
+        {
+            entry.LastAccessed = DateTime.UtcNow;
+            var list = entry.LruNode.List;
+            if (list.First != entry.LruNode)
+            {
+                list.Remove(entry.LruNode);
+                list.AddFirst(entry.LruNode);
+            }
+        }
+
+        private void Evict()
+        {
+            long maxBytes = MaxBytes;
+            while (_totalBytes > maxBytes)
+            {
+                // Only the least recently used entry of each priority can be the victim
+                var now = DateTime.UtcNow;
+                CacheEntry victim = null;
+                double victimScore = double.MinValue;
+                for (int i = 0; i < _lru.Length; i++)
+                {
+                    var candidate = _lru[i].Last?.Value;
+                    if (candidate == null)
+                        continue;
+                    double score = (now - candidate.LastAccessed).TotalMilliseconds / PriorityWeights[i];
+                    if (score > victimScore)
+                    {
+                        victim = candidate;
+                        victimScore = score;
+                    }
+                }
+                if (victim == null)
+                    return;
+
+                RemoveEntry(victim.Key);
+                _evictions++;
+                _evictedBytes += victim.Size;
+                LogApi.Message($"[Cache] Evicted {victim.Key} ({victim.Size} bytes)", LoggingLevels.DEBUG);
+            }
+        }
+
+        private static int PriorityIndex(CachePriority priority)
+        {
+            return Math.Max(0, Math.Min(PriorityWeights.Length - 1, (int)priority));
+        }
+
+        private static readonly char[] KeyVariantSeparators = { '?', ':' };
+
+        /// <summary>
+        /// Groups keys for the bytes-per-prefix statistics: "/api/v1/colonists/detailed?fields=id"
+        /// is counted under "/api/v1/colonists".
+        /// </summary>
+        private static string GetSizePrefix(string key)
+        {
+            int end = key.IndexOfAny(KeyVariantSeparators);
+            if (end < 0)
+                end = key.Length;
+
+            int slashes = 0;
+            for (int i = 0; i < end; i++)
+            {
+                if (key[i] == '/' && ++slashes == 4)
+                    return key.Substring(0, i);
+            }
+            return key.Substring(0, end);
+        }
+
+        private static long EstimateEntrySize(string key, object value)
+        {
+            long valueSize;
+            switch (value)
+            {
+                case CachedResponse response:
+                    valueSize = response.Size;
+                    break;
+                case byte[] bytes:
+                    valueSize = bytes.Length;
+                    break;
+                case string text:
+                    valueSize = text.Length * sizeof(char);
+                    break;
+                default:
+                    valueSize = EstimateObjectSize(value);
+                    break;
+            }
+            return EntryOverheadBytes + key.Length * sizeof(char) + valueSize;
         }
 
-        private long EstimateObjectSize(object obj)
+        private static long EstimateObjectSize(object obj)
         {
             if (obj == null)
                 return 0;
 
+            // Serialized size as a stand-in for objects, computed once when the entry is added
             try
             {
                 var json = JsonConvert.SerializeObject(obj);
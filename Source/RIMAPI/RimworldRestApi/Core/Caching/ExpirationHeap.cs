@@ -0,0 +1,73 @@
+using System.Collections.Generic;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Binary min-heap of items ordered by a due time (wall-clock ticks or game ticks).
+    /// <para>Items are not removed when their cache entry goes away; the owner skips stale
+    /// items when they come due, see <see cref="CachingService"/>.</para>
+    /// </summary>
+    public class ExpirationHeap<T>
+    {
+        private readonly List<KeyValuePair<long, T>> _items = new List<KeyValuePair<long, T>>();
+
+        public int Count => _items.Count;
+
+        public void Push(long due, T item)
+        {
+            _items.Add(new KeyValuePair<long, T>(due, item));
+            int i = _items.Count - 1;
+            while (i > 0)
+            {
+                int parent = (i - 1) / 2;
+                if (_items[parent].Key <= _items[i].Key)
+                    break;
+                Swap(i, parent);
+                i = parent;
+            }
+        }
+
+        /// <summary>
+        /// Removes and returns the earliest item if it is due at or before <paramref name="now"/>.
+        /// </summary>
+        public bool TryPopDue(long now, out T item)
+        {
+            if (_items.Count == 0 || _items[0].Key > now)
+            {
+                item = default;
+                return false;
+            }
+
+            item = _items[0].Value;
+            int last = _items.Count - 1;
+            _items[0] = _items[last];
+            _items.RemoveAt(last);
+
+            int i = 0;
+            while (true)
+            {
+                int left = 2 * i + 1;
+                if (left >= _items.Count)
+                    break;
+                int smallest = left + 1 < _items.Count && _items[left + 1].Key < _items[left].Key ? left + 1 : left;
+                if (_items[i].Key <= _items[smallest].Key)
+                    break;
+                Swap(i, smallest);
+                i = smallest;
+            }
+            return true;
+        }
+
+        public void Clear()
+        {
+            _items.Clear();
+        }
+
+        private void Swap(int a, int b)
+        {
+            var tmp = _items[a];
+            _items[a] = _items[b];
+            _items[b] = tmp;
+        }
+    }
+}
@@ -51,7 +51,8 @@ namespace RIMAPI.Core
             TimeSpan? expiration = null,
             CachePriority priority = CachePriority.Normal,
             CacheExpirationType expirationType = CacheExpirationType.Absolute,
-            int? gameTicksExpiration = null
+            int? gameTicksExpiration = null,
+            IEnumerable<string> tags = null
         );
 
         // Cache invalidation patterns
@@ -59,9 +60,15 @@ namespace RIMAPI.Core
         void InvalidateByPrefix(string prefix);
         void InvalidateBySuffix(string suffix);
 
+        // Removes every entry carrying any of the tags (see CacheTags)
+        void InvalidateTags(params string[] tags);
+
         // Cache statistics
         CacheStatistics GetStatistics(bool includeDetails = false);
         void Trim(CachePriority? priority = null);
+
+        // Expired entry cleanup, called from the main thread
+        void Update();
     }
 
     public class CacheEntryDetail
@@ -75,6 +82,7 @@ namespace RIMAPI.Core
         public int Hits { get; set; } // Track hits per entry if possible, or just global hits
         public long EstimatedSize { get; set; }
         public string Priority { get; set; }
+        public List<string> Tags { get; set; }
     }
 
     public class RecentHitDetail
@@ -89,8 +97,19 @@ namespace RIMAPI.Core
         public int TotalEntries { get; set; }
         public int Hits { get; set; }
         public int Misses { get; set; }
+        public long Coalesced { get; set; }
+        public int InFlight { get; set; }
         public long MemoryUsageBytes { get; set; }
+        public long MaxMemoryBytes { get; set; }
+        public long Evictions { get; set; }
+        public long EvictedBytes { get; set; }
+        public Dictionary<string, long> BytesByPrefix { get; set; }
         public DateTime LastCleanup { get; set; }
+        public double LastCleanupLockMs { get; set; }
+        public double MaxCleanupLockMs { get; set; }
+        public int PendingExpirations { get; set; }
+        public int Tags { get; set; }
+        public long TagInvalidations { get; set; }
         public double HitRatio => TotalEntries > 0 ? (double)Hits / (Hits + Misses) : 0;
         public int CompiledDelegateCount { get; set; }
         public int CompiledDelegateHits { get; set; }
@@ -28,8 +28,9 @@ namespace RIMAPI.Core
             );
             res.Headers.Set(
                 "Access-Control-Allow-Headers",
-                "Content-Type, Accept, Authorization, ETag, If-None-Match"
+                "Content-Type, Accept, Authorization, ETag, If-None-Match, Last-Event-ID"
             );
+            res.Headers.Set("Access-Control-Expose-Headers", "ETag, X-RIMAPI-Snapshot-Tick");
         }
 
         public static void WritePreflight(
@@ -57,7 +58,7 @@ namespace RIMAPI.Core
                     : (
                         extraHeaders != null
                             ? string.Join(", ", extraHeaders)
-                            : "Content-Type, Accept, Authorization, ETag, If-None-Match"
+                            : "Content-Type, Accept, Authorization, ETag, If-None-Match, Last-Event-ID"
                     )
             );
 
@@ -0,0 +1,112 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Reduces a DTO to the fields named by a <c>?fields=</c> parameter, using the snake_case
+    /// names of the JSON output. Nested fields are dot separated (<c>colonist_medical_info.health</c>)
+    /// and keep their nesting in the result.
+    /// </summary>
+    public static class FieldProjection
+    {
+        /// <summary>
+        /// Splits a comma separated <c>fields</c> value; null or empty means every field.
+        /// Entries that are not dot separated names of letters, digits and underscores are dropped.
+        /// </summary>
+        public static List<string> ParseFields(string fields)
+        {
+            if (string.IsNullOrWhiteSpace(fields))
+                return null;
+
+            return fields
+                .Split(',')
+                .Select(f => f.Trim())
+                .Where(IsFieldPath)
+                .Distinct()
+                .ToList();
+        }
+
+        /// <summary>
+        /// Top level names of <paramref name="fields"/>, e.g. to skip building unrequested sections.
+        /// Names are compared ordinally, like the property lookups of <see cref="Project"/>.
+        /// </summary>
+        public static HashSet<string> GetSections(IEnumerable<string> fields)
+        {
+            return new HashSet<string>(
+                fields.Select(f => f.Split('.')[0]),
+                StringComparer.Ordinal
+            );
+        }
+
+        /// <summary>
+        /// Serializes <paramref name="source"/> and copies the requested fields into a new object.
+        /// Fields that do not exist are left out.
+        /// </summary>
+        public static JObject Project(object source, IList<string> fields)
+        {
+            var serializer = JsonSerializer.Create(ResponseBuilder.JsonSettings);
+            var full = JObject.FromObject(source, serializer);
+            if (fields == null)
+                return full;
+
+            var result = new JObject();
+            foreach (var field in fields)
+            {
+                var parts = field.Split('.');
+                var token = Walk(full, parts);
+                if (token == null)
+                    continue;
+
+                var target = result;
+                for (int i = 0; i < parts.Length - 1; i++)
+                {
+                    if (!(target[parts[i]] is JObject child))
+                    {
+                        child = new JObject();
+                        target[parts[i]] = child;
+                    }
+                    target = child;
+                }
+                target[parts[parts.Length - 1]] = token.DeepClone();
+            }
+            return result;
+        }
+
+        // Property names are looked up directly, never parsed as a JSONPath
+        private static JToken Walk(JObject root, string[] parts)
+        {
+            JToken token = root;
+            foreach (var part in parts)
+            {
+                if (!(token is JObject obj))
+                    return null;
+                token = obj[part];
+                if (token == null)
+                    return null;
+            }
+            return token;
+        }
+
+        private static bool IsFieldPath(string field)
+        {
+            if (field.Length == 0)
+                return false;
+
+            foreach (var part in field.Split('.'))
+            {
+                if (part.Length == 0)
+                    return false;
+                foreach (char c in part)
+                {
+                    if (!char.IsLetterOrDigit(c) && c != '_')
+                        return false;
+                }
+            }
+            return true;
+        }
+    }
+}
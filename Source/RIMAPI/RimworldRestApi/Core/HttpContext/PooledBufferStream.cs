@@ -0,0 +1,142 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Write-only stream that collects a response body in fixed-size segments rented from a
+    /// process-wide pool, so serializing a large response neither builds one contiguous array
+    /// on the large object heap nor allocates fresh buffers per request.
+    /// <para>Disposing returns the segments to the pool; the stream must not be used afterwards.</para>
+    /// </summary>
+    public sealed class PooledBufferStream : Stream
+    {
+        // Below the 85 000 byte large object heap threshold
+        public const int SegmentSize = 32 * 1024;
+        private const int MaxPooledSegments = 256;
+
+        private static readonly ConcurrentBag<byte[]> _pool = new ConcurrentBag<byte[]>();
+        private static int _pooledCount;
+
+        private readonly List<byte[]> _segments = new List<byte[]>();
+        private long _length;
+
+        public override bool CanRead => false;
+        public override bool CanSeek => false;
+        public override bool CanWrite => true;
+        public override long Length => _length;
+
+        public override long Position
+        {
+            get => _length;
+            set => throw new NotSupportedException();
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            while (count > 0)
+            {
+                int index = (int)(_length / SegmentSize);
+                if (index == _segments.Count)
+                    _segments.Add(Rent());
+
+                int used = (int)(_length % SegmentSize);
+                int n = Math.Min(count, SegmentSize - used);
+                Buffer.BlockCopy(buffer, offset, _segments[index], used, n);
+                offset += n;
+                count -= n;
+                _length += n;
+            }
+        }
+
+        public void WriteTo(Stream destination)
+        {
+            long remaining = _length;
+            foreach (var segment in _segments)
+            {
+                int n = (int)Math.Min(remaining, SegmentSize);
+                destination.Write(segment, 0, n);
+                remaining -= n;
+            }
+        }
+
+        public async Task WriteToAsync(Stream destination)
+        {
+            long remaining = _length;
+            foreach (var segment in _segments)
+            {
+                int n = (int)Math.Min(remaining, SegmentSize);
+                // Stay off the game thread between segments
+                await destination.WriteAsync(segment, 0, n).ConfigureAwait(false);
+                remaining -= n;
+            }
+        }
+
+        public byte[] ToArray()
+        {
+            var result = new byte[_length];
+            long offset = 0;
+            foreach (var segment in _segments)
+            {
+                int n = (int)Math.Min(_length - offset, SegmentSize);
+                Buffer.BlockCopy(segment, 0, result, (int)offset, n);
+                offset += n;
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Decodes up to <paramref name="maxBytes"/> leading bytes, for logging.
+        /// </summary>
+        public string GetPrefix(int maxBytes)
+        {
+            if (_segments.Count == 0)
+                return string.Empty;
+            int n = (int)Math.Min(_length, Math.Min(maxBytes, SegmentSize));
+            return Encoding.UTF8.GetString(_segments[0], 0, n);
+        }
+
+        public override void Flush() { }
+
+        public override int Read(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+
+        public override void SetLength(long value) => throw new NotSupportedException();
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                foreach (var segment in _segments)
+                    Return(segment);
+                _segments.Clear();
+                _length = 0;
+            }
+            base.Dispose(disposing);
+        }
+
+        private static byte[] Rent()
+        {
+            if (_pool.TryTake(out var segment))
+            {
+                Interlocked.Decrement(ref _pooledCount);
+                return segment;
+            }
+            return new byte[SegmentSize];
+        }
+
+        private static void Return(byte[] segment)
+        {
+            if (Interlocked.Increment(ref _pooledCount) <= MaxPooledSegments)
+                _pool.Add(segment);
+            else
+                Interlocked.Decrement(ref _pooledCount);
+        }
+    }
+}
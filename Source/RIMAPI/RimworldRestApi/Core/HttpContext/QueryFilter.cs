@@ -273,7 +273,7 @@ namespace RIMAPI.Core
 
         private static bool IsReservedKey(string key)
         {
-            var reserved = new[] { "format", "map_id", "token", "api_key" };
+            var reserved = new[] { "format", "map_id", "token", "api_key", "ids", "fields" };
             return reserved.Contains(key.ToLower());
         }
     }
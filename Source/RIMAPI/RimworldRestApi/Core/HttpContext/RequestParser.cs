@@ -1,5 +1,6 @@
 // RIMAPI/Http/RequestParser.cs
 using System;
+using System.Collections.Generic;
 using System.Net;
 
 namespace RIMAPI.Http
@@ -47,6 +48,33 @@ namespace RIMAPI.Http
             return result;
         }
 
+        /// <summary>
+        /// Gets a comma separated list of integers from the request query string (e.g. <c>ids=1,2,3</c>).
+        /// </summary>
+        /// <param name="context">The HTTP listener context.</param>
+        /// <param name="parameterName">The name of the parameter to retrieve.</param>
+        /// <returns>The parsed values in request order.</returns>
+        /// <exception cref="ArgumentNullException">Thrown when context or parameterName is null.</exception>
+        /// <exception cref="ParameterNotFoundException">Thrown when the parameter is missing.</exception>
+        /// <exception cref="ParameterFormatException">Thrown when an item is not an integer.</exception>
+        public static List<int> GetIntListParameter(HttpListenerContext context, string parameterName)
+        {
+            ValidateContextAndParameterName(context, parameterName);
+
+            string value = GetQueryStringValue(context, parameterName);
+            var result = new List<int>();
+            foreach (var item in value.Split(new[] { ',' }, StringSplitOptions.RemoveEmptyEntries))
+            {
+                if (!int.TryParse(item.Trim(), out int parsed))
+                {
+                    throw new ParameterFormatException(parameterName, value, typeof(List<int>));
+                }
+                result.Add(parsed);
+            }
+
+            return result;
+        }
+
         /// <summary>
         /// Gets a string parameter from the request query string.
         /// </summary>
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 using System.Net;
 using System.Text;
@@ -51,6 +52,9 @@ namespace RIMAPI.Core
         public List<string> Warnings { get; set; } = new List<string>();
         public DateTime Timestamp { get; set; } = DateTime.UtcNow;
 
+        /// <summary>Game tick of the snapshot the data was served from; absent for live reads.</summary>
+        public int? SnapshotTick { get; set; }
+
         public static ApiResult<T> Ok(T data) => new ApiResult<T> { Success = true, Data = data };
 
         public static ApiResult<T> Fail(string error) =>
@@ -93,6 +97,11 @@ namespace RIMAPI.Core
             Formatting = Formatting.None,
         };
 
+        private const int WriterBufferSize = 4096;
+        private static readonly UTF8Encoding _utf8 = new UTF8Encoding(false);
+
+        internal static JsonSerializerSettings JsonSettings => _jsonSettings;
+
         // Legacy methods for backward compatibility
         public static async Task Success(HttpListenerResponse response, object data)
         {
@@ -221,35 +230,149 @@ namespace RIMAPI.Core
                 // Set Content-Type header for JSON responses
                 response.ContentType = "application/json; charset=utf-8";
 
-                // Serialize the data to a JSON string
-                var json = JsonConvert.SerializeObject(data, _jsonSettings);
+                // Serialize the data straight into pooled UTF-8 segments
+                using (var body = SerializeToBuffer(data))
+                {
+                    // Log the response for debugging (truncate long responses)
+                    if (LogApi.IsLogging && LogApi.LoggingLevel == LoggingLevels.DEBUG)
+                    {
+                        var logJson = body.Length > 1000 ? body.GetPrefix(1000) + "..." : body.GetPrefix(1000);
+                        LogApi.Message($"Response [{statusCode}]: {logJson}", LoggingLevels.DEBUG);
+                    }
+
+                    // Write the JSON data to the response output stream, compressed if negotiated
+                    await WriteBody(response, body);
+
+                    // Log success for debugging purposes
+                    LogApi.Info($"Response sent - Status: {statusCode}, Length: {body.Length} bytes");
+                }
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"Error writing response: {ex.Message}");
+                try
+                {
+                    response.Abort();
+                }
+                catch
+                {
+                    // Ignore any errors on response abort
+                }
+            }
+        }
 
-                // Log the response for debugging (truncate long responses)
-                var logJson = json.Length > 1000 ? json.Substring(0, 1000) + "..." : json;
-                LogApi.Message($"Response [{statusCode}]: {logJson}", LoggingLevels.DEBUG);
+        /// <summary>
+        /// Writes a JSON body and closes the response, compressing it off the main thread when the
+        /// client accepts gzip or deflate and the body reaches the size threshold.
+        /// </summary>
+        private static async Task WriteBody(HttpListenerResponse response, PooledBufferStream body)
+        {
+            string encoding = ResponseCompression.SelectEncoding(response, body.Length);
+            if (encoding != null)
+            {
+                var compressed = await ResponseCompression.CompressAsync(body, encoding).ConfigureAwait(false);
+                response.Headers.Set("Content-Encoding", encoding);
+                response.ContentLength64 = compressed.Length;
+                await response.OutputStream.WriteAsync(compressed, 0, compressed.Length).ConfigureAwait(false);
+            }
+            else
+            {
+                response.ContentLength64 = body.Length;
+                await body.WriteToAsync(response.OutputStream);
+            }
+            response.Close();
+        }
 
-                // Convert the JSON string to bytes
-                var buffer = Encoding.UTF8.GetBytes(json);
-                response.ContentLength64 = buffer.Length;
+        /// <summary>
+        /// Serializes a response body with the API's JSON settings into pooled segments, without
+        /// an intermediate string or contiguous byte array. The caller disposes the result.
+        /// </summary>
+        public static PooledBufferStream SerializeToBuffer(object data)
+        {
+            var buffer = new PooledBufferStream();
+            try
+            {
+                using (var writer = new StreamWriter(buffer, _utf8, WriterBufferSize, true))
+                {
+                    var jsonWriter = new JsonTextWriter(writer);
+                    JsonSerializer.Create(_jsonSettings).Serialize(jsonWriter, data);
+                    jsonWriter.Flush();
+                }
+                return buffer;
+            }
+            catch
+            {
+                buffer.Dispose();
+                throw;
+            }
+        }
 
-                // Write the JSON data to the response output stream
-                await response.OutputStream.WriteAsync(buffer, 0, buffer.Length);
-                response.Close();
+        /// <summary>
+        /// Serializes a response body with the API's JSON settings.
+        /// </summary>
+        public static byte[] SerializeToBytes(object data)
+        {
+            using (var buffer = SerializeToBuffer(data))
+            {
+                return buffer.ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Sends an already encoded JSON body, e.g. from the response cache. <paramref name="encoding"/>
+        /// names the compression already applied to <paramref name="body"/>, if any.
+        /// </summary>
+        public static async Task SendEncodedJson(
+            HttpListenerResponse response,
+            byte[] body,
+            string etag = null,
+            HttpStatusCode statusCode = HttpStatusCode.OK,
+            string encoding = null
+        )
+        {
+            try
+            {
+                response.StatusCode = (int)statusCode;
+                response.ContentType = "application/json; charset=utf-8";
+                if (etag != null)
+                    response.Headers.Set("ETag", etag);
+                if (encoding != null)
+                    response.Headers.Set("Content-Encoding", encoding);
+                response.ContentLength64 = body.Length;
 
-                // Log success for debugging purposes
-                LogApi.Info($"Response sent - Status: {statusCode}, Length: {buffer.Length} bytes");
+                await response.OutputStream.WriteAsync(body, 0, body.Length);
+                response.Close();
             }
             catch (Exception ex)
             {
-                LogApi.Error($"Error writing response: {ex.Message}");
+                LogApi.Error($"Error sending encoded JSON: {ex.Message}");
                 try
                 {
                     response.Abort();
                 }
-                catch
+                catch { }
+            }
+        }
+
+        /// <summary>
+        /// Answers a conditional request whose <c>If-None-Match</c> matched with an empty 304.
+        /// </summary>
+        public static void SendNotModified(HttpListenerResponse response, string etag)
+        {
+            try
+            {
+                response.StatusCode = (int)HttpStatusCode.NotModified;
+                response.Headers.Set("ETag", etag);
+                response.Close();
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"Error sending 304: {ex.Message}");
+                try
                 {
-                    // Ignore any errors on response abort
+                    response.Abort();
                 }
+                catch { }
             }
         }
 
@@ -265,11 +388,14 @@ namespace RIMAPI.Core
                 response.StatusCode = (int)statusCode;
                 response.ContentType = "application/json; charset=utf-8";
 
-                var buffer = Encoding.UTF8.GetBytes(json);
-                response.ContentLength64 = buffer.Length;
-
-                await response.OutputStream.WriteAsync(buffer, 0, buffer.Length);
-                response.Close();
+                using (var body = new PooledBufferStream())
+                {
+                    using (var writer = new StreamWriter(body, _utf8, WriterBufferSize, true))
+                    {
+                        writer.Write(json);
+                    }
+                    await WriteBody(response, body);
+                }
             }
             catch (Exception ex)
             {
@@ -320,7 +446,15 @@ namespace RIMAPI.Core
             ApiResult<T> result
         )
         {
-            // Apply generic filtering if success and query parameters are present
+            context.ApplyQueryFilters(result);
+            await ResponseBuilder.SendApiResult(context.Response, result);
+        }
+
+        /// <summary>
+        /// Applies generic filtering if the result succeeded and query parameters are present.
+        /// </summary>
+        public static void ApplyQueryFilters<T>(this HttpListenerContext context, ApiResult<T> result)
+        {
             if (result.Success && result.Data != null && context.Request.QueryString.Count > 0)
             {
                 try
@@ -333,7 +467,6 @@ namespace RIMAPI.Core
                     result.Warnings.Add($"Filtering failed: {ex.Message}");
                 }
             }
-            await ResponseBuilder.SendApiResult(context.Response, result);
         }
 
         public static async Task SendJsonResponse(
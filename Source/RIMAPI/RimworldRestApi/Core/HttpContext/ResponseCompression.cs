@@ -0,0 +1,130 @@
+using System;
+using System.Globalization;
+using System.IO;
+using System.IO.Compression;
+using System.Net;
+using System.Runtime.CompilerServices;
+using System.Threading.Tasks;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// <c>Accept-Encoding</c> negotiation for JSON responses.
+    /// <para>The listener records the encoding a request accepts with <see cref="Negotiate"/> as it
+    /// arrives; <see cref="ResponseBuilder"/> later compresses bodies of at least
+    /// <see cref="RIMAPI_Settings.CompressionMinBytes"/> with it on a worker thread.</para>
+    /// </summary>
+    public static class ResponseCompression
+    {
+        public const string Gzip = "gzip";
+        public const string Deflate = "deflate";
+
+        // Keyed by the response because ResponseBuilder only ever sees the response
+        private static readonly ConditionalWeakTable<HttpListenerResponse, string> _accepted =
+            new ConditionalWeakTable<HttpListenerResponse, string>();
+
+        /// <summary>
+        /// Records the preferred encoding from the request's <c>Accept-Encoding</c>, if any.
+        /// </summary>
+        public static void Negotiate(HttpListenerContext context)
+        {
+            string encoding = ParseAcceptEncoding(context.Request.Headers["Accept-Encoding"]);
+            if (encoding != null)
+                _accepted.Add(context.Response, encoding);
+        }
+
+        /// <summary>
+        /// Returns the encoding to send a body of <paramref name="length"/> bytes with, or null to send
+        /// it as is. Adds <c>Vary: Accept-Encoding</c> whenever the body is large enough to be compressed.
+        /// </summary>
+        public static string SelectEncoding(HttpListenerResponse response, long length)
+        {
+            var settings = RIMAPI_Mod.Settings;
+            if (settings == null || !settings.EnableCompression || length < settings.CompressionMinBytes)
+                return null;
+
+            response.Headers.Set("Vary", "Accept-Encoding");
+            return _accepted.TryGetValue(response, out var encoding) ? encoding : null;
+        }
+
+        public static byte[] Compress(byte[] data, string encoding)
+        {
+            return Compress(data.Length, encoding, stream => stream.Write(data, 0, data.Length));
+        }
+
+        public static byte[] Compress(PooledBufferStream body, string encoding)
+        {
+            return Compress(body.Length, encoding, body.WriteTo);
+        }
+
+        /// <summary>
+        /// Compresses on the thread pool so large bodies do not stall the game thread.
+        /// </summary>
+        public static Task<byte[]> CompressAsync(byte[] data, string encoding)
+        {
+            return Task.Run(() => Compress(data, encoding));
+        }
+
+        /// <inheritdoc cref="CompressAsync(byte[], string)"/>
+        public static Task<byte[]> CompressAsync(PooledBufferStream body, string encoding)
+        {
+            return Task.Run(() => Compress(body, encoding));
+        }
+
+        private static byte[] Compress(long length, string encoding, Action<Stream> writeBody)
+        {
+            using (var output = new MemoryStream((int)(length / 4) + 64))
+            {
+                // DeflateStream writes raw deflate without the zlib header; browsers and
+                // urllib3 accept both forms for "deflate"
+                using (Stream compressor = encoding == Gzip
+                    ? (Stream)new GZipStream(output, CompressionLevel.Fastest, true)
+                    : new DeflateStream(output, CompressionLevel.Fastest, true))
+                {
+                    writeBody(compressor);
+                }
+                return output.ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Picks gzip or deflate from an <c>Accept-Encoding</c> value by q-value, preferring gzip on ties.
+        /// </summary>
+        internal static string ParseAcceptEncoding(string header)
+        {
+            if (string.IsNullOrEmpty(header))
+                return null;
+
+            double gzip = -1, deflate = -1, wildcard = -1;
+            foreach (var part in header.Split(','))
+            {
+                string[] tokens = part.Split(';');
+                string coding = tokens[0].Trim().ToLowerInvariant();
+                double q = 1;
+                for (int i = 1; i < tokens.Length; i++)
+                {
+                    string param = tokens[i].Trim();
+                    if (param.StartsWith("q=", StringComparison.OrdinalIgnoreCase)
+                        && !double.TryParse(param.Substring(2), NumberStyles.Float, CultureInfo.InvariantCulture, out q))
+                        q = 0;
+                }
+
+                if (coding == Gzip || coding == "x-gzip")
+                    gzip = Math.Max(gzip, q);
+                else if (coding == Deflate)
+                    deflate = q;
+                else if (coding == "*")
+                    wildcard = q;
+            }
+
+            if (gzip < 0)
+                gzip = wildcard;
+            if (deflate < 0)
+                deflate = wildcard;
+
+            if (gzip <= 0 && deflate <= 0)
+                return null;
+            return gzip >= deflate ? Gzip : Deflate;
+        }
+    }
+}
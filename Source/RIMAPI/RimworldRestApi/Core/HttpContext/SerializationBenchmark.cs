@@ -0,0 +1,113 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using Newtonsoft.Json;
+using RIMAPI.Models;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Compares the previous response serialization (JSON string, then a UTF-8 byte array) with
+    /// <see cref="ResponseBuilder.SerializeToBuffer"/> on a synthetic <see cref="ThingDto"/> list
+    /// shaped like a late-game <c>/api/v1/map/things</c> response.
+    /// <para>Both write to <see cref="Stream.Null"/>. <c>peak_heap_bytes</c> is the managed heap
+    /// growth while the serialized body is held, an approximation of the copies alive at once.</para>
+    /// </summary>
+    public static class SerializationBenchmark
+    {
+        private const int Rounds = 5;
+
+        private delegate long SerializeRun(object payload, long baseline, ref long peak);
+
+        public static SerializationBenchmarkDto Run(int items)
+        {
+            var payload = ApiResult<List<ThingDto>>.Ok(BuildThings(items));
+
+            var rows = new List<SerializationBenchmarkRowDto>
+            {
+                Measure("string", payload, SerializeString),
+                Measure("pooled_stream", payload, SerializePooled),
+            };
+            return new SerializationBenchmarkDto { Items = items, Rounds = Rounds, Rows = rows };
+        }
+
+        private static SerializationBenchmarkRowDto Measure(string method, object payload, SerializeRun run)
+        {
+            // Warm up JIT and the segment pool
+            long ignored = 0;
+            run(payload, 0, ref ignored);
+
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            long baseline = GC.GetTotalMemory(true);
+            int gen0 = GC.CollectionCount(0);
+            int gen1 = GC.CollectionCount(1);
+            int gen2 = GC.CollectionCount(2);
+
+            long peak = 0;
+            long bytes = 0;
+            var stopwatch = Stopwatch.StartNew();
+            for (int i = 0; i < Rounds; i++)
+                bytes = run(payload, baseline, ref peak);
+            stopwatch.Stop();
+
+            return new SerializationBenchmarkRowDto
+            {
+                Method = method,
+                PayloadBytes = bytes,
+                AvgMs = stopwatch.Elapsed.TotalMilliseconds / Rounds,
+                PeakHeapBytes = peak,
+                Gen0Collections = GC.CollectionCount(0) - gen0,
+                Gen1Collections = GC.CollectionCount(1) - gen1,
+                Gen2Collections = GC.CollectionCount(2) - gen2,
+            };
+        }
+
+        private static long SerializeString(object payload, long baseline, ref long peak)
+        {
+            string json = JsonConvert.SerializeObject(payload, ResponseBuilder.JsonSettings);
+            byte[] body = Encoding.UTF8.GetBytes(json);
+            peak = Math.Max(peak, GC.GetTotalMemory(false) - baseline);
+            Stream.Null.Write(body, 0, body.Length);
+            return body.Length;
+        }
+
+        private static long SerializePooled(object payload, long baseline, ref long peak)
+        {
+            using (var body = ResponseBuilder.SerializeToBuffer(payload))
+            {
+                peak = Math.Max(peak, GC.GetTotalMemory(false) - baseline);
+                body.WriteTo(Stream.Null);
+                return body.Length;
+            }
+        }
+
+        private static List<ThingDto> BuildThings(int count)
+        {
+            string[] defs = { "Steel", "WoodLog", "MealSimple", "Component", "Plant_Potato", "ChunkGranite" };
+            var things = new List<ThingDto>(count);
+            for (int i = 0; i < count; i++)
+            {
+                string def = defs[i % defs.Length];
+                things.Add(new ThingDto
+                {
+                    ThingId = 10000 + i,
+                    DefName = def,
+                    Label = def.ToLowerInvariant() + " x" + (i % 75 + 1),
+                    Categories = new List<string> { "Items", "Resources" },
+                    Position = new PositionDto { X = i % 250, Y = 0, Z = i / 250 % 250 },
+                    Size = new PositionDto { X = 1, Y = 0, Z = 1 },
+                    StackCount = i % 75 + 1,
+                    MarketValue = 1.9 * (i % 75 + 1),
+                    Quality = -1,
+                    HitPoints = 100,
+                    MaxHitPoints = 100,
+                    Description = "Synthetic benchmark item with a description of typical length for a resource.",
+                });
+            }
+            return things;
+        }
+    }
+}
@@ -2,14 +2,23 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Net;
-using System.Text.RegularExpressions;
 using System.Threading.Tasks;
 
 namespace RIMAPI.Core
 {
+    /// <summary>
+    /// Dispatches requests to route handlers. Static routes are looked up by method and exact
+    /// path in a dictionary; routes with <c>{param}</c> or <c>:param</c> segments are matched by
+    /// walking a segment trie per method. Paths are matched case-insensitively and a static route
+    /// wins over a parameterized one for the same path.
+    /// </summary>
     public class Router
     {
+        private static readonly Dictionary<string, string> NoParameters = new Dictionary<string, string>();
+
         private readonly List<Route> _routes;
+        private readonly Dictionary<string, Dictionary<string, Route>> _staticRoutes;
+        private readonly Dictionary<string, RouteNode> _routeTries;
         private readonly HashSet<string> _allowedOrigins;
 
         // Store route parameters per request
@@ -21,19 +30,25 @@ namespace RIMAPI.Core
         public Router()
         {
             _routes = new List<Route>();
+            _staticRoutes = new Dictionary<string, Dictionary<string, Route>>(StringComparer.OrdinalIgnoreCase);
+            _routeTries = new Dictionary<string, RouteNode>(StringComparer.OrdinalIgnoreCase);
             _allowedOrigins = null;
             _routeParameters = new Dictionary<HttpListenerContext, Dictionary<string, string>>();
         }
 
         public void AddRoute(string method, string path, Func<HttpListenerContext, Task> handler)
         {
-            _routes.Add(new Route(method, path, handler));
+            var route = new Route(method, path, handler);
+            _routes.Add(route);
+            IndexRoute(route);
             LogApi.Message($"Add route: {path}", LoggingLevels.DEBUG);
         }
 
         public void ClearRoutes()
         {
             _routes.Clear();
+            _staticRoutes.Clear();
+            _routeTries.Clear();
             LogApi.Message("All routes cleared");
         }
 
@@ -78,34 +93,115 @@ namespace RIMAPI.Core
             await HandleNoRouteFound(context, method, path); // Fixed: added await
         }
 
-        private RouteMatch FindMatchingRoute(string method, string path)
+        /// <summary>
+        /// Returns the registered pattern that handles <paramref name="path"/>, or null.
+        /// </summary>
+        public string FindRoutePattern(string method, string path)
+        {
+            return FindMatchingRoute(method, NormalizePath(path))?.Route.PathPattern;
+        }
+
+        private void IndexRoute(Route route)
         {
-            foreach (var route in _routes)
+            if (route.ParameterCount == 0)
+            {
+                if (!_staticRoutes.TryGetValue(route.Method, out var paths))
+                {
+                    paths = new Dictionary<string, Route>(StringComparer.OrdinalIgnoreCase);
+                    _staticRoutes[route.Method] = paths;
+                }
+
+                // The first registration of a path wins, as with the previous linear scan
+                if (!paths.ContainsKey(route.PathPattern))
+                    paths[route.PathPattern] = route;
+                return;
+            }
+
+            if (!_routeTries.TryGetValue(route.Method, out var node))
             {
-                if (route.Method != method)
-                    continue;
+                node = new RouteNode();
+                _routeTries[route.Method] = node;
+            }
 
-                var match = route.Pattern.Match(path);
-                if (match.Success)
+            foreach (var segment in route.Segments)
+            {
+                if (segment.IsParameter)
                 {
-                    // Extract route parameters
-                    var parameters = new Dictionary<string, string>();
-                    foreach (var groupName in route.Pattern.GetGroupNames())
+                    node.Parameter = node.Parameter ?? new RouteNode();
+                    node = node.Parameter;
+                }
+                else
+                {
+                    if (node.Literals == null)
+                        node.Literals = new Dictionary<string, RouteNode>(StringComparer.OrdinalIgnoreCase);
+                    if (!node.Literals.TryGetValue(segment.Text, out var next))
                     {
-                        if (groupName.StartsWith("param_") && match.Groups[groupName].Success)
-                        {
-                            var paramName = groupName.Substring(6); // Remove "param_" prefix
-                            parameters[paramName] = match.Groups[groupName].Value;
-                        }
+                        next = new RouteNode();
+                        node.Literals[segment.Text] = next;
                     }
-
-                    return new RouteMatch(route, parameters);
+                    node = next;
                 }
             }
 
+            if (node.Route == null)
+                node.Route = route;
+        }
+
+        private RouteMatch FindMatchingRoute(string method, string path)
+        {
+            if (
+                _staticRoutes.TryGetValue(method, out var paths)
+                && paths.TryGetValue(path, out var staticRoute)
+            )
+                return new RouteMatch(staticRoute, NoParameters);
+
+            if (!_routeTries.TryGetValue(method, out var root))
+                return null;
+
+            var segments = SplitPath(path);
+            var values = new string[segments.Length];
+            var route = MatchSegments(root, segments, 0, values);
+            if (route == null)
+                return null;
+
+            var parameters = new Dictionary<string, string>(route.ParameterCount);
+            for (int i = 0; i < route.Segments.Length; i++)
+            {
+                if (route.Segments[i].IsParameter)
+                    parameters[route.Segments[i].Text] = values[i];
+            }
+            return new RouteMatch(route, parameters);
+        }
+
+        private static Route MatchSegments(RouteNode node, string[] segments, int index, string[] values)
+        {
+            if (index == segments.Length)
+                return node.Route;
+
+            string segment = segments[index];
+
+            // Literal segments take precedence; fall back to the parameter branch if they dead-end
+            if (node.Literals != null && node.Literals.TryGetValue(segment, out var literal))
+            {
+                var route = MatchSegments(literal, segments, index + 1, values);
+                if (route != null)
+                    return route;
+            }
+
+            if (node.Parameter != null && segment.Length > 0)
+            {
+                values[index] = segment;
+                return MatchSegments(node.Parameter, segments, index + 1, values);
+            }
+
             return null;
         }
 
+        private static string[] SplitPath(string path)
+        {
+            return path.Substring(1).Split('/');
+        }
+
         /// <summary>
         /// Detects if an exception was caused by the client closing the connection.
         /// </summary>
@@ -131,9 +227,12 @@ namespace RIMAPI.Core
             try
             {
                 // Store route parameters for this request
-                lock (_routeParameters)
+                if (routeMatch.Parameters.Count > 0)
                 {
-                    _routeParameters[context] = routeMatch.Parameters;
+                    lock (_routeParameters)
+                    {
+                        _routeParameters[context] = routeMatch.Parameters;
+                    }
                 }
 
                 await route.Handler(context);
@@ -180,9 +279,12 @@ namespace RIMAPI.Core
             finally
             {
                 // Clean up route parameters
-                lock (_routeParameters)
+                if (routeMatch.Parameters.Count > 0)
                 {
-                    _routeParameters.Remove(context);
+                    lock (_routeParameters)
+                    {
+                        _routeParameters.Remove(context);
+                    }
                 }
             }
         }
@@ -247,31 +349,45 @@ namespace RIMAPI.Core
         private class Route
         {
             public string Method { get; }
-            public Regex Pattern { get; }
             public string PathPattern { get; }
+            public RouteSegment[] Segments { get; }
+            public int ParameterCount { get; }
             public Func<HttpListenerContext, Task> Handler { get; }
 
             public Route(string method, string path, Func<HttpListenerContext, Task> handler)
             {
                 Method = method;
-                PathPattern = path;
+                PathPattern = NormalizePath(path.StartsWith("/") ? path : "/" + path);
                 Handler = handler;
 
-                // Convert route pattern to regex with named groups
-                // Supports both {param} and :param syntax
-                var regexPattern =
-                    "^"
-                    + Regex
-                        .Escape(path)
-                        .Replace("\\{", "(?<param_")
-                        .Replace("\\}", ">[^/]+)")
-                        .Replace("\\:", "(?<param_")
-                    + "$";
-
-                Pattern = new Regex(regexPattern, RegexOptions.IgnoreCase | RegexOptions.Compiled);
+                // Supports both {param} and :param segments
+                Segments = SplitPath(PathPattern).Select(RouteSegment.Parse).ToArray();
+                ParameterCount = Segments.Count(s => s.IsParameter);
             }
         }
 
+        private struct RouteSegment
+        {
+            public string Text;
+            public bool IsParameter;
+
+            public static RouteSegment Parse(string segment)
+            {
+                if (segment.Length > 2 && segment[0] == '{' && segment[segment.Length - 1] == '}')
+                    return new RouteSegment { Text = segment.Substring(1, segment.Length - 2), IsParameter = true };
+                if (segment.Length > 1 && segment[0] == ':')
+                    return new RouteSegment { Text = segment.Substring(1), IsParameter = true };
+                return new RouteSegment { Text = segment };
+            }
+        }
+
+        private class RouteNode
+        {
+            public Dictionary<string, RouteNode> Literals;
+            public RouteNode Parameter;
+            public Route Route;
+        }
+
         private class RouteMatch
         {
             public Route Route { get; }
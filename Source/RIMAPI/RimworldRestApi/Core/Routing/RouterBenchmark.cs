@@ -0,0 +1,125 @@
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text.RegularExpressions;
+using RIMAPI.Models;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Compares <see cref="Router"/> lookups against the previous linear scan over one compiled
+    /// regex per route, using a request path for every registered route plus a few unknown paths.
+    /// </summary>
+    public static class RouterBenchmark
+    {
+        private static readonly string[] MissPaths =
+        {
+            "/api/v1/does/not/exist",
+            "/api/v2/colonists/unknown",
+            "/favicon.ico",
+        };
+
+        public static RouterBenchmarkDto Run(Router router, int iterations)
+        {
+            var routes = router.GetRegisteredRoutes().ToList();
+            var legacy = routes.Select(r => new LegacyRoute(r.Method, r.Path)).ToList();
+
+            var requests = routes
+                .Select(r => (Method: r.Method, Path: SamplePath(r.Path)))
+                .Concat(MissPaths.Select(p => (Method: "GET", Path: p)))
+                .ToList();
+
+            // Both lookups must agree before timing means anything
+            var mismatches = new List<string>();
+            foreach (var (method, path) in requests)
+            {
+                string indexed = router.FindRoutePattern(method, path);
+                string linear = MatchLinear(legacy, method, path);
+                if (indexed != linear && mismatches.Count < 20)
+                    mismatches.Add($"{method} {path}: indexed={indexed ?? "none"}, linear={linear ?? "none"}");
+            }
+
+            var stopwatch = Stopwatch.StartNew();
+            for (int i = 0; i < iterations; i++)
+            {
+                foreach (var (method, path) in requests)
+                    router.FindRoutePattern(method, path);
+            }
+            double indexedNs = stopwatch.Elapsed.TotalMilliseconds * 1e6 / (iterations * requests.Count);
+
+            stopwatch.Restart();
+            for (int i = 0; i < iterations; i++)
+            {
+                foreach (var (method, path) in requests)
+                    MatchLinear(legacy, method, path);
+            }
+            double linearNs = stopwatch.Elapsed.TotalMilliseconds * 1e6 / (iterations * requests.Count);
+
+            return new RouterBenchmarkDto
+            {
+                Routes = routes.Count,
+                ParameterizedRoutes = routes.Count(r => r.Path.Contains("{") || r.Path.Contains("/:")),
+                Paths = requests.Count,
+                Iterations = iterations,
+                IndexedNsPerLookup = indexedNs,
+                LinearRegexNsPerLookup = linearNs,
+                Speedup = indexedNs > 0 ? linearNs / indexedNs : 0,
+                Mismatches = mismatches,
+            };
+        }
+
+        private static string SamplePath(string pattern)
+        {
+            var segments = pattern.Split('/');
+            for (int i = 0; i < segments.Length; i++)
+            {
+                if (segments[i].StartsWith("{") || segments[i].StartsWith(":"))
+                    segments[i] = "sample" + i;
+            }
+            return string.Join("/", segments);
+        }
+
+        // The lookup the router used before: first route whose regex matches, then the
+        // parameters read back through GetGroupNames
+        private static string MatchLinear(List<LegacyRoute> routes, string method, string path)
+        {
+            foreach (var route in routes)
+            {
+                if (route.Method != method)
+                    continue;
+
+                var match = route.Pattern.Match(path);
+                if (!match.Success)
+                    continue;
+
+                var parameters = new Dictionary<string, string>();
+                foreach (var groupName in route.Pattern.GetGroupNames())
+                {
+                    if (groupName.StartsWith("param_") && match.Groups[groupName].Success)
+                        parameters[groupName.Substring(6)] = match.Groups[groupName].Value;
+                }
+                return route.Path;
+            }
+            return null;
+        }
+
+        private class LegacyRoute
+        {
+            public readonly string Method;
+            public readonly string Path;
+            public readonly Regex Pattern;
+
+            public LegacyRoute(string method, string path)
+            {
+                Method = method;
+                Path = path;
+                var segments = path.Split('/').Select(s =>
+                    s.StartsWith("{") && s.EndsWith("}") ? $"(?<param_{s.Substring(1, s.Length - 2)}>[^/]+)"
+                    : s.StartsWith(":") ? $"(?<param_{s.Substring(1)}>[^/]+)"
+                    : Regex.Escape(s)
+                );
+                Pattern = new Regex("^" + string.Join("/", segments) + "$", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+            }
+        }
+    }
+}
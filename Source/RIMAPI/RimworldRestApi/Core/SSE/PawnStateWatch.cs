@@ -0,0 +1,225 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using RIMAPI.Helpers;
+using Verse;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Per-connection pawn watch built from the <c>watch_pawns</c>, <c>watch_fields</c>,
+    /// <c>health_threshold</c> and <c>position_threshold</c> query parameters of /api/v1/events.
+    /// <para>Once per game tick the watched values are compared with the ones last sent to the
+    /// client, and the pawns that changed beyond the thresholds are returned for a single
+    /// <c>pawn_state_changed</c> event. The first check after connecting, and the first one
+    /// after an event was dropped (see <see cref="Resync"/>), reports every pawn.
+    /// Main thread only.</para>
+    /// </summary>
+    public class PawnStateWatch
+    {
+        public const string EventType = "pawn_state_changed";
+        public const int MaxPawns = 500;
+
+        public const string FieldHealth = "health";
+        public const string FieldDowned = "downed";
+        public const string FieldDead = "dead";
+        public const string FieldPosition = "position";
+        public const string FieldJob = "job";
+
+        private static readonly string[] AllFields = { FieldHealth, FieldDowned, FieldDead, FieldPosition, FieldJob };
+
+        // Pawns that could not be found are looked up again at this interval, since the
+        // lookup falls back to scanning map and world pawns
+        private const int MissingRetryTicks = 60;
+
+        private readonly Dictionary<int, WatchedPawn> _pawns = new Dictionary<int, WatchedPawn>();
+        private readonly HashSet<string> _fields;
+
+        public IReadOnlyCollection<int> PawnIds { get; }
+        public IReadOnlyCollection<string> Fields { get; }
+        public float HealthThreshold { get; }
+        public int PositionThreshold { get; }
+
+        private PawnStateWatch(List<int> pawnIds, List<string> fields, float healthThreshold, int positionThreshold)
+        {
+            PawnIds = pawnIds;
+            Fields = fields;
+            HealthThreshold = healthThreshold;
+            PositionThreshold = positionThreshold;
+            _fields = new HashSet<string>(fields, StringComparer.Ordinal);
+            foreach (int id in pawnIds)
+                _pawns[id] = new WatchedPawn { Id = id };
+        }
+
+        /// <summary>
+        /// Parses the watch parameters. Returns null when no pawn IDs are given.
+        /// Unknown fields and IDs that are not integers are ignored, and at most
+        /// <see cref="MaxPawns"/> pawns are watched.
+        /// </summary>
+        public static PawnStateWatch Parse(string pawns, string fields, string healthThreshold, string positionThreshold)
+        {
+            if (string.IsNullOrWhiteSpace(pawns))
+                return null;
+
+            var pawnIds = new List<int>();
+            foreach (var item in pawns.Split(','))
+            {
+                if (int.TryParse(item.Trim(), out int id) && !pawnIds.Contains(id))
+                    pawnIds.Add(id);
+                if (pawnIds.Count >= MaxPawns)
+                    break;
+            }
+            if (pawnIds.Count == 0)
+                return null;
+
+            var fieldList = string.IsNullOrWhiteSpace(fields)
+                ? AllFields.ToList()
+                : AllFields.Where(f => fields.Split(',').Any(v => v.Trim().Equals(f, StringComparison.OrdinalIgnoreCase))).ToList();
+            if (fieldList.Count == 0)
+                fieldList = AllFields.ToList();
+
+            if (!float.TryParse(healthThreshold, System.Globalization.NumberStyles.Float,
+                    System.Globalization.CultureInfo.InvariantCulture, out float health))
+                health = 0.01f;
+            if (!int.TryParse(positionThreshold, out int position))
+                position = 1;
+
+            return new PawnStateWatch(pawnIds, fieldList, Math.Max(0f, Math.Min(health, 1f)), Math.Max(1, position));
+        }
+
+        /// <summary>
+        /// Compares the current state of every watched pawn with the last sent one.
+        /// Returns the changed pawns, or null when nothing changed.
+        /// </summary>
+        public List<Dictionary<string, object>> Collect(int tick)
+        {
+            List<Dictionary<string, object>> changes = null;
+            foreach (var watched in _pawns.Values)
+            {
+                var change = Check(watched, tick);
+                if (change == null)
+                    continue;
+                if (changes == null)
+                    changes = new List<Dictionary<string, object>>();
+                changes.Add(change);
+            }
+            return changes;
+        }
+
+        /// <summary>
+        /// Forgets what was sent, so the next check reports the full state of every pawn again.
+        /// Used when a <c>pawn_state_changed</c> event was dropped from the client's queue.
+        /// </summary>
+        public void Resync()
+        {
+            foreach (var watched in _pawns.Values)
+                watched.Sent = false;
+        }
+
+        private Dictionary<string, object> Check(WatchedPawn watched, int tick)
+        {
+            // The pawn object outlives spawning, despawning and death, so it is looked up once
+            if (watched.Pawn == null)
+            {
+                if (watched.Sent && tick - watched.LookupTick < MissingRetryTicks)
+                    return null;
+
+                watched.LookupTick = tick;
+                watched.Pawn = PawnHelper.FindPawnById(watched.Id);
+                if (watched.Pawn == null)
+                {
+                    if (watched.Sent && watched.Missing)
+                        return null;
+                    watched.Sent = true;
+                    watched.Missing = true;
+                    return new Dictionary<string, object> { ["id"] = watched.Id, ["missing"] = true };
+                }
+            }
+
+            var pawn = watched.Pawn;
+            var changed = new List<string>();
+            bool initial = !watched.Sent || watched.Missing;
+
+            float health = 0f;
+            if (_fields.Contains(FieldHealth))
+            {
+                health = pawn.health?.summaryHealth?.SummaryHealthPercent ?? 1f;
+                if (initial || Math.Abs(health - watched.Health) >= HealthThreshold && health != watched.Health)
+                    changed.Add(FieldHealth);
+            }
+
+            bool downed = false;
+            if (_fields.Contains(FieldDowned))
+            {
+                downed = pawn.Downed;
+                if (initial || downed != watched.Downed)
+                    changed.Add(FieldDowned);
+            }
+
+            bool dead = false;
+            if (_fields.Contains(FieldDead))
+            {
+                dead = pawn.Dead;
+                if (initial || dead != watched.Dead)
+                    changed.Add(FieldDead);
+            }
+
+            IntVec3 position = IntVec3.Invalid;
+            if (_fields.Contains(FieldPosition))
+            {
+                position = pawn.PositionHeld;
+                if (initial
+                    || Math.Max(Math.Abs(position.x - watched.Position.x), Math.Abs(position.z - watched.Position.z)) >= PositionThreshold
+                    || position.IsValid != watched.Position.IsValid)
+                    changed.Add(FieldPosition);
+            }
+
+            string job = null;
+            if (_fields.Contains(FieldJob))
+            {
+                job = pawn.CurJobDef?.defName;
+                if (initial || job != watched.Job)
+                    changed.Add(FieldJob);
+            }
+
+            if (changed.Count == 0)
+                return null;
+
+            // Only the reported values become the new baseline, so slow drifts below the
+            // threshold still add up to a change
+            if (changed.Contains(FieldHealth)) watched.Health = health;
+            if (changed.Contains(FieldPosition)) watched.Position = position;
+            watched.Downed = downed;
+            watched.Dead = dead;
+            watched.Job = job;
+            watched.Sent = true;
+            watched.Missing = false;
+
+            // Unwatched fields are left out; a pawn without a job reports "job": null
+            var state = new Dictionary<string, object> { ["id"] = watched.Id, ["changed"] = changed };
+            if (_fields.Contains(FieldHealth)) state[FieldHealth] = watched.Health;
+            if (_fields.Contains(FieldDowned)) state[FieldDowned] = downed;
+            if (_fields.Contains(FieldDead)) state[FieldDead] = dead;
+            if (_fields.Contains(FieldPosition))
+                state[FieldPosition] = watched.Position.IsValid
+                    ? new { x = watched.Position.x, y = watched.Position.y, z = watched.Position.z }
+                    : null;
+            if (_fields.Contains(FieldJob)) state[FieldJob] = job;
+            return state;
+        }
+
+        private class WatchedPawn
+        {
+            public int Id;
+            public Pawn Pawn;
+            public int LookupTick;
+            public bool Sent;
+            public bool Missing;
+            public float Health;
+            public bool Downed;
+            public bool Dead;
+            public IntVec3 Position = IntVec3.Invalid;
+            public string Job;
+        }
+    }
+}
@@ -0,0 +1,91 @@
+using System;
+using System.Collections.Generic;
+using System.Text.RegularExpressions;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Per-connection event type filter built from the <c>types</c> query parameter
+    /// of /api/v1/events, e.g. <c>?types=colonist_ate,make_recipe_*</c>.
+    /// Supports exact names and glob patterns (<c>*</c> and <c>?</c>).
+    /// </summary>
+    public class SseEventFilter
+    {
+        private readonly HashSet<string> _exactTypes = new HashSet<string>(StringComparer.Ordinal);
+        private readonly List<Regex> _patterns = new List<Regex>();
+
+        // Event types are a small fixed set, so glob results are cached per type
+        private readonly Dictionary<string, bool> _decisions = new Dictionary<string, bool>(StringComparer.Ordinal);
+        private readonly object _decisionsLock = new object();
+
+        public IReadOnlyCollection<string> Types { get; }
+
+        private SseEventFilter(List<string> types)
+        {
+            Types = types;
+            foreach (var type in types)
+            {
+                if (type.IndexOf('*') >= 0 || type.IndexOf('?') >= 0)
+                    _patterns.Add(GlobToRegex(type));
+                else
+                    _exactTypes.Add(type);
+            }
+        }
+
+        /// <summary>
+        /// Parses a comma separated list of event types or glob patterns.
+        /// Returns null (no filtering) for an empty value or a bare <c>*</c>.
+        /// </summary>
+        public static SseEventFilter Parse(string value)
+        {
+            if (string.IsNullOrWhiteSpace(value))
+                return null;
+
+            var types = new List<string>();
+            foreach (var part in value.Split(','))
+            {
+                var type = part.Trim();
+                if (type.Length == 0)
+                    continue;
+                if (type == "*")
+                    return null;
+                types.Add(type);
+            }
+
+            return types.Count == 0 ? null : new SseEventFilter(types);
+        }
+
+        public bool Accepts(string eventType)
+        {
+            if (_exactTypes.Contains(eventType))
+                return true;
+            if (_patterns.Count == 0)
+                return false;
+
+            lock (_decisionsLock)
+            {
+                if (_decisions.TryGetValue(eventType, out bool accepted))
+                    return accepted;
+
+                accepted = false;
+                foreach (var pattern in _patterns)
+                {
+                    if (pattern.IsMatch(eventType))
+                    {
+                        accepted = true;
+                        break;
+                    }
+                }
+
+                _decisions[eventType] = accepted;
+                return accepted;
+            }
+        }
+
+        private static Regex GlobToRegex(string glob)
+        {
+            string pattern = "^" + Regex.Escape(glob).Replace("\\*", ".*").Replace("\\?", ".") + "$";
+            return new Regex(pattern, RegexOptions.CultureInvariant);
+        }
+    }
+}
@@ -0,0 +1,72 @@
+using System.Collections.Generic;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Bounded ring buffer of the most recent broadcast frames, used to replay
+    /// missed events to clients that reconnect with <c>Last-Event-ID</c>.
+    /// </summary>
+    public class SseEventLog
+    {
+        private readonly SseFrame[] _frames;
+        private readonly object _lock = new object();
+        private int _start;
+        private int _count;
+
+        public SseEventLog(int capacity)
+        {
+            _frames = new SseFrame[capacity];
+        }
+
+        public int Capacity => _frames.Length;
+
+        public int Count
+        {
+            get { lock (_lock) return _count; }
+        }
+
+        public void Append(SseFrame frame)
+        {
+            if (_frames.Length == 0)
+                return;
+
+            lock (_lock)
+            {
+                int index = (_start + _count) % _frames.Length;
+                _frames[index] = frame;
+                if (_count < _frames.Length)
+                    _count++;
+                else
+                    _start = (_start + 1) % _frames.Length;
+            }
+        }
+
+        /// <summary>
+        /// Collects every logged frame with an id greater than <paramref name="lastEventId"/>.
+        /// Returns false if events between that id and <paramref name="currentId"/> are no longer
+        /// (or were never) in the log, i.e. the replay is incomplete.
+        /// </summary>
+        public bool TryGetSince(long lastEventId, long currentId, List<SseFrame> result)
+        {
+            if (lastEventId >= currentId)
+                return true;
+
+            lock (_lock)
+            {
+                // Events were sent since lastEventId, but the log is disabled or empty
+                if (_count == 0)
+                    return false;
+
+                long oldestId = _frames[_start].Id;
+                for (int i = 0; i < _count; i++)
+                {
+                    var frame = _frames[(_start + i) % _frames.Length];
+                    if (frame.Id > lastEventId)
+                        result.Add(frame);
+                }
+
+                return lastEventId >= oldestId - 1;
+            }
+        }
+    }
+}
@@ -0,0 +1,117 @@
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using Newtonsoft.Json;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// A fully encoded text/event-stream frame. Built once per event and written
+    /// as-is to every subscriber, so the payload is never serialized per client.
+    /// </summary>
+    public sealed class SseFrame
+    {
+        private static readonly JsonSerializerSettings SerializerSettings = new JsonSerializerSettings
+        {
+            NullValueHandling = NullValueHandling.Ignore,
+            Formatting = Formatting.None,
+        };
+
+        private static readonly byte[] BatchSeparator = Encoding.UTF8.GetBytes(",");
+        private static readonly byte[] BatchItemEnd = Encoding.UTF8.GetBytes("}");
+        private static readonly byte[] BatchEnd = Encoding.UTF8.GetBytes("]\n\n");
+        private static readonly byte[] JsonNull = Encoding.UTF8.GetBytes("null");
+
+        /// <summary>SSE comment line used to keep idle connections open.</summary>
+        public static readonly SseFrame KeepAlive = new SseFrame(0, null, null, Encoding.UTF8.GetBytes(": keep-alive\n\n"), 0, 0);
+
+        /// <summary>Event log sequence number, or 0 for frames outside the log.</summary>
+        public long Id { get; }
+        /// <summary>The <c>id:</c> sent to clients, <c>{epoch}-{Id}</c>; null for frames outside the log.</summary>
+        public string WireId { get; }
+        public string EventType { get; }
+        public byte[] Bytes { get; }
+
+        // Location of the JSON payload inside Bytes, so batches can reuse it without re-serializing
+        private readonly int _dataOffset;
+        private readonly int _dataLength;
+        private byte[] _batchItemPrefix;
+
+        private SseFrame(long id, string wireId, string eventType, byte[] bytes, int dataOffset, int dataLength)
+        {
+            Id = id;
+            WireId = wireId;
+            EventType = eventType;
+            Bytes = bytes;
+            _dataOffset = dataOffset;
+            _dataLength = dataLength;
+        }
+
+        /// <summary>
+        /// Encodes an event. Logged events (<paramref name="id"/> above 0) are sent with the id
+        /// <c>{epoch}-{id}</c>, so ids of a previous server session are never mistaken for current ones.
+        /// </summary>
+        public static SseFrame Create(string eventType, object data, long id = 0, string epoch = null)
+        {
+            string json = data is string s ? s : JsonConvert.SerializeObject(data, SerializerSettings);
+            string wireId = id > 0 ? FormatId(epoch, id) : null;
+            string prefix = wireId != null
+                ? $"id: {wireId}\nevent: {eventType}\ndata: "
+                : $"event: {eventType}\ndata: ";
+
+            int prefixLength = Encoding.UTF8.GetByteCount(prefix);
+            int dataLength = Encoding.UTF8.GetByteCount(json);
+            var bytes = new byte[prefixLength + dataLength + 2];
+            Encoding.UTF8.GetBytes(prefix, 0, prefix.Length, bytes, 0);
+            Encoding.UTF8.GetBytes(json, 0, json.Length, bytes, prefixLength);
+            bytes[bytes.Length - 2] = (byte)'\n';
+            bytes[bytes.Length - 1] = (byte)'\n';
+
+            return new SseFrame(id, wireId, eventType, bytes, prefixLength, dataLength);
+        }
+
+        public static string FormatId(string epoch, long id)
+        {
+            return string.IsNullOrEmpty(epoch) ? id.ToString() : epoch + "-" + id;
+        }
+
+        /// <summary>
+        /// Encodes several logged frames as one <c>batch</c> event whose data is a JSON array of
+        /// <c>{"id", "event", "data"}</c> objects. The frame id is the id of the last item.
+        /// </summary>
+        public static byte[] EncodeBatch(IReadOnlyList<SseFrame> frames)
+        {
+            var last = frames[frames.Count - 1];
+            using (var stream = new MemoryStream())
+            {
+                var header = Encoding.UTF8.GetBytes($"id: {last.WireId}\nevent: batch\ndata: [");
+                stream.Write(header, 0, header.Length);
+
+                for (int i = 0; i < frames.Count; i++)
+                {
+                    if (i > 0)
+                        stream.Write(BatchSeparator, 0, BatchSeparator.Length);
+
+                    var frame = frames[i];
+                    var itemPrefix = frame.GetBatchItemPrefix();
+                    stream.Write(itemPrefix, 0, itemPrefix.Length);
+                    if (frame._dataLength > 0)
+                        stream.Write(frame.Bytes, frame._dataOffset, frame._dataLength);
+                    else
+                        stream.Write(JsonNull, 0, JsonNull.Length);
+                    stream.Write(BatchItemEnd, 0, BatchItemEnd.Length);
+                }
+
+                stream.Write(BatchEnd, 0, BatchEnd.Length);
+                return stream.ToArray();
+            }
+        }
+
+        private byte[] GetBatchItemPrefix()
+        {
+            // Built on first use by a batching client; a racing rebuild produces the same bytes
+            return _batchItemPrefix ?? (_batchItemPrefix = Encoding.UTF8.GetBytes(
+                $"{{\"id\":{JsonConvert.ToString(WireId)},\"event\":{JsonConvert.ToString(EventType)},\"data\":"));
+        }
+    }
+}
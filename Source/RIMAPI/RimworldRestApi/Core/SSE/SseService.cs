@@ -1,9 +1,11 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.IO;
 using System.Net;
+using System.Threading;
 using System.Threading.Tasks; // Required for Task
-using Newtonsoft.Json;
+using RIMAPI.Http;
 using RIMAPI.Services;
 using Verse;
 
@@ -12,6 +14,7 @@ namespace RIMAPI.Core
     public class SseService : IDisposable
     {
         private readonly IGameStateService _gameStateService;
+        private readonly RIMAPI_Settings _settings;
         private readonly List<SseClient> _connectedClients;
         private readonly object _clientsLock = new object();
         private bool _disposed = false;
@@ -21,13 +24,43 @@ namespace RIMAPI.Core
         private readonly HashSet<string> _registeredEventTypes;
         private readonly object _eventsLock = new object();
 
+        // Delivered regardless of the client's ?types= filter
+        private static readonly HashSet<string> AlwaysDeliveredTypes = new HashSet<string> { "connected", "error" };
+        // Upper bound for ?batch_ms=
+        private const int MaxBatchMs = 5000;
+
         public int ClientCount => _connectedClients.Count;
-        public long TotalEventsSent { get; private set; }
+        public long TotalEventsSent => Interlocked.Read(ref _framesSent);
         private DateTime _lastHeartbeatTime = DateTime.UtcNow;
 
-        public SseService(IGameStateService gameStateService)
+        // Broadcast cost counters, see GetStatistics()
+        private readonly Stopwatch _tickStopwatch = new Stopwatch();
+        private long _eventsBroadcast;
+        private long _framesEncoded;
+        private long _framesSent;
+        private long _bytesSent;
+        private long _framesDropped;
+        private long _clientsEvicted;
+        private int _nextClientId;
+
+        // Replay log for clients reconnecting with Last-Event-ID
+        private readonly SseEventLog _eventLog;
+        private long _lastEventId;
+        // Event ids restart with every server session; the epoch tells the sessions apart
+        private readonly string _epoch = Guid.NewGuid().ToString("N").Substring(0, 8);
+        private long _busyTicks;
+        private double _totalTickMs;
+        private double _lastTickMs;
+        private double _maxTickMs;
+
+        // Game tick of the last pawn watch comparison, so it runs once per tick rather than per frame
+        private int _lastWatchTick = -1;
+
+        public SseService(IGameStateService gameStateService, RIMAPI_Settings settings)
         {
             _gameStateService = gameStateService;
+            _settings = settings;
+            _eventLog = new SseEventLog(Math.Max(0, settings.SseReplayBufferSize));
             _connectedClients = new List<SseClient>();
             _broadcastQueue = new Queue<SseEvent>();
             _registeredEventTypes = new HashSet<string>();
@@ -43,6 +76,7 @@ namespace RIMAPI.Core
                 _registeredEventTypes.Add("gameState");
                 _registeredEventTypes.Add("gameUpdate");
                 _registeredEventTypes.Add("heartbeat");
+                _registeredEventTypes.Add(PawnStateWatch.EventType);
                 _registeredEventTypes.Add("error");
             }
         }
@@ -79,7 +113,17 @@ namespace RIMAPI.Core
             }
 
             var response = context.Response;
-            var client = new SseClient(response);
+            var client = new SseClient(this, response, Interlocked.Increment(ref _nextClientId))
+            {
+                RemoteEndPoint = context.Request.RemoteEndPoint?.ToString(),
+                Filter = SseEventFilter.Parse(RequestParser.GetStringParameter(context, "types", false)),
+                BatchMs = GetBatchMs(context),
+                Watch = PawnStateWatch.Parse(
+                    RequestParser.GetStringParameter(context, "watch_pawns", false),
+                    RequestParser.GetStringParameter(context, "watch_fields", false),
+                    RequestParser.GetStringParameter(context, "health_threshold", false),
+                    RequestParser.GetStringParameter(context, "position_threshold", false)),
+            };
 
             try
             {
@@ -98,23 +142,55 @@ namespace RIMAPI.Core
 
                 LogApi.Info($"[SSE] Connection established. Total clients: {_connectedClients.Count}");
 
-                // 3. Send Initial Events
+                // 3. Send Initial Events, then whatever the client missed since its Last-Event-ID
+                string lastEventId = GetLastEventId(context);
+                long currentId = Interlocked.Read(ref _lastEventId);
+                var missed = new List<SseFrame>();
+                bool replayComplete = true;
+                if (lastEventId != null)
+                {
+                    // An id of another session (or a future one) cannot be resumed from
+                    long? since = ParseEventId(lastEventId);
+                    replayComplete = since.HasValue && since.Value <= currentId
+                        && _eventLog.TryGetSince(since.Value, currentId, missed);
+                }
+
                 SendEventToClient(client, "connected", new
                 {
                     message = "SSE connection established",
                     timestamp = DateTime.UtcNow,
                     registeredEvents = GetRegisteredEventTypes(),
+                    types = client.Filter?.Types,
+                    batchMs = client.BatchMs,
+                    watch = client.Watch == null ? null : new
+                    {
+                        pawns = client.Watch.PawnIds,
+                        fields = client.Watch.Fields,
+                        healthThreshold = client.Watch.HealthThreshold,
+                        positionThreshold = client.Watch.PositionThreshold,
+                    },
+                    lastEventId = SseFrame.FormatId(_epoch, currentId),
+                    replay = lastEventId != null
+                        ? new { from = lastEventId, events = missed.Count, complete = replayComplete }
+                        : null,
                 });
 
+                foreach (var frame in missed)
+                {
+                    if (client.Accepts(frame.EventType))
+                        client.Enqueue(frame, int.MaxValue, false);
+                }
+
                 var gameStateResult = _gameStateService.GetGameState();
                 if (gameStateResult.Success)
                     SendEventToClient(client, "gameState", gameStateResult.Data);
                 else
                     SendEventToClient(client, "error", new { message = "Failed to get initial game state", errors = gameStateResult.Errors });
 
-                // 4. CRITICAL: Wait here until the client disconnects.
-                // This keeps the HttpListenerContext alive.
-                await client.WaitForDisconnect();
+                // 4. CRITICAL: Drain the client's queue until it disconnects.
+                // This keeps the HttpListenerContext alive. The writer runs on the
+                // thread pool so socket writes never happen on the game thread.
+                await Task.Run(client.RunWriterAsync).ConfigureAwait(false);
             }
             catch (Exception ex)
             {
@@ -138,21 +214,53 @@ namespace RIMAPI.Core
 
             lock (_queueLock)
             {
-                _broadcastQueue.Enqueue(new SseEvent { Type = eventType, Data = data });
+                _broadcastQueue.Enqueue(new SseEvent { Type = eventType, Data = data, Replay = true });
+            }
+        }
+
+        /// <summary>
+        /// Broadcasts a synthetic load-test event. It gets an id like any other event, so it is
+        /// batched the same way, but it is not written to the replay log.
+        /// </summary>
+        public void BroadcastTestEvent(string eventType, object data)
+        {
+            if (_disposed) return;
+
+            lock (_queueLock)
+            {
+                _broadcastQueue.Enqueue(new SseEvent { Type = eventType, Data = data, Replay = false });
             }
         }
 
         public void ProcessTick()
         {
             if (_disposed) return;
-            ProcessBroadcastQueue();
+
+            _tickStopwatch.Restart();
+            int processed = ProcessBroadcastQueue();
+            processed += ProcessPawnWatches();
             // CheckClientConnections(); // Removed: Redundant now that we handle lifetime via async/await
-            SendHeartbeatsIfNeeded();
+            if (SendHeartbeatsIfNeeded())
+                processed++;
+            _tickStopwatch.Stop();
+
+            if (processed > 0)
+                RecordTick(processed, _tickStopwatch.Elapsed.TotalMilliseconds);
+        }
+
+        private void RecordTick(int eventsProcessed, double elapsedMs)
+        {
+            _eventsBroadcast += eventsProcessed;
+            _busyTicks++;
+            _totalTickMs += elapsedMs;
+            _lastTickMs = elapsedMs;
+            if (elapsedMs > _maxTickMs)
+                _maxTickMs = elapsedMs;
         }
 
-        private void ProcessBroadcastQueue()
+        private int ProcessBroadcastQueue()
         {
-            if (_broadcastQueue.Count == 0) return;
+            if (_broadcastQueue.Count == 0) return 0;
 
             List<SseEvent> eventsToProcess;
             lock (_queueLock)
@@ -163,20 +271,81 @@ namespace RIMAPI.Core
 
             foreach (var sseEvent in eventsToProcess)
             {
-                BroadcastEventInternal(sseEvent.Type, sseEvent.Data);
+                BroadcastEventInternal(sseEvent.Type, sseEvent.Data, logged: true, replay: sseEvent.Replay);
+            }
+            return eventsToProcess.Count;
+        }
+
+        /// <summary>
+        /// Sends each watching client one <c>pawn_state_changed</c> event with the pawns whose
+        /// watched values changed since the last game tick. The event goes to that client only
+        /// and is neither logged for replay nor subject to its <c>?types=</c> filter.
+        /// </summary>
+        private int ProcessPawnWatches()
+        {
+            if (Current.Game == null) return 0;
+
+            int tick = Find.TickManager.TicksGame;
+            // Nothing changes while paused, except for the first snapshot of new clients
+            bool newTick = tick != _lastWatchTick;
+            _lastWatchTick = tick;
+
+            List<SseClient> watchingClients = null;
+            lock (_clientsLock)
+            {
+                foreach (var client in _connectedClients)
+                {
+                    if (client.Watch == null || !client.IsConnected
+                        || !newTick && client.WatchStarted && !client.WatchResyncPending)
+                        continue;
+                    if (watchingClients == null)
+                        watchingClients = new List<SseClient>();
+                    watchingClients.Add(client);
+                }
+            }
+            if (watchingClients == null) return 0;
+
+            int sent = 0;
+            foreach (var client in watchingClients)
+            {
+                client.WatchStarted = true;
+                List<Dictionary<string, object>> pawns;
+                try
+                {
+                    // Deltas after a dropped event would leave the client with stale values
+                    if (client.WatchResyncPending)
+                    {
+                        client.WatchResyncPending = false;
+                        client.Watch.Resync();
+                    }
+                    pawns = client.Watch.Collect(tick);
+                }
+                catch (Exception ex)
+                {
+                    LogApi.Error($"[SSE] Pawn watch of client #{client.Id} failed - {ex.Message}");
+                    continue;
+                }
+                if (pawns == null) continue;
+
+                var frame = EncodeFrame(PawnStateWatch.EventType, new { tick, pawns });
+                if (frame == null) continue;
+                SendFrameToClient(client, frame);
+                sent++;
             }
+            return sent;
         }
 
-        private void SendHeartbeatsIfNeeded()
+        private bool SendHeartbeatsIfNeeded()
         {
-            if ((DateTime.UtcNow - _lastHeartbeatTime).TotalSeconds < 3) return;
+            if ((DateTime.UtcNow - _lastHeartbeatTime).TotalSeconds < 3) return false;
 
             int currentTick = Current.Game != null ? Find.TickManager.TicksGame : 0;
-            BroadcastEventInternal("heartbeat", new { timestamp = DateTime.UtcNow, tick = currentTick });
+            BroadcastEventInternal("heartbeat", new { timestamp = DateTime.UtcNow, tick = currentTick }, logged: false);
             _lastHeartbeatTime = DateTime.UtcNow;
+            return true;
         }
 
-        private void BroadcastEventInternal(string eventType, object data)
+        private void BroadcastEventInternal(string eventType, object data, bool logged, bool replay = true)
         {
             List<SseClient> currentClients;
             lock (_clientsLock)
@@ -184,6 +353,19 @@ namespace RIMAPI.Core
                 currentClients = new List<SseClient>(_connectedClients);
             }
 
+            // Logged events get an id; replayable ones are encoded up front so they can be
+            // replayed later. Otherwise the frame is encoded lazily: nothing is serialized if
+            // every client filters the event out.
+            long id = logged ? Interlocked.Increment(ref _lastEventId) : 0;
+            SseFrame frame = null;
+            if (logged && replay && _eventLog.Capacity > 0)
+            {
+                frame = EncodeFrame(eventType, data, id);
+                if (frame == null)
+                    return;
+                _eventLog.Append(frame);
+            }
+
             foreach (var client in currentClients)
             {
                 // If client is dead, just signal it (the awaiter in HandleSSEConnection will wake up)
@@ -192,43 +374,123 @@ namespace RIMAPI.Core
                     client.SignalDisconnect();
                     continue;
                 }
-                SendEventToClient(client, eventType, data);
+
+                if (client.Accepts(eventType))
+                {
+                    if (frame == null && (frame = EncodeFrame(eventType, data, id)) == null)
+                        return;
+                    SendFrameToClient(client, frame);
+                }
+                else if (eventType == "heartbeat")
+                {
+                    SendKeepAliveToClient(client);
+                }
+            }
+        }
+
+        private SseFrame EncodeFrame(string eventType, object data, long id = 0)
+        {
+            try
+            {
+                var frame = SseFrame.Create(eventType, data, id, _epoch);
+                _framesEncoded++;
+                return frame;
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"[SSE] Failed to serialize '{eventType}' event - {ex.Message}");
+                return null;
             }
         }
 
         private void SendEventToClient(SseClient client, string eventType, object data)
         {
             if (client == null || !client.IsConnected) return;
+            if (!client.Accepts(eventType)) return;
 
-            try
-            {
-                string json = data is string s ? s : JsonConvert.SerializeObject(data, new JsonSerializerSettings
-                {
-                    NullValueHandling = NullValueHandling.Ignore,
-                    Formatting = Formatting.None,
-                });
+            var frame = EncodeFrame(eventType, data);
+            if (frame != null)
+                SendFrameToClient(client, frame);
+        }
 
-                string message = $"event: {eventType}\ndata: {json}\n\n";
-                var buffer = System.Text.Encoding.UTF8.GetBytes(message);
+        /// <summary>
+        /// Reads the standard <c>Last-Event-ID</c> header, or the <c>last_event_id</c> query
+        /// parameter for clients that cannot set headers.
+        /// </summary>
+        private static string GetLastEventId(HttpListenerContext context)
+        {
+            string value = context.Request.Headers["Last-Event-ID"]
+                ?? RequestParser.GetStringParameter(context, "last_event_id", false);
+            return string.IsNullOrWhiteSpace(value) ? null : value.Trim();
+        }
 
-                lock (client.SendLock)
-                {
-                    if (!client.IsConnected) return;
-                    client.Response.OutputStream.Write(buffer, 0, buffer.Length);
-                    client.Response.OutputStream.Flush();
+        /// <summary>
+        /// Sequence number of an <c>{epoch}-{id}</c> event id of this session; null for ids of
+        /// another session and malformed ids.
+        /// </summary>
+        private long? ParseEventId(string value)
+        {
+            int separator = value.LastIndexOf('-');
+            if (separator <= 0 || value.Substring(0, separator) != _epoch)
+                return null;
+            if (long.TryParse(value.Substring(separator + 1), out long id) && id >= 0)
+                return id;
+            return null;
+        }
 
-                    TotalEventsSent++;
-                }
-                client.UpdateLastActivity();
+        /// <summary>
+        /// Batch window requested with <c>?batch_ms=</c>; 0 sends every event as its own frame.
+        /// </summary>
+        private static int GetBatchMs(HttpListenerContext context)
+        {
+            if (!int.TryParse(RequestParser.GetStringParameter(context, "batch_ms", false), out int batchMs))
+                return 0;
+            return Math.Max(0, Math.Min(batchMs, MaxBatchMs));
+        }
+
+        private void SendFrameToClient(SseClient client, SseFrame frame)
+        {
+            EnqueueToClient(client, frame);
+        }
+
+        /// <summary>
+        /// Clients that filtered out heartbeats still get an SSE comment line, so idle
+        /// connections are kept open and dead sockets are still detected.
+        /// </summary>
+        private void SendKeepAliveToClient(SseClient client)
+        {
+            EnqueueToClient(client, SseFrame.KeepAlive);
+        }
+
+        /// <summary>
+        /// Only queues the frame; the client's writer task does the socket I/O.
+        /// A full queue either drops the oldest frame or evicts the client,
+        /// depending on <see cref="RIMAPI_Settings.SseDisconnectSlowClients"/>.
+        /// </summary>
+        private void EnqueueToClient(SseClient client, SseFrame frame)
+        {
+            int capacity = Math.Max(1, _settings.SseClientQueueSize);
+            bool disconnectWhenFull = _settings.SseDisconnectSlowClients;
+
+            var result = client.Enqueue(frame, capacity, disconnectWhenFull);
+            if (result == SseEnqueueResult.Dropped)
+            {
+                Interlocked.Increment(ref _framesDropped);
             }
-            catch
+            else if (result == SseEnqueueResult.Overflow)
             {
-                // If write fails, signal disconnect. 
-                // This wakes up HandleSSEConnection, which triggers RemoveClient in finally block.
-                client.SignalDisconnect();
+                Interlocked.Increment(ref _clientsEvicted);
+                LogApi.Warning($"[SSE] Client #{client.Id} ({client.RemoteEndPoint}) disconnected: outbound queue full ({capacity} events)");
+                client.Evict();
             }
         }
 
+        private void RecordSent(int frames, long bytes)
+        {
+            Interlocked.Add(ref _framesSent, frames);
+            Interlocked.Add(ref _bytesSent, bytes);
+        }
+
         private void RemoveClient(SseClient client)
         {
             if (client == null) return;
@@ -256,11 +518,43 @@ namespace RIMAPI.Core
                 _connectedClients.Clear();
             }
 
+            // Abort instead of Close: closing a stalled connection blocks on the socket
             foreach (var client in clientsToDispose)
             {
-                client.SignalDisconnect();
-                try { client.Response.Close(); } catch { }
+                client.Evict();
+            }
+        }
+
+        public SseStatistics GetStatistics()
+        {
+            var clients = new List<SseClientStatistics>();
+            lock (_clientsLock)
+            {
+                foreach (var client in _connectedClients)
+                    clients.Add(client.GetStatistics());
             }
+
+            return new SseStatistics
+            {
+                ConnectedClients = clients.Count,
+                QueueCapacity = _settings.SseClientQueueSize,
+                SlowClientPolicy = _settings.SseDisconnectSlowClients ? "disconnect" : "drop_oldest",
+                LastEventId = Interlocked.Read(ref _lastEventId),
+                ReplayBufferSize = _eventLog.Capacity,
+                ReplayBufferCount = _eventLog.Count,
+                EventsBroadcast = _eventsBroadcast,
+                FramesEncoded = _framesEncoded,
+                FramesSent = TotalEventsSent,
+                FramesDropped = Interlocked.Read(ref _framesDropped),
+                ClientsEvicted = Interlocked.Read(ref _clientsEvicted),
+                BytesSent = Interlocked.Read(ref _bytesSent),
+                BusyTicks = _busyTicks,
+                TotalTickMs = _totalTickMs,
+                AvgTickMs = _busyTicks > 0 ? _totalTickMs / _busyTicks : 0,
+                LastTickMs = _lastTickMs,
+                MaxTickMs = _maxTickMs,
+                Clients = clients,
+            };
         }
 
         public IReadOnlyList<string> GetRegisteredEventTypes()
@@ -272,41 +566,268 @@ namespace RIMAPI.Core
         {
             public string Type { get; set; }
             public object Data { get; set; }
+            public bool Replay { get; set; }
+        }
+
+        private enum SseEnqueueResult
+        {
+            Queued,
+            Dropped,
+            Overflow,
+            Closed,
         }
 
-        // --- UPDATED SseClient with Async Support ---
+        /// <summary>
+        /// One subscriber. The game thread only appends to its bounded outbox; the
+        /// writer task started by HandleSSEConnection drains it to the socket.
+        /// </summary>
         private class SseClient
         {
+            private readonly SseService _owner;
+            private readonly Queue<SseFrame> _outbox = new Queue<SseFrame>();
+            private readonly object _outboxLock = new object();
+            private readonly SemaphoreSlim _signal = new SemaphoreSlim(0);
+            private bool _signalPending;
+            private long _sent;
+            private long _dropped;
+            private long _bytesSent;
+            private long _writes;
+
+            public int Id { get; }
+            public string RemoteEndPoint { get; set; }
             public HttpListenerResponse Response { get; }
             public bool IsConnected { get; private set; }
+            public DateTime ConnectedAt { get; }
             public DateTime LastActivity { get; private set; }
-            public object SendLock { get; } = new object();
-
-            // This allows HandleSSEConnection to "await" the disconnection
-            private readonly TaskCompletionSource<bool> _disconnectTcs = new TaskCompletionSource<bool>();
-
-            public SseClient(HttpListenerResponse response)
+            public SseEventFilter Filter { get; set; }
+            public int BatchMs { get; set; }
+            public PawnStateWatch Watch { get; set; }
+            // Set once the initial pawn_state_changed snapshot was collected; main thread only
+            public bool WatchStarted { get; set; }
+            // Set when a pawn_state_changed frame was dropped from the outbox, so the next
+            // watch check sends the full state again; frames are only dropped on the main thread
+            public bool WatchResyncPending { get; set; }
+
+            public SseClient(SseService owner, HttpListenerResponse response, int id)
             {
+                _owner = owner;
                 Response = response;
+                Id = id;
                 IsConnected = true;
-                LastActivity = DateTime.UtcNow;
+                ConnectedAt = DateTime.UtcNow;
+                LastActivity = ConnectedAt;
             }
 
-            public Task WaitForDisconnect()
+            public SseEnqueueResult Enqueue(SseFrame frame, int capacity, bool disconnectWhenFull)
             {
-                return _disconnectTcs.Task;
+                var result = SseEnqueueResult.Queued;
+                lock (_outboxLock)
+                {
+                    if (!IsConnected)
+                        return SseEnqueueResult.Closed;
+
+                    if (_outbox.Count >= capacity)
+                    {
+                        if (disconnectWhenFull)
+                            return SseEnqueueResult.Overflow;
+
+                        var dropped = _outbox.Dequeue();
+                        if (dropped.EventType == PawnStateWatch.EventType)
+                            WatchResyncPending = true;
+                        _dropped++;
+                        result = SseEnqueueResult.Dropped;
+                    }
+
+                    _outbox.Enqueue(frame);
+                    if (_signalPending)
+                        return result;
+                    _signalPending = true;
+                }
+
+                _signal.Release();
+                return result;
+            }
+
+            public async Task RunWriterAsync()
+            {
+                var stream = Response.OutputStream;
+                var frames = new List<SseFrame>();
+                var pendingBatch = new List<SseFrame>();
+
+                try
+                {
+                    while (IsConnected)
+                    {
+                        await _signal.WaitAsync().ConfigureAwait(false);
+
+                        // Batching clients collect everything that arrives within the window
+                        if (BatchMs > 0)
+                            await Task.Delay(BatchMs).ConfigureAwait(false);
+
+                        lock (_outboxLock)
+                        {
+                            frames.AddRange(_outbox);
+                            _outbox.Clear();
+                            _signalPending = false;
+                        }
+
+                        if (frames.Count == 0)
+                            continue;
+
+                        long bytes = 0;
+                        int writes = 0;
+                        foreach (var frame in frames)
+                        {
+                            // Only logged events are batched; connection, heartbeat and keep-alive
+                            // frames go out as they are, after whatever was batched before them.
+                            if (BatchMs > 0 && frame.Id > 0)
+                            {
+                                pendingBatch.Add(frame);
+                                continue;
+                            }
+
+                            if (pendingBatch.Count > 0)
+                            {
+                                bytes += await WriteAsync(stream, SseFrame.EncodeBatch(pendingBatch)).ConfigureAwait(false);
+                                writes++;
+                                pendingBatch.Clear();
+                            }
+
+                            bytes += await WriteAsync(stream, frame.Bytes).ConfigureAwait(false);
+                            writes++;
+                        }
+
+                        if (pendingBatch.Count > 0)
+                        {
+                            bytes += await WriteAsync(stream, SseFrame.EncodeBatch(pendingBatch)).ConfigureAwait(false);
+                            writes++;
+                            pendingBatch.Clear();
+                        }
+                        await stream.FlushAsync().ConfigureAwait(false);
+
+                        lock (_outboxLock)
+                        {
+                            _sent += frames.Count;
+                            _bytesSent += bytes;
+                            _writes += writes;
+                        }
+                        _owner.RecordSent(frames.Count, bytes);
+                        LastActivity = DateTime.UtcNow;
+                        frames.Clear();
+                    }
+                }
+                catch
+                {
+                    // Write failed: the client went away. HandleSSEConnection removes it.
+                }
+                finally
+                {
+                    SignalDisconnect();
+                }
+            }
+
+            private static async Task<int> WriteAsync(Stream stream, byte[] buffer)
+            {
+                await stream.WriteAsync(buffer, 0, buffer.Length).ConfigureAwait(false);
+                return buffer.Length;
             }
 
             public void SignalDisconnect()
             {
-                IsConnected = false;
-                _disconnectTcs.TrySetResult(true);
+                lock (_outboxLock)
+                {
+                    if (!IsConnected)
+                        return;
+                    IsConnected = false;
+                    _outbox.Clear();
+                }
+                // Wake the writer so it can exit
+                _signal.Release();
+            }
+
+            /// <summary>
+            /// Disconnects a client whose writer may be stuck in a socket write.
+            /// Aborting closes the connection, which fails the pending write.
+            /// </summary>
+            public void Evict()
+            {
+                SignalDisconnect();
+                ThreadPool.QueueUserWorkItem(_ =>
+                {
+                    try { Response.Abort(); } catch { }
+                });
+            }
+
+            public bool Accepts(string eventType)
+            {
+                return Filter == null
+                    || AlwaysDeliveredTypes.Contains(eventType)
+                    || Filter.Accepts(eventType);
             }
 
-            public void UpdateLastActivity()
+            public SseClientStatistics GetStatistics()
             {
-                LastActivity = DateTime.UtcNow;
+                lock (_outboxLock)
+                {
+                    return new SseClientStatistics
+                    {
+                        Id = Id,
+                        RemoteEndPoint = RemoteEndPoint,
+                        ConnectedAt = ConnectedAt,
+                        LastActivity = LastActivity,
+                        Types = Filter?.Types,
+                        BatchMs = BatchMs,
+                        WatchedPawns = Watch?.PawnIds.Count ?? 0,
+                        Queued = _outbox.Count,
+                        Sent = _sent,
+                        Dropped = _dropped,
+                        BytesSent = _bytesSent,
+                        Writes = _writes,
+                    };
+                }
             }
         }
     }
-}
\ No newline at end of file
+
+    /// <summary>
+    /// SSE broadcast counters. Tick timings cover ProcessTick calls that had at
+    /// least one event to send; counters are cumulative since startup.
+    /// </summary>
+    public class SseStatistics
+    {
+        public int ConnectedClients { get; set; }
+        public int QueueCapacity { get; set; }
+        public string SlowClientPolicy { get; set; }
+        public long LastEventId { get; set; }
+        public int ReplayBufferSize { get; set; }
+        public int ReplayBufferCount { get; set; }
+        public long EventsBroadcast { get; set; }
+        public long FramesEncoded { get; set; }
+        public long FramesSent { get; set; }
+        public long FramesDropped { get; set; }
+        public long ClientsEvicted { get; set; }
+        public long BytesSent { get; set; }
+        public long BusyTicks { get; set; }
+        public double TotalTickMs { get; set; }
+        public double AvgTickMs { get; set; }
+        public double LastTickMs { get; set; }
+        public double MaxTickMs { get; set; }
+        public List<SseClientStatistics> Clients { get; set; }
+    }
+
+    public class SseClientStatistics
+    {
+        public int Id { get; set; }
+        public string RemoteEndPoint { get; set; }
+        public DateTime ConnectedAt { get; set; }
+        public DateTime LastActivity { get; set; }
+        public IReadOnlyCollection<string> Types { get; set; }
+        public int BatchMs { get; set; }
+        public int WatchedPawns { get; set; }
+        public int Queued { get; set; }
+        public long Sent { get; set; }
+        public long Dropped { get; set; }
+        public long BytesSent { get; set; }
+        public long Writes { get; set; }
+    }
+}
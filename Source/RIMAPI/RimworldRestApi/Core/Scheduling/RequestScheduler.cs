@@ -0,0 +1,377 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Net;
+using System.Threading.Tasks;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Dispatch order of queued requests. Lower values are served first.
+    /// </summary>
+    public enum RequestPriority
+    {
+        /// <summary>State-changing requests (any method other than GET/HEAD), e.g. /pawn/edit/* and /game/speed.</summary>
+        Control = 0,
+
+        /// <summary>Reads that are cheap on the main thread.</summary>
+        Interactive = 1,
+
+        /// <summary>Reads whose learned main-thread cost is above <see cref="RequestScheduler.BulkCostMs"/>.</summary>
+        Bulk = 2,
+    }
+
+    /// <summary>
+    /// Queues incoming requests by priority class and dispatches them on the main thread
+    /// within a per-frame time budget (<see cref="RIMAPI_Settings.RequestFrameBudgetMs"/>).
+    /// <para>The cost of a route is the synchronous part of its handler - everything up to
+    /// the first await that leaves the main thread - learned as a moving average per
+    /// method and path. A request that would overrun the remaining budget waits for the
+    /// next frame, but every frame dispatches at least one request.</para>
+    /// </summary>
+    public class RequestScheduler
+    {
+        public const double BulkCostMs = 2.0;
+        private const double DefaultCostMs = 0.5;
+        private const double CostSmoothing = 0.2;
+        private const int MaxTrackedRoutes = 512;
+        private const int WaitSampleSize = 1024;
+        private const int PriorityCount = 3;
+
+        private readonly RIMAPI_Settings _settings;
+        private readonly object _lock = new object();
+        private readonly Queue<QueuedRequest>[] _queues = new Queue<QueuedRequest>[PriorityCount];
+        private readonly ClassMetrics[] _metrics = new ClassMetrics[PriorityCount];
+        private readonly Dictionary<string, RouteCost> _routeCosts = new Dictionary<string, RouteCost>();
+
+        private long _busyFrames;
+        private long _overBudgetFrames;
+        private double _totalFrameMs;
+        private double _lastFrameMs;
+        private double _maxFrameMs;
+        private int _lastFrameDispatched;
+
+        public RequestScheduler(RIMAPI_Settings settings)
+        {
+            _settings = settings;
+            for (int i = 0; i < PriorityCount; i++)
+            {
+                _queues[i] = new Queue<QueuedRequest>();
+                _metrics[i] = new ClassMetrics();
+            }
+        }
+
+        /// <summary>
+        /// Adds a request to the queue of its class. Called from the listener thread.
+        /// </summary>
+        public void Enqueue(HttpListenerContext context)
+        {
+            string routeKey = GetRouteKey(context.Request);
+            lock (_lock)
+            {
+                var priority = Classify(context.Request.HttpMethod, routeKey);
+                _queues[(int)priority].Enqueue(
+                    new QueuedRequest
+                    {
+                        Context = context,
+                        RouteKey = routeKey,
+                        EnqueuedAt = Stopwatch.GetTimestamp(),
+                    }
+                );
+                _metrics[(int)priority].Enqueued++;
+            }
+        }
+
+        /// <summary>
+        /// Dispatches queued requests until the frame budget is spent. Must run on the main thread.
+        /// </summary>
+        public void Dispatch(Func<HttpListenerContext, Task> process)
+        {
+            double budgetMs = Math.Max(0.1, _settings.RequestFrameBudgetMs);
+            long frameStart = Stopwatch.GetTimestamp();
+            int dispatched = 0;
+
+            while (true)
+            {
+                QueuedRequest request;
+                lock (_lock)
+                {
+                    long now = Stopwatch.GetTimestamp();
+                    int queue = SelectQueue(now);
+                    if (queue < 0)
+                        break;
+
+                    request = _queues[queue].Peek();
+                    double usedMs = ToMs(now - frameStart);
+                    if (dispatched > 0 && usedMs + EstimateCost(request.RouteKey) > budgetMs)
+                        break;
+
+                    _queues[queue].Dequeue();
+                    _metrics[queue].RecordWait(ToMs(now - request.EnqueuedAt));
+                }
+
+                long start = Stopwatch.GetTimestamp();
+                _ = process(request.Context);
+                double costMs = ToMs(Stopwatch.GetTimestamp() - start);
+                dispatched++;
+
+                lock (_lock)
+                {
+                    RecordCost(request.RouteKey, costMs);
+                }
+            }
+
+            if (dispatched == 0)
+                return;
+
+            double frameMs = ToMs(Stopwatch.GetTimestamp() - frameStart);
+            lock (_lock)
+            {
+                _busyFrames++;
+                _totalFrameMs += frameMs;
+                _lastFrameMs = frameMs;
+                _lastFrameDispatched = dispatched;
+                if (frameMs > _maxFrameMs)
+                    _maxFrameMs = frameMs;
+                if (frameMs > budgetMs)
+                    _overBudgetFrames++;
+            }
+        }
+
+        /// <summary>
+        /// Removes every queued request, e.g. to close them when the server shuts down.
+        /// </summary>
+        public List<HttpListenerContext> DrainAll()
+        {
+            lock (_lock)
+            {
+                var contexts = new List<HttpListenerContext>();
+                foreach (var queue in _queues)
+                {
+                    contexts.AddRange(queue.Select(r => r.Context));
+                    queue.Clear();
+                }
+                return contexts;
+            }
+        }
+
+        public RequestSchedulerStatistics GetStatistics()
+        {
+            lock (_lock)
+            {
+                return new RequestSchedulerStatistics
+                {
+                    FrameBudgetMs = _settings.RequestFrameBudgetMs,
+                    MaxWaitMs = _settings.RequestMaxWaitMs,
+                    BulkCostMs = BulkCostMs,
+                    QueueDepth = _queues.Sum(q => q.Count),
+                    BusyFrames = _busyFrames,
+                    OverBudgetFrames = _overBudgetFrames,
+                    AvgFrameMs = _busyFrames > 0 ? _totalFrameMs / _busyFrames : 0,
+                    LastFrameMs = _lastFrameMs,
+                    MaxFrameMs = _maxFrameMs,
+                    LastFrameDispatched = _lastFrameDispatched,
+                    Classes = Enumerable
+                        .Range(0, PriorityCount)
+                        .Select(i => _metrics[i].ToStatistics((RequestPriority)i, _queues[i].Count))
+                        .ToList(),
+                    Routes = _routeCosts
+                        .OrderByDescending(kv => kv.Value.AvgMs)
+                        .Select(kv => new RouteCostStatistics
+                        {
+                            Route = kv.Key,
+                            Priority = Classify(kv.Key.Substring(0, kv.Key.IndexOf(' ')), kv.Key)
+                                .ToString()
+                                .ToLowerInvariant(),
+                            Count = kv.Value.Count,
+                            AvgMs = kv.Value.AvgMs,
+                            LastMs = kv.Value.LastMs,
+                            MaxMs = kv.Value.MaxMs,
+                        })
+                        .ToList(),
+                };
+            }
+        }
+
+        private int SelectQueue(long now)
+        {
+            // A request that has waited past the limit goes first, oldest first, so a steady
+            // stream of control and interactive requests cannot starve bulk reads
+            long maxWaitTicks = (long)(Math.Max(1, _settings.RequestMaxWaitMs) * Stopwatch.Frequency / 1000.0);
+            int overdue = -1;
+            long oldest = long.MaxValue;
+            for (int i = 0; i < PriorityCount; i++)
+            {
+                if (_queues[i].Count == 0)
+                    continue;
+                long enqueuedAt = _queues[i].Peek().EnqueuedAt;
+                if (now - enqueuedAt > maxWaitTicks && enqueuedAt < oldest)
+                {
+                    overdue = i;
+                    oldest = enqueuedAt;
+                }
+            }
+            if (overdue >= 0)
+                return overdue;
+
+            for (int i = 0; i < PriorityCount; i++)
+            {
+                if (_queues[i].Count > 0)
+                    return i;
+            }
+            return -1;
+        }
+
+        private RequestPriority Classify(string method, string routeKey)
+        {
+            if (method != "GET" && method != "HEAD")
+                return RequestPriority.Control;
+            return EstimateCost(routeKey) > BulkCostMs ? RequestPriority.Bulk : RequestPriority.Interactive;
+        }
+
+        private double EstimateCost(string routeKey)
+        {
+            return _routeCosts.TryGetValue(routeKey, out var cost) ? cost.AvgMs : DefaultCostMs;
+        }
+
+        private void RecordCost(string routeKey, double costMs)
+        {
+            if (!_routeCosts.TryGetValue(routeKey, out var cost))
+            {
+                // Unknown paths (typos, scans) would otherwise grow the table without bound
+                if (_routeCosts.Count >= MaxTrackedRoutes)
+                    return;
+                cost = new RouteCost { AvgMs = costMs };
+                _routeCosts[routeKey] = cost;
+            }
+
+            cost.Count++;
+            cost.AvgMs += (costMs - cost.AvgMs) * CostSmoothing;
+            cost.LastMs = costMs;
+            if (costMs > cost.MaxMs)
+                cost.MaxMs = costMs;
+        }
+
+        private static string GetRouteKey(HttpListenerRequest request)
+        {
+            string method = request.HttpMethod == "HEAD" ? "GET" : request.HttpMethod;
+            string path = request.Url.AbsolutePath;
+            if (path.Length > 1 && path.EndsWith("/"))
+                path = path.TrimEnd('/');
+            return method + " " + path;
+        }
+
+        private static double ToMs(long stopwatchTicks)
+        {
+            return stopwatchTicks * 1000.0 / Stopwatch.Frequency;
+        }
+
+        private struct QueuedRequest
+        {
+            public HttpListenerContext Context;
+            public string RouteKey;
+            public long EnqueuedAt;
+        }
+
+        private class RouteCost
+        {
+            public long Count;
+            public double AvgMs;
+            public double LastMs;
+            public double MaxMs;
+        }
+
+        private class ClassMetrics
+        {
+            public long Enqueued;
+            public long Dispatched;
+            public double TotalWaitMs;
+            public double MaxWaitMs;
+
+            // Most recent waits, for percentiles
+            private readonly double[] _waits = new double[WaitSampleSize];
+            private int _waitCount;
+            private int _waitNext;
+
+            public void RecordWait(double waitMs)
+            {
+                Dispatched++;
+                TotalWaitMs += waitMs;
+                if (waitMs > MaxWaitMs)
+                    MaxWaitMs = waitMs;
+                _waits[_waitNext] = waitMs;
+                _waitNext = (_waitNext + 1) % _waits.Length;
+                if (_waitCount < _waits.Length)
+                    _waitCount++;
+            }
+
+            public RequestClassStatistics ToStatistics(RequestPriority priority, int depth)
+            {
+                var recent = new double[_waitCount];
+                Array.Copy(_waits, recent, _waitCount);
+                Array.Sort(recent);
+                return new RequestClassStatistics
+                {
+                    Priority = priority.ToString().ToLowerInvariant(),
+                    QueueDepth = depth,
+                    Enqueued = Enqueued,
+                    Dispatched = Dispatched,
+                    AvgWaitMs = Dispatched > 0 ? TotalWaitMs / Dispatched : 0,
+                    P50WaitMs = Percentile(recent, 0.50),
+                    P99WaitMs = Percentile(recent, 0.99),
+                    MaxWaitMs = MaxWaitMs,
+                };
+            }
+
+            private static double Percentile(double[] sorted, double p)
+            {
+                if (sorted.Length == 0)
+                    return 0;
+                return sorted[Math.Min(sorted.Length - 1, (int)(p * sorted.Length))];
+            }
+        }
+    }
+
+    /// <summary>
+    /// Request scheduler counters. Frame timings cover frames that dispatched at least one
+    /// request; wait percentiles cover the last 1024 requests of each class.
+    /// </summary>
+    public class RequestSchedulerStatistics
+    {
+        public float FrameBudgetMs { get; set; }
+        public int MaxWaitMs { get; set; }
+        public double BulkCostMs { get; set; }
+        public int QueueDepth { get; set; }
+        public long BusyFrames { get; set; }
+        public long OverBudgetFrames { get; set; }
+        public double AvgFrameMs { get; set; }
+        public double LastFrameMs { get; set; }
+        public double MaxFrameMs { get; set; }
+        public int LastFrameDispatched { get; set; }
+        public List<RequestClassStatistics> Classes { get; set; }
+        public List<RouteCostStatistics> Routes { get; set; }
+    }
+
+    public class RequestClassStatistics
+    {
+        public string Priority { get; set; }
+        public int QueueDepth { get; set; }
+        public long Enqueued { get; set; }
+        public long Dispatched { get; set; }
+        public double AvgWaitMs { get; set; }
+        public double P50WaitMs { get; set; }
+        public double P99WaitMs { get; set; }
+        public double MaxWaitMs { get; set; }
+    }
+
+    public class RouteCostStatistics
+    {
+        public string Route { get; set; }
+        public string Priority { get; set; }
+        public long Count { get; set; }
+        public double AvgMs { get; set; }
+        public double LastMs { get; set; }
+        public double MaxMs { get; set; }
+    }
+}
@@ -0,0 +1,279 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Net;
+using System.Threading;
+using System.Threading.Tasks;
+using RIMAPI.Services;
+using Verse;
+
+namespace RIMAPI.Core
+{
+    /// <summary>
+    /// Opt-in read path that serves hot GET endpoints from snapshots instead of the main thread
+    /// (<see cref="RIMAPI_Settings.EnableSnapshotReads"/>).
+    /// <para>Every <c>refreshIntervalTicks</c> the game thread runs the service calls of the
+    /// snapshot routes and keeps the resulting DTOs. The DTOs are fresh objects that are never
+    /// modified afterwards, so listener threads can serialize them without touching game
+    /// state. Only routes requested recently are captured; the first request of a route still
+    /// goes through the main thread. Snapshot responses carry <c>snapshot_tick</c> and an
+    /// <c>X-RIMAPI-Snapshot-Tick</c> header with the game tick of the capture.</para>
+    /// </summary>
+    public class SnapshotService
+    {
+        public const string SnapshotTickHeader = "X-RIMAPI-Snapshot-Tick";
+
+        // A route not requested for this many captures stops being captured
+        private const int IdleCaptures = 10;
+
+        private readonly RIMAPI_Settings _settings;
+        private readonly Dictionary<string, SnapshotRoute> _routes = new Dictionary<string, SnapshotRoute>();
+
+        // Replaced as a whole on every capture, never modified in place
+        private volatile Dictionary<string, Func<HttpListenerContext, Task>> _snapshots =
+            new Dictionary<string, Func<HttpListenerContext, Task>>();
+        private int _generation;
+
+        private readonly object _statsLock = new object();
+
+        private long _served;
+        private long _fallbacks;
+        private long _captures;
+        private int _lastCaptureTick;
+        private double _lastCaptureMs;
+        private double _maxCaptureMs;
+
+        public SnapshotService(
+            RIMAPI_Settings settings,
+            IColonistService colonistService,
+            IPawnInfoService pawnInfoService,
+            IResourceService resourceService,
+            IGameStateService gameStateService
+        )
+        {
+            _settings = settings;
+
+            AddRoute("/api/v1/game/state", _ => gameStateService.GetGameState());
+            AddRoute("/api/v1/colonists", _ => colonistService.GetColonists());
+            AddRoute("/api/v1/colonists/positions", _ => colonistService.GetColonistPositions());
+            AddRoute("/api/v1/colonists/detailed", _ => colonistService.GetColonistsDetailedV1());
+            AddRoute("/api/v1/map/pawns", pawnInfoService.GetPawnsOnMap, perMap: true);
+            AddRoute("/api/v1/resources/summary", resourceService.GetResourcesSummary, perMap: true);
+        }
+
+        private void AddRoute<T>(string path, Func<int, ApiResult<T>> capture, bool perMap = false)
+        {
+            _routes[path] = new SnapshotRoute
+            {
+                Path = path,
+                PerMap = perMap,
+                Capture = (mapId, tick) =>
+                {
+                    var result = capture(mapId);
+                    if (!result.Success)
+                        return null;
+                    return ctx => Send(ctx, result, tick);
+                },
+                LastRequested = int.MinValue / 2,
+            };
+        }
+
+        /// <summary>
+        /// Captures snapshots of the recently requested routes. Must run on the main thread.
+        /// </summary>
+        public void Capture()
+        {
+            if (!_settings.EnableSnapshotReads || Current.ProgramState != ProgramState.Playing)
+            {
+                if (_snapshots.Count > 0)
+                    _snapshots = new Dictionary<string, Func<HttpListenerContext, Task>>();
+                return;
+            }
+
+            long start = Stopwatch.GetTimestamp();
+            int tick = Find.TickManager.TicksGame;
+            int generation = Interlocked.Increment(ref _generation);
+            var snapshots = new Dictionary<string, Func<HttpListenerContext, Task>>();
+
+            foreach (var route in _routes.Values)
+            {
+                if (generation - Volatile.Read(ref route.LastRequested) > IdleCaptures)
+                    continue;
+
+                try
+                {
+                    if (!route.PerMap)
+                    {
+                        AddSnapshot(snapshots, route.Path, route.Capture(0, tick));
+                        continue;
+                    }
+                    foreach (var map in Find.Maps)
+                    {
+                        AddSnapshot(snapshots, MapKey(route.Path, map.uniqueID), route.Capture(map.uniqueID, tick));
+                    }
+                }
+                catch (Exception ex)
+                {
+                    LogApi.Warning($"Snapshot of {route.Path} failed: {ex.Message}");
+                }
+            }
+
+            _snapshots = snapshots;
+
+            double elapsedMs = (Stopwatch.GetTimestamp() - start) * 1000.0 / Stopwatch.Frequency;
+            lock (_statsLock)
+            {
+                _captures++;
+                _lastCaptureTick = tick;
+                _lastCaptureMs = elapsedMs;
+                if (elapsedMs > _maxCaptureMs)
+                    _maxCaptureMs = elapsedMs;
+            }
+        }
+
+        /// <summary>
+        /// Serves the request from a snapshot on a worker thread if one matches. Returns false
+        /// when the request has to go through the main thread instead.
+        /// </summary>
+        public bool TryServe(HttpListenerContext context)
+        {
+            if (!_settings.EnableSnapshotReads)
+                return false;
+
+            var request = context.Request;
+            if (request.HttpMethod != "GET" && request.HttpMethod != "HEAD")
+                return false;
+
+            string path = request.Url.AbsolutePath;
+            if (path.Length > 1 && path.EndsWith("/"))
+                path = path.TrimEnd('/');
+            if (!_routes.TryGetValue(path, out var route))
+                return false;
+
+            Volatile.Write(ref route.LastRequested, Volatile.Read(ref _generation));
+
+            // Query filters rewrite the result in place, so filtered reads stay on the main thread
+            string key = path;
+            var query = request.QueryString;
+            foreach (string name in query.AllKeys)
+            {
+                if (route.PerMap && name == "map_id")
+                    continue;
+                Interlocked.Increment(ref _fallbacks);
+                return false;
+            }
+            if (route.PerMap)
+            {
+                if (!int.TryParse(query["map_id"], out int mapId))
+                {
+                    Interlocked.Increment(ref _fallbacks);
+                    return false;
+                }
+                key = MapKey(path, mapId);
+            }
+
+            if (!_snapshots.TryGetValue(key, out var snapshot))
+            {
+                Interlocked.Increment(ref _fallbacks);
+                return false;
+            }
+
+            Interlocked.Increment(ref _served);
+            Task.Run(async () =>
+            {
+                try
+                {
+                    CorsUtil.WriteCors(request, context.Response);
+                    await snapshot(context);
+                }
+                catch (Exception ex)
+                {
+                    LogApi.Error($"Error serving snapshot of {path} - {ex.Message}");
+                    try
+                    {
+                        context.Response.Abort();
+                    }
+                    catch { }
+                }
+            });
+            return true;
+        }
+
+        public SnapshotStatistics GetStatistics()
+        {
+            var snapshots = _snapshots;
+            int generation = Volatile.Read(ref _generation);
+            lock (_statsLock)
+            {
+                return new SnapshotStatistics
+                {
+                    Enabled = _settings.EnableSnapshotReads,
+                    Served = Interlocked.Read(ref _served),
+                    Fallbacks = Interlocked.Read(ref _fallbacks),
+                    Captures = _captures,
+                    LastCaptureTick = _lastCaptureTick,
+                    LastCaptureMs = _lastCaptureMs,
+                    MaxCaptureMs = _maxCaptureMs,
+                    Routes = _routes.Keys.ToList(),
+                    ActiveRoutes = _routes
+                        .Values.Where(r => generation - Volatile.Read(ref r.LastRequested) <= IdleCaptures)
+                        .Select(r => r.Path)
+                        .ToList(),
+                    Snapshots = snapshots.Keys.OrderBy(k => k).ToList(),
+                };
+            }
+        }
+
+        private static void AddSnapshot(
+            Dictionary<string, Func<HttpListenerContext, Task>> snapshots,
+            string key,
+            Func<HttpListenerContext, Task> snapshot
+        )
+        {
+            if (snapshot != null)
+                snapshots[key] = snapshot;
+        }
+
+        private static string MapKey(string path, int mapId)
+        {
+            return path + "?map_id=" + mapId;
+        }
+
+        private static async Task Send<T>(HttpListenerContext context, ApiResult<T> captured, int tick)
+        {
+            // The captured result is shared between requests, so each response gets its own envelope
+            var result = new ApiResult<T>
+            {
+                Success = true,
+                Data = captured.Data,
+                Warnings = new List<string>(captured.Warnings),
+                SnapshotTick = tick,
+            };
+            context.Response.Headers.Set(SnapshotTickHeader, tick.ToString());
+            await ResponseBuilder.SendApiResult(context.Response, result);
+        }
+
+        private class SnapshotRoute
+        {
+            public string Path;
+            public bool PerMap;
+            public Func<int, int, Func<HttpListenerContext, Task>> Capture;
+            public int LastRequested;
+        }
+    }
+
+    public class SnapshotStatistics
+    {
+        public bool Enabled { get; set; }
+        public long Served { get; set; }
+        public long Fallbacks { get; set; }
+        public long Captures { get; set; }
+        public int LastCaptureTick { get; set; }
+        public double LastCaptureMs { get; set; }
+        public double MaxCaptureMs { get; set; }
+        public List<string> Routes { get; set; }
+        public List<string> ActiveRoutes { get; set; }
+        public List<string> Snapshots { get; set; }
+    }
+}
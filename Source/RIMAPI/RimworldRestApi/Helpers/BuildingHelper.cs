@@ -166,14 +166,9 @@ namespace RIMAPI.Helpers
 
         public static Building FindBuildingByID(int buildingId)
         {
-            foreach (Map map in Find.Maps)
-            {
-                Building building = map.listerBuildings.allBuildingsColonist.FirstOrDefault(b =>
-                    b.thingIDNumber == buildingId
-                );
-                if (building != null)
-                    return building;
-            }
+            // Same set as listerBuildings.allBuildingsColonist
+            if (ThingIdIndex.Get(buildingId) is Building building && building.Faction == Faction.OfPlayer)
+                return building;
             return null;
         }
     }
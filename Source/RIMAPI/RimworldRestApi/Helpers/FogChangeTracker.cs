@@ -0,0 +1,130 @@
+using System.Collections.Generic;
+using Verse;
+
+namespace RIMAPI.Helpers
+{
+    /// <summary>
+    /// Keeps a per-map record of which fog cells changed at which tick, so clients can
+    /// fetch only the cells changed since their last fog-grid download.
+    /// Fed by <c>FogGridHook</c> whenever a flood unfog reveals cells. All calls run on the main thread.
+    /// </summary>
+    public static class FogChangeTracker
+    {
+        /// <summary>Number of change batches kept per map before the oldest ones are discarded.</summary>
+        public const int MaxHistory = 256;
+
+        private class FogChange
+        {
+            public int Tick;
+            public int[] Cells;
+        }
+
+        private class MapFogState
+        {
+            public Map Map;
+            public bool[] Snapshot;
+            // Deltas can only be built for since_tick >= BaseTick
+            public int BaseTick;
+            public readonly List<FogChange> History = new List<FogChange>();
+        }
+
+        private static readonly Dictionary<int, MapFogState> States = new Dictionary<int, MapFogState>();
+
+        /// <summary>
+        /// Starts tracking the map if needed. Called when a full grid is served so that
+        /// the client can ask for deltas from that tick on.
+        /// </summary>
+        public static void Track(Map map)
+        {
+            GetState(map, Find.TickManager.TicksGame);
+        }
+
+        /// <summary>
+        /// Records every cell whose fog state differs from the last snapshot as changed at the current tick.
+        /// Maps no client has fetched a full grid for are not tracked and are skipped.
+        /// </summary>
+        public static void Record(Map map)
+        {
+            if (!States.TryGetValue(map.uniqueID, out var state) || state.Map != map)
+                return;
+
+            int tick = Find.TickManager.TicksGame;
+            var changed = Diff(state);
+            if (changed == null) return;
+
+            state.History.Add(new FogChange { Tick = tick, Cells = changed });
+            if (state.History.Count > MaxHistory)
+            {
+                // Deltas reaching past the dropped batch would miss cells
+                state.BaseTick = state.History[0].Tick + 1;
+                state.History.RemoveAt(0);
+            }
+        }
+
+        /// <summary>
+        /// Collects the cells changed at or after <paramref name="sinceTick"/>.
+        /// Returns false when the history does not reach that far back and a full grid is needed.
+        /// </summary>
+        public static bool TryGetChangedSince(Map map, int sinceTick, out HashSet<int> cells)
+        {
+            cells = null;
+            if (!States.TryGetValue(map.uniqueID, out var state) || state.Map != map)
+                return false;
+
+            // Pick up cells changed outside FloodUnfog (refog, direct Unfog calls) before answering
+            Record(map);
+
+            if (sinceTick < state.BaseTick)
+                return false;
+
+            cells = new HashSet<int>();
+            foreach (var change in state.History)
+            {
+                if (change.Tick < sinceTick) continue;
+                cells.UnionWith(change.Cells);
+            }
+            return true;
+        }
+
+        /// <summary>Forgets all maps. Called when a game is loaded or a new one started.</summary>
+        public static void Clear()
+        {
+            States.Clear();
+        }
+
+        private static MapFogState GetState(Map map, int tick)
+        {
+            // Map ids restart with every save, so a state from another game must not be reused
+            if (States.TryGetValue(map.uniqueID, out var state) && state.Map == map)
+                return state;
+
+            int totalCells = map.cellIndices.NumGridCells;
+            var snapshot = new bool[totalCells];
+            FogGrid fogGrid = map.fogGrid;
+            for (int i = 0; i < totalCells; i++)
+                snapshot[i] = fogGrid.IsFogged(i);
+
+            state = new MapFogState { Map = map, Snapshot = snapshot, BaseTick = tick };
+            States[map.uniqueID] = state;
+            return state;
+        }
+
+        private static int[] Diff(MapFogState state)
+        {
+            FogGrid fogGrid = state.Map.fogGrid;
+            bool[] snapshot = state.Snapshot;
+            List<int> changed = null;
+
+            for (int i = 0; i < snapshot.Length; i++)
+            {
+                bool isFogged = fogGrid.IsFogged(i);
+                if (isFogged == snapshot[i]) continue;
+
+                snapshot[i] = isFogged;
+                (changed ?? (changed = new List<int>())).Add(i);
+            }
+
+            return changed?.ToArray();
+        }
+    }
+}
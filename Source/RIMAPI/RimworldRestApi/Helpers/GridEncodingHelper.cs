@@ -0,0 +1,122 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.Compression;
+
+namespace RIMAPI.Helpers
+{
+    /// <summary>
+    /// Wire formats for map grids, selected with <c>?encoding=</c>.
+    /// </summary>
+    public enum GridEncoding
+    {
+        /// <summary>Original format: Base64 Int32 runs for fog, JSON integer lists for terrain.</summary>
+        Default,
+
+        /// <summary>The same runs as unsigned LEB128 varints (1 byte for values below 128).</summary>
+        Varint,
+
+        /// <summary>One value per cell with the fewest bits that hold the palette (1 bit for fog), LSB first.</summary>
+        BitPacked,
+
+        /// <summary>The varint runs compressed with raw DEFLATE (RFC 1951).</summary>
+        Deflate,
+    }
+
+    public static class GridEncodingHelper
+    {
+        /// <summary>
+        /// Parses an <c>encoding</c> query value. Empty means <see cref="GridEncoding.Default"/>.
+        /// </summary>
+        public static bool TryParse(string value, out GridEncoding encoding)
+        {
+            switch (value?.Trim().ToLowerInvariant())
+            {
+                case null:
+                case "":
+                case "default":
+                    encoding = GridEncoding.Default;
+                    return true;
+                case "varint":
+                    encoding = GridEncoding.Varint;
+                    return true;
+                case "bitpacked":
+                    encoding = GridEncoding.BitPacked;
+                    return true;
+                case "deflate":
+                    encoding = GridEncoding.Deflate;
+                    return true;
+                default:
+                    encoding = GridEncoding.Default;
+                    return false;
+            }
+        }
+
+        public static string ToName(GridEncoding encoding)
+        {
+            return encoding.ToString().ToLowerInvariant();
+        }
+
+        /// <summary>Bits needed to store values in [0, valueCount), at least 1.</summary>
+        public static int BitsFor(int valueCount)
+        {
+            int bits = 1;
+            while ((1 << bits) < valueCount)
+                bits++;
+            return bits;
+        }
+
+        /// <summary>Encodes run lengths (or count/value pairs) with the varint or deflate encoding as Base64.</summary>
+        public static string EncodeRuns(List<int> values, GridEncoding encoding)
+        {
+            byte[] varints = WriteVarints(values);
+            return Convert.ToBase64String(encoding == GridEncoding.Deflate ? Deflate(varints) : varints);
+        }
+
+        public static byte[] WriteVarints(List<int> values)
+        {
+            using (var stream = new MemoryStream(values.Count + 16))
+            {
+                foreach (int value in values)
+                {
+                    uint v = (uint)value;
+                    while (v >= 0x80)
+                    {
+                        stream.WriteByte((byte)(v | 0x80));
+                        v >>= 7;
+                    }
+                    stream.WriteByte((byte)v);
+                }
+                return stream.ToArray();
+            }
+        }
+
+        /// <summary>Packs each value into <paramref name="bitsPerValue"/> bits, least significant bit first.</summary>
+        public static byte[] BitPack(int[] values, int bitsPerValue)
+        {
+            var packed = new byte[((long)values.Length * bitsPerValue + 7) / 8];
+            long bitPos = 0;
+            foreach (int value in values)
+            {
+                for (int b = 0; b < bitsPerValue; b++, bitPos++)
+                {
+                    if ((value & (1 << b)) != 0)
+                        packed[bitPos >> 3] |= (byte)(1 << (int)(bitPos & 7));
+                }
+            }
+            return packed;
+        }
+
+        public static byte[] Deflate(byte[] data)
+        {
+            using (var output = new MemoryStream())
+            {
+                using (var deflate = new DeflateStream(output, CompressionLevel.Optimal, true))
+                {
+                    deflate.Write(data, 0, data.Length);
+                }
+                return output.ToArray();
+            }
+        }
+    }
+}
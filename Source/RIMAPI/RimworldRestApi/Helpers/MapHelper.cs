@@ -14,8 +14,7 @@ namespace RIMAPI.Helpers
     {
         public static Thing GetThingOnMapById(int mapId, int id)
         {
-            Map map = GetMapByID(mapId);
-            return map.listerThings.AllThings.Where(s => s.thingIDNumber == id).FirstOrDefault();
+            return ThingIdIndex.Get(GetMapByID(mapId), id);
         }
 
         public static Map GetMapByID(int uniqueID)
@@ -434,7 +433,7 @@ namespace RIMAPI.Helpers
             return mapRooms;
         }
 
-        public static MapTerrainDto GetMapTerrain(int mapId)
+        public static MapTerrainDto GetMapTerrain(int mapId, GridEncoding encoding = GridEncoding.Default)
         {
             var map = GetMapByID(mapId);
             if (map == null) return new MapTerrainDto();
@@ -561,15 +560,37 @@ namespace RIMAPI.Helpers
                 compressedFloorGrid.Add(currentVal);
             }
 
-            return new MapTerrainDto
+            var terrain = new MapTerrainDto
             {
                 Width = width,
                 Height = height,
                 Palette = palette,
-                Grid = compressedGrid,
                 FloorPalette = floorPalette,
-                FloorGrid = compressedFloorGrid
             };
+
+            // 5. Wire encoding requested with ?encoding=
+            switch (encoding)
+            {
+                case GridEncoding.Default:
+                    terrain.Grid = compressedGrid;
+                    terrain.FloorGrid = compressedFloorGrid;
+                    break;
+                case GridEncoding.BitPacked:
+                    terrain.BitsPerCell = GridEncodingHelper.BitsFor(palette.Count);
+                    terrain.FloorBitsPerCell = GridEncodingHelper.BitsFor(floorPalette.Count + 1);
+                    terrain.GridData = Convert.ToBase64String(GridEncodingHelper.BitPack(rawIndices, terrain.BitsPerCell.Value));
+                    terrain.FloorGridData = Convert.ToBase64String(GridEncodingHelper.BitPack(rawFloorIndices, terrain.FloorBitsPerCell.Value));
+                    break;
+                default:
+                    terrain.GridData = GridEncodingHelper.EncodeRuns(compressedGrid, encoding);
+                    terrain.FloorGridData = GridEncodingHelper.EncodeRuns(compressedFloorGrid, encoding);
+                    break;
+            }
+
+            if (encoding != GridEncoding.Default)
+                terrain.Encoding = GridEncodingHelper.ToName(encoding);
+
+            return terrain;
         }
 
         public static List<ThingDto> GetMapThingsInRadius(int mapId, int centerX, int centerZ, int radius)
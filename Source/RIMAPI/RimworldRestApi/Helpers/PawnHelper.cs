@@ -19,7 +19,11 @@ namespace RIMAPI.Helpers
 
         public static Pawn FindPawnById(int id)
         {
-            // Search all maps
+            // Spawned pawns
+            if (ThingIdIndex.Get(id) is Pawn spawned)
+                return spawned;
+
+            // Search all maps for carried or contained pawns
             foreach (var map in Find.Maps)
             {
                 var pawn = map.mapPawns.AllPawns
@@ -129,47 +133,9 @@ namespace RIMAPI.Helpers
                     DrugsDesire = pawn.needs.drugsDesire?.CurLevel ?? 0,
                     SurroundingBeauty = pawn.needs.beauty?.CurLevel ?? 0,
                     FreshAir = pawn.needs.outdoors?.CurLevel ?? 0,
-                    WorkInfo = new WorkInfoDto
-                    {
-                        Skills =
-                            pawn.skills.skills?.Where(skill => skill != null && skill.def != null)
-                                .Select(skill => new SkillDto
-                                {
-                                    Name = skill.def.defName,
-                                    Level = skill.Level,
-                                    Description = skill.def.description,
-                                    MinLevel = SkillRecord.MinLevel,
-                                    MaxLevel = SkillRecord.MaxLevel,
-                                    LevelDescriptor = skill.LevelDescriptor,
-                                    PermanentlyDisabled = skill.PermanentlyDisabled,
-                                    TotallyDisabled = skill.TotallyDisabled,
-                                    XpTotalEarned = skill.XpTotalEarned,
-                                    XpProgressPercent = skill.XpProgressPercent,
-                                    XpRequiredForLevelUp = skill.XpRequiredForLevelUp,
-                                    XpSinceLastLevel = skill.xpSinceLastLevel,
-                                    Aptitude = skill.Aptitude,
-                                    Passion = (int)skill.passion,
-                                    DisabledWorkTags = (int)skill.def.disablingWorkTags,
-                                })
-                                .ToList() ?? new List<SkillDto>(),
-                        CurrentJob = pawn.CurJob?.def?.defName ?? "",
-                        Traits = GetTraits(pawn),
-                        WorkPriorities = GetWorkPriorities(pawn),
-                    },
-                    PoliciesInfo = new PoliciesInfoDto
-                    {
-                        FoodPolicyId = pawn.foodRestriction?.CurrentFoodPolicy?.id ?? 0,
-                        HostilityResponse = (int)pawn.playerSettings.hostilityResponse,
-                    },
-                    MedicalInfo = new MedicalInfoDto
-                    {
-                        Health = pawn.health?.summaryHealth?.SummaryHealthPercent ?? 1f,
-                        Hediffs = GetHediffs(pawn),
-                        MedicalPolicyId = (int)(
-                            pawn.playerSettings?.medCare ?? MedicalCareCategory.NoCare
-                        ),
-                        IsSelfTendAllowed = pawn.playerSettings?.selfTend ?? false,
-                    },
+                    WorkInfo = GetWorkInfo(pawn),
+                    PoliciesInfo = GetPoliciesInfo(pawn),
+                    MedicalInfo = GetMedicalInfo(pawn),
                     SocialInfo = CreatePawnSocialInfoDto(pawn),
                 };
             }
@@ -180,6 +146,64 @@ namespace RIMAPI.Helpers
             }
         }
 
+        public static WorkInfoDto GetWorkInfo(Pawn pawn)
+        {
+            return new WorkInfoDto
+            {
+                Skills =
+                    pawn.skills.skills?.Where(skill => skill != null && skill.def != null)
+                        .Select(skill => new SkillDto
+                        {
+                            Name = skill.def.defName,
+                            Level = skill.Level,
+                            Description = skill.def.description,
+                            MinLevel = SkillRecord.MinLevel,
+                            MaxLevel = SkillRecord.MaxLevel,
+                            LevelDescriptor = skill.LevelDescriptor,
+                            PermanentlyDisabled = skill.PermanentlyDisabled,
+                            TotallyDisabled = skill.TotallyDisabled,
+                            XpTotalEarned = skill.XpTotalEarned,
+                            XpProgressPercent = skill.XpProgressPercent,
+                            XpRequiredForLevelUp = skill.XpRequiredForLevelUp,
+                            XpSinceLastLevel = skill.xpSinceLastLevel,
+                            Aptitude = skill.Aptitude,
+                            Passion = (int)skill.passion,
+                            DisabledWorkTags = (int)skill.def.disablingWorkTags,
+                        })
+                        .ToList() ?? new List<SkillDto>(),
+                CurrentJob = pawn.CurJob?.def?.defName ?? "",
+                Traits = GetTraits(pawn),
+                WorkPriorities = GetWorkPriorities(pawn),
+            };
+        }
+
+        public static PoliciesInfoDto GetPoliciesInfo(Pawn pawn)
+        {
+            return new PoliciesInfoDto
+            {
+                FoodPolicyId = pawn.foodRestriction?.CurrentFoodPolicy?.id ?? 0,
+                HostilityResponse = (int)pawn.playerSettings.hostilityResponse,
+            };
+        }
+
+        public static MedicalInfoDto GetMedicalInfo(Pawn pawn)
+        {
+            var capacities = pawn.health?.capacities;
+            return new MedicalInfoDto
+            {
+                IsDead = pawn.Dead,
+                IsDowned = pawn.Downed,
+                Consciousness = capacities?.GetLevel(PawnCapacityDefOf.Consciousness) ?? 0f,
+                Moving = capacities?.GetLevel(PawnCapacityDefOf.Moving) ?? 0f,
+                Health = pawn.health?.summaryHealth?.SummaryHealthPercent ?? 1f,
+                Hediffs = GetHediffs(pawn),
+                MedicalPolicyId = (int)(
+                    pawn.playerSettings?.medCare ?? MedicalCareCategory.NoCare
+                ),
+                IsSelfTendAllowed = pawn.playerSettings?.selfTend ?? false,
+            };
+        }
+
         public static SocialInfoDto CreatePawnSocialInfoDto(Pawn pawn)
         {
             var dto = new SocialInfoDto
@@ -0,0 +1,107 @@
+using System.Collections.Generic;
+using System.Diagnostics;
+using Verse;
+
+namespace RIMAPI.Helpers
+{
+    /// <summary>
+    /// Per-map dictionary from <c>thingIDNumber</c> to spawned thing, replacing linear scans of
+    /// <c>listerThings.AllThings</c> for lookups by ID.
+    /// <para>A map is indexed on its first lookup and then kept in sync by the spawn and despawn
+    /// hooks in <c>ThingIdIndexHooks</c>. Only spawned things are indexed, the same set
+    /// <c>listerThings</c> holds. Main thread only, like the rest of the game state.</para>
+    /// </summary>
+    public static class ThingIdIndex
+    {
+        private static readonly Dictionary<Map, Dictionary<int, Thing>> _maps =
+            new Dictionary<Map, Dictionary<int, Thing>>();
+        private static Game _game;
+
+        public static int IndexedMaps => _maps.Count;
+
+        public static Thing Get(Map map, int id)
+        {
+            if (map == null)
+                return null;
+
+            var index = GetIndex(map);
+            if (!index.TryGetValue(id, out var thing))
+                return null;
+
+            // A despawn the hooks did not see, e.g. a patch failing on a modded thing
+            if (!thing.Spawned || thing.Map != map)
+            {
+                index.Remove(id);
+                return null;
+            }
+            return thing;
+        }
+
+        /// <summary>
+        /// Searches every map, returning the first spawned thing with the ID.
+        /// </summary>
+        public static Thing Get(int id)
+        {
+            foreach (var map in Find.Maps)
+            {
+                var thing = Get(map, id);
+                if (thing != null)
+                    return thing;
+            }
+            return null;
+        }
+
+        public static void Add(Thing thing, Map map)
+        {
+            if (map != null && _game == Current.Game && _maps.TryGetValue(map, out var index))
+                index[thing.thingIDNumber] = thing;
+        }
+
+        public static void Remove(Thing thing, Map map)
+        {
+            if (map != null && _game == Current.Game && _maps.TryGetValue(map, out var index))
+                index.Remove(thing.thingIDNumber);
+        }
+
+        /// <summary>
+        /// Time to build the index of <paramref name="map"/> from scratch, for the lookup benchmark.
+        /// </summary>
+        internal static double Rebuild(Map map)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            _maps.Remove(map);
+            GetIndex(map);
+            return stopwatch.Elapsed.TotalMilliseconds;
+        }
+
+        private static Dictionary<int, Thing> GetIndex(Map map)
+        {
+            // Maps of a previous game are never despawned through the hooks
+            if (_game != Current.Game)
+            {
+                _maps.Clear();
+                _game = Current.Game;
+            }
+
+            if (!_maps.TryGetValue(map, out var index))
+            {
+                // Drop maps that were removed, e.g. abandoned settlements
+                var removed = new List<Map>();
+                foreach (var indexed in _maps.Keys)
+                {
+                    if (!Find.Maps.Contains(indexed))
+                        removed.Add(indexed);
+                }
+                foreach (var old in removed)
+                    _maps.Remove(old);
+
+                var things = map.listerThings.AllThings;
+                index = new Dictionary<int, Thing>(things.Count);
+                foreach (var thing in things)
+                    index[thing.thingIDNumber] = thing;
+                _maps[map] = index;
+            }
+            return index;
+        }
+    }
+}
@@ -0,0 +1,82 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using RIMAPI.Models;
+using Verse;
+
+namespace RIMAPI.Helpers
+{
+    /// <summary>
+    /// Compares lookups by thing ID through <see cref="ThingIdIndex"/> against the previous scan of
+    /// <c>listerThings.AllThings</c> as the number of things grows.
+    /// <para>Each row takes the first N things of the map (1000, 10000, 30000 and all of them) and
+    /// looks up random IDs among them with both approaches. The last row goes through the live
+    /// index of the map.</para>
+    /// </summary>
+    public static class ThingIdIndexBenchmark
+    {
+        private static readonly int[] ThingCounts = { 1000, 10000, 30000 };
+
+        public static ThingIdIndexBenchmarkDto Run(Map map, int lookups)
+        {
+            List<Thing> allThings = map.listerThings.AllThings.ToList();
+            var random = new Random(0);
+            var rows = new List<ThingIdIndexBenchmarkRowDto>();
+
+            var counts = ThingCounts.Where(c => c < allThings.Count).ToList();
+            counts.Add(allThings.Count);
+            foreach (int count in counts)
+            {
+                var things = allThings.GetRange(0, count);
+                var ids = RandomIds(things, lookups, random);
+                var index = things.ToDictionary(t => t.thingIDNumber);
+
+                rows.Add(new ThingIdIndexBenchmarkRowDto
+                {
+                    Things = count,
+                    ScanAvgUs = Measure(ids, id => things.Where(s => s.thingIDNumber == id).FirstOrDefault()),
+                    IndexAvgUs = Measure(ids, id => index.TryGetValue(id, out var thing) ? thing : null),
+                });
+            }
+
+            double buildMs = ThingIdIndex.Rebuild(map);
+            var liveIds = RandomIds(allThings, lookups, random);
+            return new ThingIdIndexBenchmarkDto
+            {
+                MapId = map.uniqueID,
+                Lookups = lookups,
+                IndexBuildMs = buildMs,
+                LiveIndexAvgUs = Measure(liveIds, id => ThingIdIndex.Get(map, id)),
+                Rows = rows,
+            };
+        }
+
+        private static List<int> RandomIds(List<Thing> things, int lookups, Random random)
+        {
+            var ids = new List<int>(lookups);
+            for (int i = 0; i < lookups && things.Count > 0; i++)
+                ids.Add(things[random.Next(things.Count)].thingIDNumber);
+            return ids;
+        }
+
+        private static double Measure(List<int> ids, Func<int, Thing> lookup)
+        {
+            if (ids.Count == 0)
+                return 0;
+
+            int found = 0;
+            var stopwatch = Stopwatch.StartNew();
+            foreach (int id in ids)
+            {
+                if (lookup(id) != null)
+                    found++;
+            }
+            stopwatch.Stop();
+
+            if (found != ids.Count)
+                throw new InvalidOperationException($"Lookup found {found} of {ids.Count} things");
+            return stopwatch.Elapsed.TotalMilliseconds * 1000.0 / ids.Count;
+        }
+    }
+}
@@ -0,0 +1,154 @@
+using System;
+using HarmonyLib;
+using RIMAPI.Core;
+using RimWorld;
+using UnityEngine;
+using Verse;
+
+namespace RimworldRestApi.Hooks
+{
+    /// <summary>
+    /// Invalidates the cache tags (<see cref="CacheTags"/>) of things, buildings and research
+    /// when the game changes them, so the tagged endpoints can be cached for long periods.
+    /// </summary>
+    public static class CacheInvalidationHooks
+    {
+        [HarmonyPatch(typeof(Thing), nameof(Thing.SpawnSetup))]
+        public static class ThingSpawnSetupPatch
+        {
+            static void Postfix(Thing __instance)
+            {
+                InvalidateThing(__instance, __instance?.Map);
+            }
+        }
+
+        [HarmonyPatch(typeof(Thing), nameof(Thing.DeSpawn))]
+        public static class ThingDeSpawnPatch
+        {
+            // The thing has no map any more once DeSpawn returns
+            static void Prefix(Thing __instance, out Map __state)
+            {
+                __state = __instance?.Map;
+            }
+
+            static void Postfix(Thing __instance, Map __state)
+            {
+                InvalidateThing(__instance, __state);
+            }
+        }
+
+        /// <summary>
+        /// Stacks merged into a spawned stack (item spawns next to a matching stack, hauling)
+        /// change its count without running SpawnSetup.
+        /// </summary>
+        [HarmonyPatch(typeof(Thing), nameof(Thing.TryAbsorbStack))]
+        public static class ThingTryAbsorbStackPatch
+        {
+            static void Postfix(Thing __instance, bool __result)
+            {
+                if (__result)
+                    InvalidateThing(__instance, __instance?.Map);
+            }
+        }
+
+        /// <summary>
+        /// Research points are added every tick a colonist researches; the tree reports whole
+        /// points, so the cache is only invalidated when those change.
+        /// </summary>
+        [HarmonyPatch(typeof(ResearchManager), nameof(ResearchManager.ResearchPerformed))]
+        public static class ResearchPerformedPatch
+        {
+            private static ResearchProjectDef _lastProject;
+            private static int _lastProgress = -1;
+
+            static void Postfix(ResearchManager __instance)
+            {
+                try
+                {
+                    var project = __instance.GetProject(null);
+                    if (project == null)
+                        return;
+
+                    int progress = Mathf.RoundToInt(__instance.GetProgress(project));
+                    if (project == _lastProject && progress == _lastProgress)
+                        return;
+
+                    _lastProject = project;
+                    _lastProgress = progress;
+                    CacheInvalidationAccess.Invalidate(CacheTags.Research);
+                }
+                catch (Exception ex)
+                {
+                    LogApi.Error($"[RimworldRestApi] Error in ResearchPerformedPatch: {ex}");
+                }
+            }
+        }
+
+        [HarmonyPatch(typeof(ResearchManager), nameof(ResearchManager.FinishProject))]
+        public static class FinishProjectPatch
+        {
+            static void Postfix()
+            {
+                CacheInvalidationAccess.Invalidate(CacheTags.Research);
+            }
+        }
+
+        /// <summary>
+        /// Techprints and Anomaly knowledge (including study) add progress outside
+        /// <see cref="ResearchManager.ResearchPerformed"/>.
+        /// </summary>
+        [HarmonyPatch(typeof(ResearchManager), nameof(ResearchManager.ApplyTechprint))]
+        public static class ApplyTechprintPatch
+        {
+            static void Postfix()
+            {
+                CacheInvalidationAccess.Invalidate(CacheTags.Research);
+            }
+        }
+
+        [HarmonyPatch(typeof(ResearchManager), nameof(ResearchManager.ApplyKnowledge),
+            new[] { typeof(ResearchProjectDef), typeof(float) })]
+        public static class ApplyKnowledgePatch
+        {
+            static void Postfix()
+            {
+                CacheInvalidationAccess.Invalidate(CacheTags.Research);
+            }
+        }
+
+        private static void InvalidateThing(Thing thing, Map map)
+        {
+            try
+            {
+                if (thing == null || map == null)
+                    return;
+
+                switch (thing)
+                {
+                    case Pawn pawn:
+                        if (pawn.IsColonist)
+                            CacheInvalidationAccess.Invalidate(CacheTags.Colonists, CacheTags.Pawn(pawn.thingIDNumber));
+                        break;
+
+                    case Building_ResearchBench _:
+                        // Benches decide which projects can be started
+                        CacheInvalidationAccess.Invalidate(CacheTags.MapBuildings(map.uniqueID), CacheTags.Research);
+                        break;
+
+                    case Building _:
+                        CacheInvalidationAccess.Invalidate(CacheTags.MapBuildings(map.uniqueID));
+                        break;
+
+                    default:
+                        if (thing.def.category == ThingCategory.Item)
+                            CacheInvalidationAccess.Invalidate(CacheTags.MapThings(map.uniqueID));
+                        break;
+                }
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"[RimworldRestApi] Error invalidating cache for {thing?.ThingID}: {ex}");
+            }
+        }
+    }
+}
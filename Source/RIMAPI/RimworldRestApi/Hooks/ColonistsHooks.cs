@@ -45,6 +45,11 @@ namespace RimworldRestApi.Hooks
                 { /* Ignore */
                 }
 
+                CacheInvalidationAccess.Invalidate(
+                    RIMAPI.Core.CacheTags.Colonists,
+                    RIMAPI.Core.CacheTags.Pawn(ingester.thingIDNumber)
+                );
+
                 RIMAPI.Core.LogApi.Info("Send colonist_ate EVENT");
                 EventPublisherAccess.Publish(
                     "colonist_ate",
@@ -259,6 +264,11 @@ namespace RimworldRestApi.Hooks
                 if (__instance == null)
                     return;
 
+                CacheInvalidationAccess.Invalidate(
+                    RIMAPI.Core.CacheTags.Colonists,
+                    RIMAPI.Core.CacheTags.Pawn(__instance.thingIDNumber)
+                );
+
                 EventPublisherAccess.Publish(
                     "pawn_killed",
                     new
@@ -25,6 +25,10 @@ namespace RimworldRestApi.Hooks
                     if (__result.cellsUnfogged == 0) return;
                     if (map == null) return;
 
+                    // Remember which cells changed so clients can fetch a delta instead of the full grid
+                    RIMAPI.Helpers.FogChangeTracker.Record(map);
+                    CacheInvalidationAccess.Invalidate(RIMAPI.Core.CacheTags.MapFog(map.uniqueID));
+
                     EventPublisherAccess.Publish(
                         "fog_updated",
                         new
@@ -44,5 +48,41 @@ namespace RimworldRestApi.Hooks
                 }
             }
         }
+
+        /// <summary>
+        /// Mining, opened fog blockers and scenario reveals unfog cells one by one without
+        /// a flood fill, and refogging (e.g. on map generation) hides them again. Only the
+        /// cached full grid is dropped here; deltas pick these cells up when requested.
+        /// </summary>
+        [HarmonyPatch(typeof(FogGrid), nameof(FogGrid.Unfog))]
+        public static class UnfogPatch
+        {
+            static void Postfix(Map ___map)
+            {
+                InvalidateFog(___map);
+            }
+        }
+
+        [HarmonyPatch(typeof(FogGrid), nameof(FogGrid.Refog))]
+        public static class RefogPatch
+        {
+            static void Postfix(Map ___map)
+            {
+                InvalidateFog(___map);
+            }
+        }
+
+        private static void InvalidateFog(Map map)
+        {
+            try
+            {
+                if (map == null) return;
+                CacheInvalidationAccess.Invalidate(RIMAPI.Core.CacheTags.MapFog(map.uniqueID));
+            }
+            catch (Exception ex)
+            {
+                RIMAPI.Core.LogApi.Error($"[RimworldRestApi] Error invalidating fog cache: {ex}");
+            }
+        }
     }
 }
\ No newline at end of file
@@ -0,0 +1,45 @@
+using System;
+using HarmonyLib;
+using RIMAPI.Helpers;
+using Verse;
+
+namespace RimworldRestApi.Hooks
+{
+    /// <summary>
+    /// Keeps <see cref="ThingIdIndex"/> in sync with the things spawned on each map.
+    /// </summary>
+    public static class ThingIdIndexHooks
+    {
+        [HarmonyPatch(typeof(Thing), nameof(Thing.SpawnSetup))]
+        public static class ThingSpawnSetupPatch
+        {
+            static void Postfix(Thing __instance, Map map)
+            {
+                try
+                {
+                    ThingIdIndex.Add(__instance, map);
+                }
+                catch (Exception ex)
+                {
+                    RIMAPI.Core.LogApi.Error($"[RimworldRestApi] Error in ThingIdIndex spawn patch: {ex}");
+                }
+            }
+        }
+
+        [HarmonyPatch(typeof(Thing), nameof(Thing.DeSpawn))]
+        public static class ThingDeSpawnPatch
+        {
+            static void Prefix(Thing __instance)
+            {
+                try
+                {
+                    ThingIdIndex.Remove(__instance, __instance.Map);
+                }
+                catch (Exception ex)
+                {
+                    RIMAPI.Core.LogApi.Error($"[RimworldRestApi] Error in ThingIdIndex despawn patch: {ex}");
+                }
+            }
+        }
+    }
+}
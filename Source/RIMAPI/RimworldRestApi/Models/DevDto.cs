@@ -34,4 +34,65 @@ namespace RIMAPI.Models
     {
         public List<EndpointDto> Endpoints { get; set; }
     }
+
+    public class RouterBenchmarkDto
+    {
+        public int Routes { get; set; }
+        public int ParameterizedRoutes { get; set; }
+        public int Paths { get; set; }
+        public int Iterations { get; set; }
+        public double IndexedNsPerLookup { get; set; }
+        public double LinearRegexNsPerLookup { get; set; }
+        public double Speedup { get; set; }
+        public List<string> Mismatches { get; set; }
+    }
+
+    public class CacheExpirationBenchmarkDto
+    {
+        public int Rounds { get; set; }
+        public List<CacheExpirationBenchmarkRowDto> Rows { get; set; }
+    }
+
+    public class CacheExpirationBenchmarkRowDto
+    {
+        public int Entries { get; set; }
+        public int DueEntries { get; set; }
+        public int Removed { get; set; }
+        public double HeapLockMs { get; set; }
+        public double FullScanLockMs { get; set; }
+    }
+
+    public class SerializationBenchmarkDto
+    {
+        public int Items { get; set; }
+        public int Rounds { get; set; }
+        public List<SerializationBenchmarkRowDto> Rows { get; set; }
+    }
+
+    public class SerializationBenchmarkRowDto
+    {
+        public string Method { get; set; }
+        public long PayloadBytes { get; set; }
+        public double AvgMs { get; set; }
+        public long PeakHeapBytes { get; set; }
+        public int Gen0Collections { get; set; }
+        public int Gen1Collections { get; set; }
+        public int Gen2Collections { get; set; }
+    }
+
+    public class ThingIdIndexBenchmarkDto
+    {
+        public int MapId { get; set; }
+        public int Lookups { get; set; }
+        public double IndexBuildMs { get; set; }
+        public double LiveIndexAvgUs { get; set; }
+        public List<ThingIdIndexBenchmarkRowDto> Rows { get; set; }
+    }
+
+    public class ThingIdIndexBenchmarkRowDto
+    {
+        public int Things { get; set; }
+        public double ScanAvgUs { get; set; }
+        public double IndexAvgUs { get; set; }
+    }
 }
@@ -169,6 +169,32 @@ namespace RIMAPI.Models
         public int Width { get; set; }
         public int Height { get; set; }
         public string FogData { get; set; }
+
+        /// <summary>Encoding of FogData when requested with ?encoding= (varint, bitpacked or deflate).</summary>
+        public string Encoding { get; set; }
+
+        /// <summary>Game tick the grid was read at; pass it as since_tick to get later changes.</summary>
+        public int Tick { get; set; }
+    }
+
+    public class FogGridDeltaDto
+    {
+        public int MapId { get; set; }
+        public int Width { get; set; }
+        public int Height { get; set; }
+        public int SinceTick { get; set; }
+        public int Tick { get; set; }
+
+        /// <summary>True when the change history did not reach since_tick and FogData holds the full grid.</summary>
+        public bool Full { get; set; }
+        public string FogData { get; set; }
+        public string Encoding { get; set; }
+
+        /// <summary>Base64 little-endian Int32 indices of cells that became revealed.</summary>
+        public string Revealed { get; set; }
+
+        /// <summary>Base64 little-endian Int32 indices of cells that became fogged.</summary>
+        public string Fogged { get; set; }
     }
 
     public class CreateStockpileRequestDto
@@ -10,5 +10,12 @@ namespace RIMAPI.Models
         public List<int> Grid { get; set; }  // RLE compressed grid for terrain
         public List<string> FloorPalette { get; set; }  // Constructed floor types (wood, concrete, etc.)
         public List<int> FloorGrid { get; set; }  // RLE compressed grid for floors
+
+        // Set instead of Grid/FloorGrid when ?encoding= is varint, bitpacked or deflate
+        public string Encoding { get; set; }
+        public string GridData { get; set; }  // Base64 encoded grid
+        public string FloorGridData { get; set; }  // Base64 encoded floor grid
+        public int? BitsPerCell { get; set; }  // bitpacked only
+        public int? FloorBitsPerCell { get; set; }  // bitpacked only
     }
 }
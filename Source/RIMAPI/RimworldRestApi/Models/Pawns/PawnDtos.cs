@@ -1,4 +1,5 @@
 using System.Collections.Generic;
+using Newtonsoft.Json.Linq;
 
 namespace RIMAPI.Models
 {
@@ -50,6 +51,13 @@ namespace RIMAPI.Models
     }
 
 
+    public class PawnDetailsBatchDto
+    {
+        /// <summary>One object per found pawn: its <c>id</c> plus the requested fields.</summary>
+        public List<JObject> Pawns { get; set; }
+        public List<int> NotFound { get; set; }
+    }
+
     public class PawnDetailedRequestDto
     {
         public PawnDto Pawn { get; set; }
@@ -110,4 +110,45 @@ namespace RIMAPI.Models
         public bool MakePrisoner { get; set; }
         public bool ReleasePrisoner { get; set; }
     }
-}
\ No newline at end of file
+
+    // --- Batch ---
+    public class PawnEditBatchRequest
+    {
+        public List<PawnEditBatchItem> Pawns { get; set; }
+    }
+
+    /// <summary>
+    /// Any combination of the single edit requests for one pawn. The <c>pawn_id</c> of the
+    /// sections is ignored; sections are applied in declaration order.
+    /// </summary>
+    public class PawnEditBatchItem
+    {
+        public int PawnId { get; set; }
+        public PawnBasicRequest Basic { get; set; }
+        public PawnHealthRequest Health { get; set; }
+        public PawnNeedsRequest Needs { get; set; }
+        public PawnSkillsRequest Skills { get; set; }
+        public PawnTraitsRequest Traits { get; set; }
+        public PawnInventoryRequest Inventory { get; set; }
+        public PawnApparelRequest Apparel { get; set; }
+        public PawnStatusRequest Status { get; set; }
+        public PawnPositionRequest Position { get; set; }
+        public PawnFactionRequest Faction { get; set; }
+    }
+
+    public class PawnEditBatchResultDto
+    {
+        public int Succeeded { get; set; }
+        public int Failed { get; set; }
+        public List<PawnEditItemResultDto> Results { get; set; }
+    }
+
+    public class PawnEditItemResultDto
+    {
+        public int PawnId { get; set; }
+        public bool Success { get; set; }
+        public List<string> Applied { get; set; }
+        public string FailedSection { get; set; }
+        public string Error { get; set; }
+    }
+}
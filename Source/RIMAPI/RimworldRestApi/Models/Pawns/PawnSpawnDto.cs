@@ -1,3 +1,5 @@
+using System.Collections.Generic;
+
 namespace RIMAPI.Models
 {
     public class PawnSpawnRequestDto
@@ -38,5 +40,19 @@ namespace RIMAPI.Models
         public int PawnId { get; set; }
         public string Name { get; set; }
     }
-}
 
+    public class PawnSpawnBatchRequestDto
+    {
+        public List<PawnSpawnRequestDto> Pawns { get; set; }
+
+        // Optional squad for the spawned pawns. PawnIds are added to the spawned ones,
+        // Faction and MapId default to those of the first spawned pawn.
+        public LordCreateRequestDto Lord { get; set; }
+    }
+
+    public class PawnSpawnBatchDto
+    {
+        public List<PawnSpawnDto> Pawns { get; set; }
+        public LordCreateDto Lord { get; set; }
+    }
+}
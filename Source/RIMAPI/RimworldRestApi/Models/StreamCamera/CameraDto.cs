@@ -14,5 +14,8 @@ namespace RIMAPI.Models
         public int FrameHeight { get; set; }
         public int TargetFps { get; set; }
         public int JpegQuality { get; set; }
+
+        /// <summary>UDP packet format: 1 (legacy CAM header, default) or 2 (frame sequence and capture time).</summary>
+        public int ProtocolVersion { get; set; }
     }
 }
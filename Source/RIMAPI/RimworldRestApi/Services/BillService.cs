@@ -235,15 +235,7 @@ namespace RIMAPI.Services
 
         private Building_WorkTable FindWorkTable(int buildingId)
         {
-            foreach (var map in Find.Maps)
-            {
-                var building = map.listerBuildings.allBuildingsColonist
-                    .FirstOrDefault(b => b.thingIDNumber == buildingId);
-
-                if (building is Building_WorkTable wt)
-                    return wt;
-            }
-            return null;
+            return BuildingHelper.FindBuildingByID(buildingId) as Building_WorkTable;
         }
 
         private Bill_Production FindBill(Building_WorkTable workTable, int billId)
@@ -196,17 +196,13 @@ namespace RIMAPI.Services
                 {
                     return ApiResult.Fail($"Map with ID={mapId} not found");
                 }
-                Pawn pawn = map
-                    .listerThings.AllThings.OfType<Pawn>()
-                    .FirstOrDefault(p => p.thingIDNumber == pawnId);
+                Pawn pawn = ThingIdIndex.Get(map, pawnId) as Pawn;
                 if (pawn == null)
                 {
                     return ApiResult.Fail($"Pawn with ID={pawnId} not found");
                 }
 
-                Thing foundThing = map.listerThings.AllThings.FirstOrDefault(t =>
-                    t.thingIDNumber == equipmentId
-                );
+                Thing foundThing = ThingIdIndex.Get(map, equipmentId);
                 if (foundThing == null)
                 {
                     return ApiResult.Fail($"Thing with ID={equipmentId} not found");
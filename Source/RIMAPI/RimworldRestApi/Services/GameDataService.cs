@@ -593,9 +593,7 @@ namespace RIMAPI.Services
                 switch (objectType)
                 {
                     case "item":
-                        var item = Find
-                            .CurrentMap.listerThings.AllThings.Where(p => p.thingIDNumber == id)
-                            .FirstOrDefault();
+                        var item = ThingIdIndex.Get(Find.CurrentMap, id);
                         Find.Selector.Select(item);
                         break;
                     case "pawn":
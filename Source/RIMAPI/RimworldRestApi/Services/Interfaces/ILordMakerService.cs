@@ -1,10 +1,18 @@
 using RIMAPI.Core;
 using RIMAPI.Models;
+using RimWorld;
+using Verse;
 
 namespace RIMAPI.Services
 {
     public interface ILordMakerService
     {
         ApiResult<LordCreateDto> CreateLord(LordCreateRequestDto request);
+
+        /// <summary>
+        /// Creates a lord for <paramref name="faction"/> on <paramref name="map"/> unless the
+        /// request names its own faction or map.
+        /// </summary>
+        ApiResult<LordCreateDto> CreateLord(LordCreateRequestDto request, Faction faction, Map map);
     }
 }
\ No newline at end of file
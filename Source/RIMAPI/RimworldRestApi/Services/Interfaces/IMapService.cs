@@ -1,5 +1,6 @@
 using System.Collections.Generic;
 using RIMAPI.Core;
+using RIMAPI.Helpers;
 using RIMAPI.Models;
 using RIMAPI.Models.Map;
 
@@ -19,7 +20,7 @@ namespace RIMAPI.Services
         ApiResult<MapZonesDto> GetMapZones(int mapId);
         ApiResult<MapRoomsDto> GetMapRooms(int mapId);
         ApiResult<List<BuildingDto>> GetMapBuildings(int mapId);
-        ApiResult<MapTerrainDto> GetMapTerrain(int mapId);
+        ApiResult<MapTerrainDto> GetMapTerrain(int mapId, GridEncoding encoding = GridEncoding.Default);
         ApiResult<List<ThingDto>> GetMapThingsInRadius(int mapId, int x, int z, int radius);
         ApiResult SetWeather(int mapId, string defName);
         ApiResult<List<ThingDto>> GetThingsAtCell(ThingsAtCellRequestDto body);
@@ -29,7 +30,8 @@ namespace RIMAPI.Services
         ApiResult RepairThingsAtPositions(RepairPositionsRequestDto request);
         ApiResult RepairThingsInRect(RepairRectRequestDto request);
         ApiResult SpawnDropPod(SpawnDropPodRequestDto request);
-        ApiResult<FogGridDto> GetFogGrid(int mapId);
+        ApiResult<FogGridDto> GetFogGrid(int mapId, GridEncoding encoding = GridEncoding.Default);
+        ApiResult<FogGridDeltaDto> GetFogGridDelta(int mapId, int sinceTick, GridEncoding encoding = GridEncoding.Default);
         ApiResult<OreDataDto> GetMapOre(int mapId);
         ApiResult<GrowingZoneDto> CreateGrowingZone(CreateGrowingZoneRequestDto request);
         ApiResult<StockpileResponseDto> CreateStockpile(CreateStockpileRequestDto request);
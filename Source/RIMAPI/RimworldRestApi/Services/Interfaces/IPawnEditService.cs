@@ -23,5 +23,8 @@ namespace RIMAPI.Services
         ApiResult UpdateStatus(PawnStatusRequest request); // Draft, Kill, Resurrect
         ApiResult UpdatePosition(PawnPositionRequest request);
         ApiResult UpdateFaction(PawnFactionRequest request);
+
+        // Several pawns and sections in one call
+        ApiResult<PawnEditBatchResultDto> UpdateBatch(PawnEditBatchRequest request);
     }
 }
\ No newline at end of file
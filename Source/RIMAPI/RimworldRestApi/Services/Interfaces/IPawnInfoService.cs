@@ -12,6 +12,9 @@ namespace RIMAPI.Services
         // Get aggregated details
         ApiResult<PawnDetailedDto> GetPawnDetails(int pawnId);
 
+        // Details of several pawns in one pass, reduced to the requested fields (null for all)
+        ApiResult<PawnDetailsBatchDto> GetPawnsDetails(List<int> pawnIds, List<string> fields);
+
         // Specific data endpoints
         ApiResult<PawnInventoryDto> GetPawnInventory(int pawnId);
     }
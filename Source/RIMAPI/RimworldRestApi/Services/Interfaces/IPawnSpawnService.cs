@@ -6,5 +6,6 @@ namespace RIMAPI.Services
     public interface IPawnSpawnService
     {
         ApiResult<PawnSpawnDto> SpawnPawn(PawnSpawnRequestDto request);
+        ApiResult<PawnSpawnBatchDto> SpawnPawns(PawnSpawnBatchRequestDto request);
     }
 }
\ No newline at end of file
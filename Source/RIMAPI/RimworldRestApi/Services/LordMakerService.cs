@@ -13,11 +13,15 @@ namespace RIMAPI.Services
     public class LordMakerService : ILordMakerService
     {
         public ApiResult<LordCreateDto> CreateLord(LordCreateRequestDto request)
+        {
+            return CreateLord(request, Faction.OfPlayer, null);
+        }
+
+        public ApiResult<LordCreateDto> CreateLord(LordCreateRequestDto request, Faction faction, Map map)
         {
             try
             {
                 // 1. Resolve Map
-                Map map = null;
                 if (!string.IsNullOrEmpty(request.MapId) && int.TryParse(request.MapId, out int mapId))
                 {
                     map = MapHelper.GetMapByID(mapId);
@@ -26,7 +30,6 @@ namespace RIMAPI.Services
                 if (map == null) return ApiResult<LordCreateDto>.Fail("Could not determine map.");
 
                 // 2. Resolve Faction
-                Faction faction = Faction.OfPlayer;
                 if (!string.IsNullOrEmpty(request.Faction))
                 {
                     faction = Find.FactionManager.AllFactionsListForReading
@@ -90,9 +90,9 @@ namespace RIMAPI.Services
             return ApiResult<MapRoomsDto>.Ok(result);
         }
 
-        public ApiResult<MapTerrainDto> GetMapTerrain(int mapId)
+        public ApiResult<MapTerrainDto> GetMapTerrain(int mapId, GridEncoding encoding = GridEncoding.Default)
         {
-            var result = MapHelper.GetMapTerrain(mapId);
+            var result = MapHelper.GetMapTerrain(mapId, encoding);
             return ApiResult<MapTerrainDto>.Ok(result);
         }
 
@@ -470,55 +470,24 @@ namespace RIMAPI.Services
             }
         }
 
-        public ApiResult<FogGridDto> GetFogGrid(int mapId)
+        public ApiResult<FogGridDto> GetFogGrid(int mapId, GridEncoding encoding = GridEncoding.Default)
         {
             try
             {
                 var map = MapHelper.GetMapByID(mapId);
                 if (map == null) return ApiResult<FogGridDto>.Fail($"Map {mapId} not found.");
 
-                int totalCells = map.cellIndices.NumGridCells;
-                FogGrid fogGrid = map.fogGrid;
-
-                // RLE Compression Logic
-                // We store pairs of counts: [Count Revealed, Count Fogged, Count Revealed...]
-                // Since it's binary data, we don't need to store the value, just the alternating counts.
-                // We assume the starting state is "Revealed" (false). If grid starts with Fogged, the first count is 0.
-
-                var rleCounts = new List<int>();
-                bool currentVal = false; // "false" = Revealed (IsFogged == false)
-                int runLength = 0;
-
-                for (int i = 0; i < totalCells; i++)
-                {
-                    // Note: fogGrid.IsFogged(i) returns true if HIDDEN
-                    bool isFogged = fogGrid.IsFogged(i);
-
-                    if (isFogged == currentVal)
-                    {
-                        runLength++;
-                    }
-                    else
-                    {
-                        rleCounts.Add(runLength);
-                        currentVal = !currentVal; // Flip state
-                        runLength = 1;
-                    }
-                }
-                rleCounts.Add(runLength); // Add the final run
-
-                // Optimize: Convert List<int> to Base64 String to save network bandwidth
-                // Ints take 4 bytes. We convert the list to a byte array, then Base64 it.
-                byte[] byteArray = new byte[rleCounts.Count * 4];
-                Buffer.BlockCopy(rleCounts.ToArray(), 0, byteArray, 0, byteArray.Length);
-                string base64Data = Convert.ToBase64String(byteArray);
+                // Serving a full grid starts the change history used by since_tick requests
+                FogChangeTracker.Track(map);
 
                 var fogGridDto = new FogGridDto
                 {
                     MapId = map.uniqueID,
                     Width = map.Size.x,
                     Height = map.Size.z,
-                    FogData = base64Data
+                    FogData = EncodeFogGrid(map, encoding),
+                    Encoding = encoding == GridEncoding.Default ? null : GridEncodingHelper.ToName(encoding),
+                    Tick = Find.TickManager.TicksGame
                 };
 
                 return ApiResult<FogGridDto>.Ok(fogGridDto);
@@ -530,6 +499,114 @@ namespace RIMAPI.Services
             }
         }
 
+        public ApiResult<FogGridDeltaDto> GetFogGridDelta(int mapId, int sinceTick, GridEncoding encoding = GridEncoding.Default)
+        {
+            try
+            {
+                var map = MapHelper.GetMapByID(mapId);
+                if (map == null) return ApiResult<FogGridDeltaDto>.Fail($"Map {mapId} not found.");
+
+                var delta = new FogGridDeltaDto
+                {
+                    MapId = map.uniqueID,
+                    Width = map.Size.x,
+                    Height = map.Size.z,
+                    SinceTick = sinceTick,
+                    Tick = Find.TickManager.TicksGame
+                };
+
+                if (!FogChangeTracker.TryGetChangedSince(map, sinceTick, out var changedCells))
+                {
+                    // History is gone (or never started); the client has to resync from a full grid
+                    FogChangeTracker.Track(map);
+                    delta.Full = true;
+                    delta.FogData = EncodeFogGrid(map, encoding);
+                    delta.Encoding = encoding == GridEncoding.Default ? null : GridEncodingHelper.ToName(encoding);
+                    return ApiResult<FogGridDeltaDto>.Ok(delta);
+                }
+
+                // Report the current state of each changed cell, so replaying a delta twice is harmless
+                var revealed = new List<int>();
+                var fogged = new List<int>();
+                FogGrid fogGrid = map.fogGrid;
+                foreach (int cell in changedCells)
+                {
+                    if (fogGrid.IsFogged(cell)) fogged.Add(cell);
+                    else revealed.Add(cell);
+                }
+                revealed.Sort();
+                fogged.Sort();
+
+                delta.Revealed = EncodeInt32Array(revealed);
+                delta.Fogged = EncodeInt32Array(fogged);
+                return ApiResult<FogGridDeltaDto>.Ok(delta);
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"Error getting fog grid delta: {ex}");
+                return ApiResult<FogGridDeltaDto>.Fail(ex.Message);
+            }
+        }
+
+        private static string EncodeFogGrid(Map map, GridEncoding encoding)
+        {
+            int totalCells = map.cellIndices.NumGridCells;
+            FogGrid fogGrid = map.fogGrid;
+
+            if (encoding == GridEncoding.BitPacked)
+            {
+                // 1 bit per cell, set when fogged, least significant bit first
+                var packed = new byte[(totalCells + 7) / 8];
+                for (int i = 0; i < totalCells; i++)
+                {
+                    if (fogGrid.IsFogged(i))
+                        packed[i >> 3] |= (byte)(1 << (i & 7));
+                }
+                return Convert.ToBase64String(packed);
+            }
+
+            // RLE Compression Logic
+            // We store pairs of counts: [Count Revealed, Count Fogged, Count Revealed...]
+            // Since it's binary data, we don't need to store the value, just the alternating counts.
+            // We assume the starting state is "Revealed" (false). If grid starts with Fogged, the first count is 0.
+
+            var rleCounts = new List<int>();
+            bool currentVal = false; // "false" = Revealed (IsFogged == false)
+            int runLength = 0;
+
+            for (int i = 0; i < totalCells; i++)
+            {
+                // Note: fogGrid.IsFogged(i) returns true if HIDDEN
+                bool isFogged = fogGrid.IsFogged(i);
+
+                if (isFogged == currentVal)
+                {
+                    runLength++;
+                }
+                else
+                {
+                    rleCounts.Add(runLength);
+                    currentVal = !currentVal; // Flip state
+                    runLength = 1;
+                }
+            }
+            rleCounts.Add(runLength); // Add the final run
+
+            if (encoding != GridEncoding.Default)
+                return GridEncodingHelper.EncodeRuns(rleCounts, encoding);
+
+            return EncodeInt32Array(rleCounts);
+        }
+
+        private static string EncodeInt32Array(List<int> values)
+        {
+            // Optimize: Convert List<int> to Base64 String to save network bandwidth
+            // Ints take 4 bytes. We convert the list to a byte array, then Base64 it.
+            byte[] byteArray = new byte[values.Count * 4];
+            Buffer.BlockCopy(values.ToArray(), 0, byteArray, 0, byteArray.Length);
+            return Convert.ToBase64String(byteArray);
+        }
+
         public ApiResult<StockpileResponseDto> CreateStockpile(CreateStockpileRequestDto request)
         {
             try
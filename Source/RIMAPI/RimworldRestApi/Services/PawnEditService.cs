@@ -20,6 +20,12 @@ namespace RIMAPI.Services
             return pawn;
         }
 
+        // The colonist lists and per-pawn entries are cached until a pawn changes
+        private static void InvalidatePawn(Pawn pawn)
+        {
+            CacheInvalidationAccess.Invalidate(CacheTags.Colonists, CacheTags.Pawn(pawn.thingIDNumber));
+        }
+
         public ApiResult UpdateBasicInfo(PawnBasicRequest request)
         {
             try
@@ -54,6 +60,7 @@ namespace RIMAPI.Services
                         pawn.ageTracker.AgeChronologicalTicks = (long)request.ChronologicalAge.Value * 3600000L;
                 }
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -85,6 +92,7 @@ namespace RIMAPI.Services
                     }
                 }
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -113,6 +121,7 @@ namespace RIMAPI.Services
                     if (pawn.needs.joy != null) pawn.needs.joy.CurLevelPercentage = Mathf.Clamp01(request.Mood.Value);
                 }
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -144,6 +153,7 @@ namespace RIMAPI.Services
                         record.passion = (Passion)skillDto.Passion;
                     }
                 }
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -181,6 +191,7 @@ namespace RIMAPI.Services
                         }
                     }
                 }
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -211,6 +222,7 @@ namespace RIMAPI.Services
                         }
                     }
                 }
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -233,6 +245,7 @@ namespace RIMAPI.Services
                 // Note: Adding specific equipped items is complex because of layers/slots, 
                 // sticking to Drop/Clear for now unless specific logic requested.
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -252,6 +265,7 @@ namespace RIMAPI.Services
                     pawn.drafter.Drafted = request.IsDrafted.Value;
                 }
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -275,6 +289,7 @@ namespace RIMAPI.Services
                     IntVec3 pos = new IntVec3(request.Position.X, request.Position.Y, request.Position.Z);
                     TeleportPawn(pawn, pos, map);
                 }
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
@@ -305,11 +320,127 @@ namespace RIMAPI.Services
                     if (request.ReleasePrisoner && pawn.IsPrisoner) pawn.guest.SetGuestStatus(null, GuestStatus.Guest);
                 }
 
+                InvalidatePawn(pawn);
                 return ApiResult.Ok();
             }
             catch (Exception ex) { return ApiResult.Fail(ex.Message); }
         }
 
+        public ApiResult<PawnEditBatchResultDto> UpdateBatch(PawnEditBatchRequest request)
+        {
+            var batch = new PawnEditBatchResultDto { Results = new List<PawnEditItemResultDto>(request.Pawns.Count) };
+            var warnings = new List<string>();
+            var invalidate = new List<string> { CacheTags.Colonists };
+
+            foreach (var item in request.Pawns)
+            {
+                var result = new PawnEditItemResultDto { PawnId = item.PawnId, Applied = new List<string>() };
+                batch.Results.Add(result);
+
+                if (PawnHelper.FindPawnById(item.PawnId) == null)
+                {
+                    result.Error = $"Pawn with ID {item.PawnId} not found.";
+                }
+                else
+                {
+                    invalidate.Add(CacheTags.Pawn(item.PawnId));
+
+                    // Sections run in order and the item stops at the first failure; the game
+                    // has no way to undo the sections that were already applied
+                    foreach (var section in GetSections(item))
+                    {
+                        ApiResult sectionResult = section.Value();
+                        if (!sectionResult.Success)
+                        {
+                            result.FailedSection = section.Key;
+                            result.Error = string.Join("; ", sectionResult.Errors);
+                            break;
+                        }
+                        result.Applied.Add(section.Key);
+                    }
+                }
+
+                result.Success = result.Error == null;
+                if (result.Success)
+                {
+                    batch.Succeeded++;
+                }
+                else
+                {
+                    batch.Failed++;
+                    warnings.Add(result.FailedSection == null
+                        ? result.Error
+                        : $"Pawn {item.PawnId} {result.FailedSection}: {result.Error}");
+                }
+            }
+
+            CacheInvalidationAccess.Invalidate(invalidate.ToArray());
+
+            return warnings.Count == 0
+                ? ApiResult<PawnEditBatchResultDto>.Ok(batch)
+                : ApiResult<PawnEditBatchResultDto>.Partial(batch, warnings);
+        }
+
+        private IEnumerable<KeyValuePair<string, Func<ApiResult>>> GetSections(PawnEditBatchItem item)
+        {
+            int id = item.PawnId;
+            if (item.Basic != null)
+            {
+                item.Basic.PawnId = id;
+                yield return Section("basic", () => UpdateBasicInfo(item.Basic));
+            }
+            if (item.Health != null)
+            {
+                item.Health.PawnId = id;
+                yield return Section("health", () => UpdateHealth(item.Health));
+            }
+            if (item.Needs != null)
+            {
+                item.Needs.PawnId = id;
+                yield return Section("needs", () => UpdateNeeds(item.Needs));
+            }
+            if (item.Skills != null)
+            {
+                item.Skills.PawnId = id;
+                yield return Section("skills", () => UpdateSkills(item.Skills));
+            }
+            if (item.Traits != null)
+            {
+                item.Traits.PawnId = id;
+                yield return Section("traits", () => UpdateTraits(item.Traits));
+            }
+            if (item.Inventory != null)
+            {
+                item.Inventory.PawnId = id;
+                yield return Section("inventory", () => UpdateInventory(item.Inventory));
+            }
+            if (item.Apparel != null)
+            {
+                item.Apparel.PawnId = id;
+                yield return Section("apparel", () => UpdateApparel(item.Apparel));
+            }
+            if (item.Status != null)
+            {
+                item.Status.PawnId = id;
+                yield return Section("status", () => UpdateStatus(item.Status));
+            }
+            if (item.Position != null)
+            {
+                item.Position.PawnId = id;
+                yield return Section("position", () => UpdatePosition(item.Position));
+            }
+            if (item.Faction != null)
+            {
+                item.Faction.PawnId = id;
+                yield return Section("faction", () => UpdateFaction(item.Faction));
+            }
+        }
+
+        private static KeyValuePair<string, Func<ApiResult>> Section(string name, Func<ApiResult> apply)
+        {
+            return new KeyValuePair<string, Func<ApiResult>>(name, apply);
+        }
+
         // Reuse existing teleport logic
         private static void TeleportPawn(Pawn pawn, IntVec3 newPosition, Map map)
         {
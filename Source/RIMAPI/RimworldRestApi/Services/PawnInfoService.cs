@@ -4,6 +4,7 @@ using System.Linq;
 using RIMAPI.Core;
 using RIMAPI.Helpers;
 using RIMAPI.Models;
+using Newtonsoft.Json.Linq;
 using RimWorld;
 using UnityEngine;
 using Verse;
@@ -54,6 +55,43 @@ namespace RIMAPI.Services
             }
         }
 
+        public ApiResult<PawnDetailsBatchDto> GetPawnsDetails(List<int> pawnIds, List<string> fields)
+        {
+            var sections = fields == null ? null : FieldProjection.GetSections(fields);
+            var batch = new PawnDetailsBatchDto
+            {
+                Pawns = new List<JObject>(pawnIds.Count),
+                NotFound = new List<int>(),
+            };
+            var warnings = new List<string>();
+
+            foreach (int pawnId in pawnIds)
+            {
+                var pawn = PawnHelper.FindPawnById(pawnId);
+                if (pawn == null)
+                {
+                    batch.NotFound.Add(pawnId);
+                    warnings.Add($"Pawn {pawnId} not found.");
+                    continue;
+                }
+
+                try
+                {
+                    var details = FieldProjection.Project(MapPawnToDetails(pawn, sections), fields);
+                    details.AddFirst(new JProperty("id", pawnId));
+                    batch.Pawns.Add(details);
+                }
+                catch (Exception ex)
+                {
+                    warnings.Add($"Pawn {pawnId}: {ex.Message}");
+                }
+            }
+
+            return warnings.Count == 0
+                ? ApiResult<PawnDetailsBatchDto>.Ok(batch)
+                : ApiResult<PawnDetailsBatchDto>.Partial(batch, warnings);
+        }
+
         public ApiResult<PawnInventoryDto> GetPawnInventory(int pawnId)
         {
             try
@@ -73,6 +111,42 @@ namespace RIMAPI.Services
 
         // --- Internal Mappers ---
 
+        /// <summary>
+        /// Same shape as <c>/api/v1/colonist/detailed</c>, building only the requested sections
+        /// (all when <paramref name="sections"/> is null). Sections a pawn lacks, such as skills
+        /// for animals, are left out.
+        /// </summary>
+        private ApiV1PawnDetailedDto MapPawnToDetails(Pawn pawn, HashSet<string> sections)
+        {
+            bool Wants(string section) => sections == null || sections.Contains(section);
+
+            var needs = pawn.needs;
+            var dto = new ApiV1PawnDetailedDto
+            {
+                BodySize = pawn.BodySize,
+                Sleep = needs?.rest?.CurLevel ?? 0,
+                Comfort = needs?.comfort?.CurLevel ?? 0,
+                Beauty = needs?.beauty?.CurLevel ?? 0,
+                Joy = needs?.joy?.CurLevel ?? 0,
+                Energy = needs?.energy?.CurLevel ?? 0,
+                DrugsDesire = needs?.drugsDesire?.CurLevel ?? 0,
+                SurroundingBeauty = needs?.beauty?.CurLevel ?? 0,
+                FreshAir = needs?.outdoors?.CurLevel ?? 0,
+            };
+
+            if (Wants("colonist"))
+                dto.Colonist = PawnHelper.PawnToDto(pawn);
+            if (Wants("colonist_work_info") && pawn.skills != null)
+                dto.ColonistWorkInfo = PawnHelper.GetWorkInfo(pawn);
+            if (Wants("policies_info") && pawn.playerSettings != null)
+                dto.PoliciesInfo = PawnHelper.GetPoliciesInfo(pawn);
+            if (Wants("colonist_medical_info"))
+                dto.ColonistMedicalInfo = PawnHelper.GetMedicalInfo(pawn);
+            if (Wants("social_info") && pawn.relations != null)
+                dto.SocialInfo = PawnHelper.CreatePawnSocialInfoDto(pawn);
+            return dto;
+        }
+
         private PawnDto MapPawnToSummary(Pawn pawn)
         {
             return new PawnDto
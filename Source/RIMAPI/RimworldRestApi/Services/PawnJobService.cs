@@ -33,13 +33,7 @@ namespace RIMAPI.Services
 
                 if (request.TargetThingId.HasValue)
                 {
-                    Thing thing = null;
-                    foreach (Map map in Find.Maps)
-                    {
-                        thing = map.listerThings.AllThings
-                            .FirstOrDefault(t => t.thingIDNumber == request.TargetThingId.Value);
-                        if (thing != null) break;
-                    }
+                    Thing thing = ThingIdIndex.Get(request.TargetThingId.Value);
                     if (thing == null)
                     {
                         return ApiResult.Fail($"Target thing not found: {request.TargetThingId}");
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Linq;
 using RIMAPI.Core;
 using RIMAPI.Helpers;
@@ -11,7 +12,12 @@ namespace RIMAPI.Services
 {
     public class PawnSpawnService : IPawnSpawnService
     {
-        public PawnSpawnService() { }
+        private readonly ILordMakerService _lordMakerService;
+
+        public PawnSpawnService(ILordMakerService lordMakerService)
+        {
+            _lordMakerService = lordMakerService;
+        }
 
         public ApiResult<PawnSpawnDto> SpawnPawn(PawnSpawnRequestDto request)
         {
@@ -19,143 +25,225 @@ namespace RIMAPI.Services
             {
                 LogApi.Info($"[SpawnPawn] Starting generation for Kind: {request.PawnKind}");
 
-                // 1. Resolve Map
-                Map map = null;
-                if (!string.IsNullOrEmpty(request.MapId) && int.TryParse(request.MapId, out int mapId))
-                {
-                    map = MapHelper.GetMapByID(mapId);
-                }
-                if (map == null) map = Find.CurrentMap;
-                if (map == null) return ApiResult<PawnSpawnDto>.Fail("No valid map found to spawn pawn.");
+                string error = TrySpawn(request, out Pawn pawn);
+                if (error != null)
+                    return ApiResult<PawnSpawnDto>.Fail(error);
 
-                // 2. Resolve PawnKindDef
-                PawnKindDef kindDef = PawnKindDefOf.Colonist;
-                if (!string.IsNullOrEmpty(request.PawnKind))
-                {
-                    kindDef = DefDatabase<PawnKindDef>.GetNamedSilentFail(request.PawnKind);
-                    if (kindDef == null)
-                        return ApiResult<PawnSpawnDto>.Fail($"Invalid PawnKind: {request.PawnKind}");
-                }
+                // FIX: Log using Label, not Name (Name can be null)
+                LogApi.Info($"[SpawnPawn] Successfully spawned {pawn.Label} (ID: {pawn.thingIDNumber}) at {pawn.Position}");
+
+                return ApiResult<PawnSpawnDto>.Ok(ToDto(pawn));
+            }
+            catch (Exception ex)
+            {
+                LogApi.Error($"Error spawning pawn: {ex}");
+                return ApiResult<PawnSpawnDto>.Fail($"Failed to spawn pawn: {ex.Message}");
+            }
+        }
 
-                // 3. Resolve Faction
-                Faction faction = Faction.OfPlayer;
-                PawnGenerationContext context = PawnGenerationContext.PlayerStarter;
+        public ApiResult<PawnSpawnBatchDto> SpawnPawns(PawnSpawnBatchRequestDto request)
+        {
+            var batch = new PawnSpawnBatchDto { Pawns = new List<PawnSpawnDto>(request.Pawns.Count) };
+            var warnings = new List<string>();
+            var spawned = new List<Pawn>(request.Pawns.Count);
 
-                if (!string.IsNullOrEmpty(request.Faction))
+            for (int i = 0; i < request.Pawns.Count; i++)
+            {
+                try
                 {
-                    if (request.Faction.Equals("Player", StringComparison.OrdinalIgnoreCase) ||
-                        request.Faction.Equals("PlayerColony", StringComparison.OrdinalIgnoreCase))
+                    string error = TrySpawn(request.Pawns[i] ?? new PawnSpawnRequestDto(), out Pawn pawn);
+                    if (error != null)
                     {
-                        faction = Faction.OfPlayer;
-                        context = PawnGenerationContext.PlayerStarter;
-                    }
-                    else
-                    {
-                        faction = Find.FactionManager.AllFactionsListForReading
-                            .FirstOrDefault(f => f.def.defName == request.Faction || f.Name == request.Faction);
-
-                        context = PawnGenerationContext.NonPlayer;
+                        warnings.Add($"Pawn {i}: {error}");
+                        continue;
                     }
+                    spawned.Add(pawn);
+                    batch.Pawns.Add(ToDto(pawn));
                 }
-
-                // 4. Resolve Xenotype
-                XenotypeDef xenotype = null;
-                if (ModsConfig.BiotechActive && !string.IsNullOrEmpty(request.Xenotype))
+                catch (Exception ex)
                 {
-                    xenotype = DefDatabase<XenotypeDef>.GetNamedSilentFail(request.Xenotype);
+                    LogApi.Error($"Error spawning pawn {i} of batch: {ex}");
+                    warnings.Add($"Pawn {i}: Failed to spawn pawn: {ex.Message}");
                 }
+            }
+            // One summary line instead of two log lines per pawn
+            LogApi.Info($"[SpawnPawn] Spawned {spawned.Count} of {request.Pawns.Count} pawns");
 
-                // 5. Build Generation Request
-                PawnGenerationRequest genRequest = new PawnGenerationRequest(
-                    kind: kindDef,
-                    faction: faction,
-                    context: context,
-                    tile: -1,
-                    forceGenerateNewPawn: true,
-                    allowDead: request.AllowDead,
-                    allowDowned: request.AllowDowned,
-                    canGeneratePawnRelations: request.CanGeneratePawnRelations,
-                    mustBeCapableOfViolence: request.MustBeCapableOfViolence,
-                    colonistRelationChanceFactor: 1f,
-                    forceAddFreeWarmLayerIfNeeded: false,
-                    allowGay: request.AllowGay,
-                    allowPregnant: request.AllowPregnant,
-                    allowFood: request.AllowFood,
-                    allowAddictions: request.AllowAddictions,
-                    inhabitant: request.Inhabitant,
-                    certainlyBeenInCryptosleep: false,
-                    forceRedressWorldPawnIfFormerColonist: false,
-                    worldPawnFactionDoesntMatter: false,
-                    biocodeWeaponChance: 0f,
-                    biocodeApparelChance: 0f,
-                    extraPawnForExtraRelationChance: null,
-                    relationWithExtraPawnChanceFactor: 1f,
-                    validatorPreGear: null,
-                    validatorPostGear: null,
-                    forcedTraits: null,
-                    prohibitedTraits: null,
-                    minChanceToRedressWorldPawn: null,
-                    fixedBiologicalAge: request.BiologicalAge > 0 ? request.BiologicalAge : (float?)null,
-                    fixedChronologicalAge: request.ChronologicalAge > 0 ? request.ChronologicalAge : (float?)null,
-                    fixedGender: ParseGender(request.Gender),
-                    fixedLastName: null,
-                    fixedBirthName: null,
-                    fixedTitle: null,
-                    forcedXenotype: xenotype
-                );
-
-                // 6. Generate
-                Pawn pawn = PawnGenerator.GeneratePawn(genRequest);
-
-                // 7. Apply Name Overrides (SAFE VERSION)
-                if (!string.IsNullOrEmpty(request.FirstName) || !string.IsNullOrEmpty(request.NickName) || !string.IsNullOrEmpty(request.LastName))
-                {
-                    // FIX: Handle case where pawn.Name is null (Mechanoids) to avoid crash
-                    string currentName = pawn.Name?.ToStringShort ?? pawn.Label;
+            if (spawned.Count == 0)
+                return ApiResult<PawnSpawnBatchDto>.Fail("No pawns could be spawned: " + string.Join("; ", warnings));
 
-                    string first = !string.IsNullOrEmpty(request.FirstName) ? request.FirstName : currentName;
-                    string last = !string.IsNullOrEmpty(request.LastName) ? request.LastName : "";
-                    string nick = !string.IsNullOrEmpty(request.NickName) ? request.NickName : first;
+            if (request.Lord != null)
+            {
+                var lordRequest = request.Lord;
+                var pawnIds = batch.Pawns.Select(p => p.PawnId).ToList();
+                if (lordRequest.PawnIds != null)
+                    pawnIds.AddRange(lordRequest.PawnIds);
+                lordRequest.PawnIds = pawnIds;
 
-                    pawn.Name = new NameTriple(first, nick, last);
+                // A lord belongs to one faction on one map; the Faction object is passed on
+                // since def names are shared by several factions
+                Faction faction = spawned[0].Faction;
+                Map map = spawned[0].Map;
+                if (spawned.Any(p => p.Faction != faction || p.Map != map))
+                {
+                    warnings.Add("Lord: The spawned pawns differ in faction or map, no lord was created.");
                 }
-
-                // 8. Determine Spawn Position
-                IntVec3 spawnPos;
-                if (request.Position != null)
+                else if (faction == null && string.IsNullOrEmpty(lordRequest.Faction))
                 {
-                    spawnPos = new IntVec3(request.Position.X, request.Position.Y, request.Position.Z);
-                    spawnPos = spawnPos.ClampInsideMap(map);
+                    warnings.Add("Lord: The spawned pawns have no faction, no lord was created.");
                 }
                 else
                 {
-                    RCellFinder.TryFindRandomPawnEntryCell(out spawnPos, map, 0.5f);
+                    var lordResult = _lordMakerService.CreateLord(lordRequest, faction, map);
+                    if (lordResult.Success)
+                        batch.Lord = lordResult.Data;
+                    else
+                        warnings.AddRange(lordResult.Errors.Select(e => $"Lord: {e}"));
                 }
+            }
+
+            return warnings.Count == 0
+                ? ApiResult<PawnSpawnBatchDto>.Ok(batch)
+                : ApiResult<PawnSpawnBatchDto>.Partial(batch, warnings);
+        }
+
+        /// <summary>
+        /// Generates and spawns one pawn. Returns an error message for invalid requests.
+        /// </summary>
+        private string TrySpawn(PawnSpawnRequestDto request, out Pawn pawn)
+        {
+            pawn = null;
 
-                if (!spawnPos.Standable(map))
+            // 1. Resolve Map
+            Map map = null;
+            if (!string.IsNullOrEmpty(request.MapId) && int.TryParse(request.MapId, out int mapId))
+            {
+                map = MapHelper.GetMapByID(mapId);
+            }
+            if (map == null) map = Find.CurrentMap;
+            if (map == null) return "No valid map found to spawn pawn.";
+
+            // 2. Resolve PawnKindDef
+            PawnKindDef kindDef = PawnKindDefOf.Colonist;
+            if (!string.IsNullOrEmpty(request.PawnKind))
+            {
+                kindDef = DefDatabase<PawnKindDef>.GetNamedSilentFail(request.PawnKind);
+                if (kindDef == null)
+                    return $"Invalid PawnKind: {request.PawnKind}";
+            }
+
+            // 3. Resolve Faction
+            Faction faction = Faction.OfPlayer;
+            PawnGenerationContext context = PawnGenerationContext.PlayerStarter;
+
+            if (!string.IsNullOrEmpty(request.Faction))
+            {
+                if (request.Faction.Equals("Player", StringComparison.OrdinalIgnoreCase) ||
+                    request.Faction.Equals("PlayerColony", StringComparison.OrdinalIgnoreCase))
                 {
-                    CellFinder.TryFindRandomCellNear(spawnPos, map, 5, (IntVec3 c) => c.Standable(map), out spawnPos);
+                    faction = Faction.OfPlayer;
+                    context = PawnGenerationContext.PlayerStarter;
                 }
+                else
+                {
+                    faction = Find.FactionManager.AllFactionsListForReading
+                        .FirstOrDefault(f => f.def.defName == request.Faction || f.Name == request.Faction);
 
-                // 9. Spawn
-                GenSpawn.Spawn(pawn, spawnPos, map, WipeMode.Vanish);
+                    context = PawnGenerationContext.NonPlayer;
+                }
+            }
 
-                // FIX: Log using Label, not Name (Name can be null)
-                LogApi.Info($"[SpawnPawn] Successfully spawned {pawn.Label} (ID: {pawn.thingIDNumber}) at {spawnPos}");
+            // 4. Resolve Xenotype
+            XenotypeDef xenotype = null;
+            if (ModsConfig.BiotechActive && !string.IsNullOrEmpty(request.Xenotype))
+            {
+                xenotype = DefDatabase<XenotypeDef>.GetNamedSilentFail(request.Xenotype);
+            }
 
-                var result = new PawnSpawnDto
-                {
-                    PawnId = pawn.thingIDNumber,
-                    Name = pawn.Name != null ? pawn.Name.ToStringShort : pawn.Label,
-                };
+            // 5. Build Generation Request
+            PawnGenerationRequest genRequest = new PawnGenerationRequest(
+                kind: kindDef,
+                faction: faction,
+                context: context,
+                tile: -1,
+                forceGenerateNewPawn: true,
+                allowDead: request.AllowDead,
+                allowDowned: request.AllowDowned,
+                canGeneratePawnRelations: request.CanGeneratePawnRelations,
+                mustBeCapableOfViolence: request.MustBeCapableOfViolence,
+                colonistRelationChanceFactor: 1f,
+                forceAddFreeWarmLayerIfNeeded: false,
+                allowGay: request.AllowGay,
+                allowPregnant: request.AllowPregnant,
+                allowFood: request.AllowFood,
+                allowAddictions: request.AllowAddictions,
+                inhabitant: request.Inhabitant,
+                certainlyBeenInCryptosleep: false,
+                forceRedressWorldPawnIfFormerColonist: false,
+                worldPawnFactionDoesntMatter: false,
+                biocodeWeaponChance: 0f,
+                biocodeApparelChance: 0f,
+                extraPawnForExtraRelationChance: null,
+                relationWithExtraPawnChanceFactor: 1f,
+                validatorPreGear: null,
+                validatorPostGear: null,
+                forcedTraits: null,
+                prohibitedTraits: null,
+                minChanceToRedressWorldPawn: null,
+                fixedBiologicalAge: request.BiologicalAge > 0 ? request.BiologicalAge : (float?)null,
+                fixedChronologicalAge: request.ChronologicalAge > 0 ? request.ChronologicalAge : (float?)null,
+                fixedGender: ParseGender(request.Gender),
+                fixedLastName: null,
+                fixedBirthName: null,
+                fixedTitle: null,
+                forcedXenotype: xenotype
+            );
+
+            // 6. Generate
+            pawn = PawnGenerator.GeneratePawn(genRequest);
+
+            // 7. Apply Name Overrides (SAFE VERSION)
+            if (!string.IsNullOrEmpty(request.FirstName) || !string.IsNullOrEmpty(request.NickName) || !string.IsNullOrEmpty(request.LastName))
+            {
+                // FIX: Handle case where pawn.Name is null (Mechanoids) to avoid crash
+                string currentName = pawn.Name?.ToStringShort ?? pawn.Label;
+
+                string first = !string.IsNullOrEmpty(request.FirstName) ? request.FirstName : currentName;
+                string last = !string.IsNullOrEmpty(request.LastName) ? request.LastName : "";
+                string nick = !string.IsNullOrEmpty(request.NickName) ? request.NickName : first;
 
-                return ApiResult<PawnSpawnDto>.Ok(result);
+                pawn.Name = new NameTriple(first, nick, last);
             }
-            catch (Exception ex)
+
+            // 8. Determine Spawn Position
+            IntVec3 spawnPos;
+            if (request.Position != null)
             {
-                LogApi.Error($"Error spawning pawn: {ex}");
-                return ApiResult<PawnSpawnDto>.Fail($"Failed to spawn pawn: {ex.Message}");
+                spawnPos = new IntVec3(request.Position.X, request.Position.Y, request.Position.Z);
+                spawnPos = spawnPos.ClampInsideMap(map);
+            }
+            else
+            {
+                RCellFinder.TryFindRandomPawnEntryCell(out spawnPos, map, 0.5f);
             }
+
+            if (!spawnPos.Standable(map))
+            {
+                CellFinder.TryFindRandomCellNear(spawnPos, map, 5, (IntVec3 c) => c.Standable(map), out spawnPos);
+            }
+
+            // 9. Spawn
+            GenSpawn.Spawn(pawn, spawnPos, map, WipeMode.Vanish);
+            return null;
+        }
+
+        private static PawnSpawnDto ToDto(Pawn pawn)
+        {
+            return new PawnSpawnDto
+            {
+                PawnId = pawn.thingIDNumber,
+                Name = pawn.Name != null ? pawn.Name.ToStringShort : pawn.Label,
+            };
         }
 
         private Gender? ParseGender(string genderStr)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+UDP camera stream benchmark: receiver throughput against a local sender.
+
+A sender process replays the CAM packet format of UdpCameraStream.CreateDataPacket
+over localhost as fast as it can (or at --fps) and two receivers are measured
+in turn:
+  legacy   the previous camera_streaming_client logic: recvfrom, frames keyed
+           by the current second, b"".join of the chunks
+  current  camera_streaming_client.RimWorldStreamReceiver: recvfrom_into,
+           pooled frame buffers, latest-frame-wins decoding on a worker thread
+
+The sender rotates through a few distinct frames. Every reassembled frame is checked against them, so frames stitched together
+from chunks of different frames show up as corrupt. Frames are random bytes by
+default, so the numbers are pure reassembly throughput; with --decode jpeg
+(needs opencv-python) frames are real JPEGs decoded with cv2.imdecode.
+"valid" counts frames that passed the check (for the current receiver only the
+newest complete frame is checked, the rest are skipped).
+
+With --protocol 2 the sender uses the v2 header (frame sequence and capture
+time) and the receiver's latency, loss and reorder statistics are printed.
+
+Usage:
+    python camera_stream_benchmark.py
+    python camera_stream_benchmark.py --frame-kb 300 --duration 5 --fps 60
+    python camera_stream_benchmark.py --protocol 2 --fps 30
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+
+from camera_streaming_client import (
+    CHUNK_SIZE,
+    V2_CHUNK_SIZE,
+    V2_HEADER,
+    RimWorldStreamReceiver,
+    cv2,
+    decode_jpeg,
+)
+
+FRAME_VARIANTS = 8
+
+
+def make_packets(frame):
+    """Split a frame into CAM packets exactly like UdpCameraStream.SendDataInChunks."""
+    total = (len(frame) + CHUNK_SIZE - 1) // CHUNK_SIZE
+    packets = []
+    for index in range(total):
+        chunk = frame[index * CHUNK_SIZE : (index + 1) * CHUNK_SIZE]
+        packets.append(b"CAM" + struct.pack("<IBB", len(chunk), index, total) + chunk)
+    return packets
+
+
+def make_packets_v2(frame, sequence, tick):
+    """v2 packets (UdpCameraStream.SendFrameV2), stamped with the current time as capture time."""
+    total = max(1, (len(frame) + V2_CHUNK_SIZE - 1) // V2_CHUNK_SIZE)
+    capture_us = time.time_ns() // 1000
+    packets = []
+    for index in range(total):
+        offset = index * V2_CHUNK_SIZE
+        chunk = frame[offset : offset + V2_CHUNK_SIZE]
+        header = V2_HEADER.pack(b"RWC", 2, sequence, index, total, len(frame), offset, len(chunk), tick, capture_us)
+        packets.append(header + chunk)
+    return packets
+
+
+def make_frames(size_kb, jpeg, count):
+    """Distinct frames, so chunks mixed from different frames fail verification."""
+    if not jpeg:
+        return [os.urandom(size_kb * 1024) for _ in range(count)]
+    # Noise compresses badly, so pick a resolution that lands near the requested size
+    side = int((size_kb * 1024 / 1.5) ** 0.5)
+    rng = np.random.default_rng(0)
+    return [
+        cv2.imencode(".jpg", rng.integers(0, 256, (side, side, 3), dtype=np.uint8), [cv2.IMWRITE_JPEG_QUALITY, 50])[
+            1
+        ].tobytes()
+        for _ in range(count)
+    ]
+
+
+def send(port, frames, duration, fps, protocol, sent_frames):
+    """Sender process: replays the frames round-robin, as UdpCameraStream would send them."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    v1_packets = [make_packets(frame) for frame in frames]
+    interval = 1.0 / fps if fps else 0.0
+    deadline = time.perf_counter() + duration
+    next_frame = time.perf_counter()
+    count = 0
+    while time.perf_counter() < deadline:
+        if protocol == 1:
+            packets = v1_packets[count % len(frames)]
+        else:
+            packets = make_packets_v2(frames[count % len(frames)], count, count * 4)
+        for packet in packets:
+            sock.sendto(packet, ("127.0.0.1", port))
+        count += 1
+        if interval:
+            next_frame += interval
+            time.sleep(max(0.0, next_frame - time.perf_counter()))
+    sock.close()
+    sent_frames.value = count
+
+
+class LegacyReceiver:
+    """Reassembly logic of the previous camera_streaming_client, without the display."""
+
+    def __init__(self, decode):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.settimeout(0.5)
+        self.port = self.socket.getsockname()[1]
+        self.decode = decode
+        self.buffer = {}
+        self.packets = 0
+        self.frames_completed = 0
+        self.frames_decoded = 0
+        self.decode_failures = 0
+        self._stop = threading.Event()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.receive_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def receive_loop(self):
+        while not self._stop.is_set():
+            try:
+                data, _ = self.socket.recvfrom(65535)
+            except socket.timeout:
+                continue
+            self.packets += 1
+            length = struct.unpack("<I", data[3:7])[0]
+            index, total = data[7], data[8]
+            image_data = data[9 : 9 + length]
+            if total == 1:
+                self.frames_completed += 1
+                self._decode(image_data)
+                continue
+
+            key = int(time.time() * 1000) // 1000
+            entry = self.buffer.setdefault(key, {"chunks": [None] * total, "received": 0, "total": total})
+            if entry["chunks"][index] is None:
+                entry["chunks"][index] = image_data
+                entry["received"] += 1
+
+            for k, e in list(self.buffer.items()):
+                if e["received"] == e["total"]:
+                    self.frames_completed += 1
+                    self._decode(b"".join(e["chunks"]))
+                    del self.buffer[k]
+
+    def _decode(self, payload):
+        if self.decode(payload) is not None:
+            self.frames_decoded += 1
+        else:
+            self.decode_failures += 1
+
+    def stats(self):
+        return {
+            "packets": self.packets,
+            "frames_completed": self.frames_completed,
+            "frames_decoded": self.frames_decoded,
+            "decode_failures": self.decode_failures,
+        }
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self.socket.close()
+
+
+def run(name, receiver, frames, duration, fps, protocol):
+    sent_frames = multiprocessing.Value("q", 0)
+    sender = multiprocessing.Process(
+        target=send, args=(receiver.port, frames, duration, fps, protocol, sent_frames)
+    )
+    receiver.start()
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    sender.start()
+    sender.join()
+    time.sleep(0.5)  # let the receiver drain
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    receiver.close()
+
+    s = receiver.stats()
+    print(
+        f"{name:<9}{sent_frames.value:>8}{s['packets']:>10}{s['frames_completed']:>10}"
+        f"{s.get('frames_decoded', 0):>9}{s.get('decode_failures', 0):>8}"
+        f"{s['frames_completed'] / elapsed:>10.1f}{s.get('frames_decoded', 0) / elapsed:>10.1f}{cpu:>8.2f}"
+    )
+    return receiver
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame-kb", type=int, default=200, help="Frame size in KiB")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds of sending per receiver")
+    parser.add_argument("--fps", type=float, default=0, help="Frames per second (0 = as fast as possible)")
+    parser.add_argument("--decode", choices=["none", "jpeg"], default="none")
+    parser.add_argument(
+        "--protocol", type=int, choices=[1, 2], default=1, help="Packet format (the legacy receiver only runs for v1)"
+    )
+    args = parser.parse_args()
+
+    if args.decode == "jpeg" and cv2 is None:
+        parser.error("--decode jpeg needs opencv-python")
+
+    jpeg = args.decode == "jpeg"
+    frames = make_frames(args.frame_kb, jpeg, FRAME_VARIANTS)
+    digests = {hashlib.sha1(frame).digest() for frame in frames}
+
+    def verify(payload):
+        # A frame stitched from chunks of different frames matches none of the originals
+        if hashlib.sha1(payload).digest() not in digests:
+            return None
+        return decode_jpeg(payload) if jpeg else True
+
+    print(
+        f"📦 {len(frames[0])} byte frames in {len(make_packets(frames[0]))} packets, "
+        f"{args.duration}s per receiver, {'max rate' if not args.fps else f'{args.fps:g} fps'}, v{args.protocol}"
+    )
+    print(
+        f"{'receiver':<9}{'sent':>8}{'packets':>10}{'complete':>10}{'valid':>9}{'corrupt':>8}"
+        f"{'frames/s':>10}{'valid/s':>10}{'cpu s':>8}"
+    )
+    if args.protocol == 1:
+        run("legacy", LegacyReceiver(verify), frames, args.duration, args.fps, 1)
+    receiver = run(
+        "current", RimWorldStreamReceiver(0, verify, host="127.0.0.1"), frames, args.duration, args.fps, args.protocol
+    )
+    print(receiver.format_stats())
+
+if __name__ == "__main__":
+    main()
@@ -1,139 +1,445 @@
+"""
+RimWorld UDP camera stream receiver.
+
+UdpCameraStream sends every frame as one or more packets in one of two formats
+(chosen with protocol_version in /api/v1/stream/setup, v1 by default):
+
+    v1  b"CAM" | payload length <I | chunk index B | chunk total B | payload
+    v2  b"RWC" | version B (2) | frame sequence <I | chunk index <H | chunk total <H |
+        frame length <I | chunk offset <I | payload length <I | capture tick <i |
+        capture time <q (unix microseconds) | payload
+
+Packets are received with recvfrom_into into a single preallocated buffer and
+copied once into a pooled per-frame bytearray at the chunk's offset, so there
+is no per-packet allocation and no b"".join. v2 frames are identified by their
+sequence number: a newer sequence drops the partial frame it supersedes and
+packets of older frames are counted as late. v1 packets carry no frame id, so
+chunk 0, or a chunk index that does not follow the previous one, starts a new
+frame (losing the end of one frame and the start of the next can still splice
+the two).
+
+For v2 streams the receiver reports end-to-end latency (capture time to
+reassembly, so sender and receiver clocks must agree), frame loss and packet
+reordering.
+
+Completed frames go to a decoder thread that only ever decodes the newest
+one; frames completed while it is busy replace each other (latest frame wins),
+so a slow decoder never builds up latency.
+"""
+
+import collections
+import queue
 import socket
-import cv2
-import numpy as np
 import struct
+import threading
 import time
 
+import numpy as np
+
+try:
+    import cv2
+except ImportError:  # only needed to decode and display frames
+    cv2 = None
+
+MAX_PACKET_SIZE = 60000  # UdpCameraStream.MAX_PACKET_SIZE
+CHUNK_SIZE = MAX_PACKET_SIZE - 10  # v1 chunk size: UdpCameraStream MAX_PACKET_SIZE - HEADER_SIZE
+V1_MAGIC = b"CAM"
+V1_HEADER = struct.Struct("<3sIBB")  # magic, payload length, chunk index, chunk total
+V2_MAGIC = b"RWC"
+V2_HEADER = struct.Struct("<3sBIHHIIIiq")
+V2_CHUNK_SIZE = MAX_PACKET_SIZE - V2_HEADER.size
+INITIAL_FRAME_CAPACITY = 1 << 20
+RECV_BUFFER_SIZE = 4 << 20
+LATENCY_WINDOW = 1000  # frames kept for latency percentiles
+
+
+class FrameBuffer:
+    """Reusable reassembly buffer for one frame."""
+
+    __slots__ = ("data", "view", "frame_id", "sequence", "total", "received", "length", "capture_tick", "capture_time_us", "_have")
+
+    def __init__(self, capacity=INITIAL_FRAME_CAPACITY):
+        self.data = bytearray(capacity)
+        self.view = memoryview(self.data)
+        self._have = bytearray(256)
+        self.reset(0, 0, 0)
+
+    def reset(self, frame_id, total, capacity, sequence=None, capture_tick=0, capture_time_us=0):
+        self.frame_id = frame_id
+        self.sequence = sequence
+        self.total = total
+        self.received = 0
+        self.length = 0
+        self.capture_tick = capture_tick
+        self.capture_time_us = capture_time_us
+        if total > len(self._have):
+            self._have = bytearray(total)
+        else:
+            self._have[:total] = bytes(total)
+        if capacity > len(self.data):
+            self.data = bytearray(capacity)
+            self.view = memoryview(self.data)
+
+    def put(self, index, offset, payload):
+        """Copy a chunk into place. Returns False for a duplicate."""
+        if self._have[index]:
+            return False
+        end = offset + len(payload)
+        self.view[offset:end] = payload
+        self._have[index] = 1
+        self.received += 1
+        if index == self.total - 1:
+            self.length = end
+        return True
+
+    @property
+    def complete(self):
+        return self.received == self.total
+
+    def payload(self):
+        return self.view[: self.length]
+
+
+def _seq_newer(a, b):
+    """True when 32-bit sequence a comes after b (handles wrap-around)."""
+    return 0 < ((a - b) & 0xFFFFFFFF) < 0x80000000
+
+
+class FrameAssembler:
+    """Turns CAM (v1) and RWC (v2) packets into complete frames, keeping only the frame currently arriving."""
+
+    def __init__(self):
+        self._free = queue.SimpleQueue()
+        self._current = None
+        self._last_index = -1
+        self._next_id = 0
+        self.packets = 0
+        self.bytes = 0
+        self.bad_packets = 0
+        self.duplicate_chunks = 0
+        self.frames_completed = 0
+        self.frames_superseded = 0
+        # v2 only
+        self.first_sequence = None
+        self.highest_sequence = None
+        self.completed_v2 = 0
+        self.late_packets = 0
+        self.reordered_packets = 0
+        self.latencies_ms = collections.deque(maxlen=LATENCY_WINDOW)
+        self.last_capture_tick = 0
+        self._last_packet = None
+        self._last_done = None  # sequence of the last completed or superseded frame
+
+    def feed(self, packet):
+        """Process one packet (a memoryview). Returns a complete FrameBuffer or None."""
+        self.packets += 1
+        self.bytes += len(packet)
+        magic = packet[:3]
+        if magic == V2_MAGIC:
+            return self._feed_v2(packet)
+        if magic == V1_MAGIC:
+            return self._feed_v1(packet)
+        self.bad_packets += 1
+        return None
+
+    def _feed_v1(self, packet):
+        if len(packet) < V1_HEADER.size:
+            self.bad_packets += 1
+            return None
+
+        _, length, index, total = V1_HEADER.unpack_from(packet)
+        end = V1_HEADER.size + length
+        if total == 0 or index >= total or len(packet) < end:
+            self.bad_packets += 1
+            return None
+        if index < total - 1 and length != CHUNK_SIZE:
+            self.bad_packets += 1
+            return None
+
+        frame = self._current
+        # v1 packets carry no frame id: chunks of a frame arrive in order, so anything
+        # that does not continue the current frame starts the next one
+        if frame is None or frame.sequence is not None or index == 0 or index <= self._last_index or total != frame.total:
+            self._supersede()
+            frame = self._current = self._acquire(total, total * CHUNK_SIZE)
+        self._last_index = index
+
+        if not frame.put(index, index * CHUNK_SIZE, packet[V1_HEADER.size : end]):
+            self.duplicate_chunks += 1
+            return None
+        return self._finish(frame) if frame.complete else None
+
+    def _feed_v2(self, packet):
+        if len(packet) < V2_HEADER.size:
+            self.bad_packets += 1
+            return None
+
+        _, version, seq, index, total, frame_length, offset, length, tick, capture_us = V2_HEADER.unpack_from(packet)
+        end = V2_HEADER.size + length
+        if version != 2 or total == 0 or index >= total or len(packet) < end or offset + length > frame_length:
+            self.bad_packets += 1
+            return None
+
+        # Reordering: any packet that sorts before the previous one
+        if self._last_packet is not None:
+            last_seq, last_index = self._last_packet
+            if _seq_newer(last_seq, seq) or (seq == last_seq and index < last_index):
+                self.reordered_packets += 1
+        self._last_packet = (seq, index)
+
+        if self.first_sequence is None:
+            self.first_sequence = self.highest_sequence = seq
+        elif _seq_newer(seq, self.highest_sequence):
+            self.highest_sequence = seq
+
+        frame = self._current
+        if frame is None or frame.sequence is None or _seq_newer(seq, frame.sequence):
+            if self._last_done is not None and not _seq_newer(seq, self._last_done):
+                # Straggler of a frame that was already completed or superseded
+                self.late_packets += 1
+                return None
+            self._supersede()
+            frame = self._current = self._acquire(total, frame_length, seq, tick, capture_us)
+        elif seq != frame.sequence:
+            self.late_packets += 1
+            return None
+
+        if not frame.put(index, offset, packet[V2_HEADER.size : end]):
+            self.duplicate_chunks += 1
+            return None
+        if not frame.complete:
+            return None
+
+        self.completed_v2 += 1
+        self.last_capture_tick = frame.capture_tick
+        self.latencies_ms.append(time.time() * 1000.0 - frame.capture_time_us / 1000.0)
+        return self._finish(frame)
+
+    def _finish(self, frame):
+        self._current = None
+        self._last_index = -1
+        if frame.sequence is not None:
+            self._last_done = frame.sequence
+        self.frames_completed += 1
+        return frame
+
+    def _supersede(self):
+        frame = self._current
+        if frame is None:
+            return
+        self.frames_superseded += 1
+        if frame.sequence is not None:
+            self._last_done = frame.sequence
+        self._current = None
+        self.release(frame)
+
+    def release(self, frame):
+        """Return a frame buffer to the pool once its payload is no longer needed."""
+        self._free.put(frame)
+
+    def _acquire(self, total, capacity, sequence=None, capture_tick=0, capture_time_us=0):
+        try:
+            frame = self._free.get_nowait()
+        except queue.Empty:
+            frame = FrameBuffer()
+        self._next_id += 1
+        frame.reset(self._next_id, total, capacity, sequence, capture_tick, capture_time_us)
+        return frame
+
+    def loss_rate(self):
+        """Share of v2 frames (by sequence range) that were never completed."""
+        if self.first_sequence is None:
+            return 0.0
+        expected = ((self.highest_sequence - self.first_sequence) & 0xFFFFFFFF) + 1
+        return max(0.0, 1.0 - self.completed_v2 / expected)
+
+    def latency_percentiles(self):
+        """(p50, p95, max) end-to-end latency in ms over the last LATENCY_WINDOW frames, or None."""
+        if not self.latencies_ms:
+            return None
+        values = np.fromiter(self.latencies_ms, dtype=float)
+        return float(np.percentile(values, 50)), float(np.percentile(values, 95)), float(values.max())
+
+
+class LatestFrameDecoder:
+    """Decodes complete frames on a worker thread, skipping any that were superseded while it was busy."""
+
+    def __init__(self, decode, release):
+        self._decode = decode
+        self._release = release
+        self._cond = threading.Condition()
+        self._pending = None
+        self._closed = False
+        self.latest = None
+        self.latest_id = 0
+        self.frames_decoded = 0
+        self.frames_skipped = 0
+        self.decode_failures = 0
+        self._thread = threading.Thread(target=self._run, name="frame-decoder", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        with self._cond:
+            if self._pending is not None:
+                self.frames_skipped += 1
+                self._release(self._pending)
+            self._pending = frame
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                frame, self._pending = self._pending, None
+
+            try:
+                image = self._decode(frame.payload())
+            except Exception:
+                image = None
+            frame_id = frame.frame_id
+            self._release(frame)
+
+            if image is None:
+                self.decode_failures += 1
+                continue
+            self.frames_decoded += 1
+            self.latest, self.latest_id = image, frame_id
+
+
+def decode_jpeg(payload):
+    return cv2.imdecode(np.frombuffer(payload, np.uint8), cv2.IMREAD_COLOR)
+
+
 class RimWorldStreamReceiver:
-    def __init__(self, port=5001):
+    def __init__(self, port=5007, decode=decode_jpeg, host="0.0.0.0"):
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.bind(('0.0.0.0', port))
-        self.socket.settimeout(1.0)  # 1 second timeout
-        self.buffer = {}
-        self.last_frame_time = time.time()
-        self.packet_count = 0
-        print(f"🎥 Listening for RimWorld stream on port {port}...")
-        print("⏳ Waiting for data from RimWorld...")
-    
-    def receive_stream(self):
-        while True:
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+        self.socket.bind((host, port))
+        self.socket.settimeout(0.5)
+        self.port = self.socket.getsockname()[1]
+        self.assembler = FrameAssembler()
+        self.decoder = LatestFrameDecoder(decode, self.assembler.release) if decode else None
+        self._packet = bytearray(65535)
+        self._packet_view = memoryview(self._packet)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Receive on a background thread."""
+        self._thread = threading.Thread(target=self.receive_loop, name="udp-receiver", daemon=True)
+        self._thread.start()
+        return self
+
+    def receive_loop(self):
+        sock, view, assembler = self.socket, self._packet_view, self.assembler
+        while not self._stop.is_set():
             try:
-                data, addr = self.socket.recvfrom(65535)
-                self.packet_count += 1
-                self.process_packet(data)
-                
+                nbytes, _ = sock.recvfrom_into(self._packet)
             except socket.timeout:
                 continue
-            except Exception as e:
-                print(f"❌ Error: {e}")
+            except OSError:
+                if self._stop.is_set():
+                    return
+                raise
+
+            frame = assembler.feed(view[:nbytes])
+            if frame is None:
                 continue
-            
-            # Display frame if available
-            self.try_display_frame()
-            
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
-    
-    def process_packet(self, data):
-        
-        if len(data) < 9:  # Minimum: 3 header + 4 length + 2 chunk info
-            print("❌ Packet too small, ignoring")
-            return
-            
-        header = data[:3]
-        if header != b'CAM':
-            print("❌ Invalid header, ignoring")
-            return
-            
-        # Parse packet info
-        data_length = struct.unpack('<I', data[3:7])[0]
-        chunk_index = data[7]
-        total_chunks = data[8]
-        
-        # Calculate expected packet size
-        header_size = 9  # 3 header + 4 length + 2 chunk info
-        expected_packet_size = header_size + data_length
-        
-        # More lenient validation - allow packets that are at least the expected size
-        if len(data) < expected_packet_size:
-            print(f"❌ Packet too small: got {len(data)}, expected at least {expected_packet_size}")
-            return
-            
-        # Take only the expected amount of data (in case there's extra)
-        image_data = data[9:9 + data_length]
-        
-        if total_chunks == 1:
-            self.process_complete_frame(image_data)
-        else:
-            self.buffer_frame_chunk(chunk_index, total_chunks, image_data)
-
-    
-    def buffer_frame_chunk(self, chunk_index, total_chunks, chunk_data):
-        frame_key = int(time.time() * 1000) // 1000
-        
-        if frame_key not in self.buffer:
-            self.buffer[frame_key] = {
-                'chunks': [None] * total_chunks,
-                'received_chunks': 0,
-                'total_chunks': total_chunks
-            }
-        
-        if self.buffer[frame_key]['chunks'][chunk_index] is None:
-            self.buffer[frame_key]['chunks'][chunk_index] = chunk_data
-            self.buffer[frame_key]['received_chunks'] += 1
-    
-    def process_complete_frame(self, image_data):
-        frame = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
-        if frame is not None:
-            cv2.imshow('RimWorld Camera Stream', frame)
-            self.last_frame_time = time.time()
-        else:
-            print("❌ Failed to decode JPEG frame")
-    
-    def try_display_frame(self):
-        current_time = time.time()
-        complete_frames = []
-        
-        # Find complete frames
-        for frame_key, frame_data in list(self.buffer.items()):
-            if frame_data['received_chunks'] == frame_data['total_chunks']:
-                complete_image_data = b''.join(frame_data['chunks'])
-                complete_frames.append((frame_key, complete_image_data))
-        
-        # Process complete frames
-        if complete_frames:
-            complete_frames.sort(key=lambda x: x[0], reverse=True)
-            newest_frame_key, newest_frame_data = complete_frames[0]
-            
-            frame = cv2.imdecode(np.frombuffer(newest_frame_data, np.uint8), cv2.IMREAD_COLOR)
-            if frame is not None:
-                cv2.imshow('RimWorld Camera Stream', frame)
-                self.last_frame_time = current_time
+            if self.decoder:
+                self.decoder.submit(frame)
             else:
-                print("❌ Failed to decode reassembled frame")
-            
-            # Clean up
-            for frame_key, _ in complete_frames:
-                if frame_key in self.buffer:
-                    del self.buffer[frame_key]
-    
-    def clean_old_buffers(self):
-        current_time = time.time()
-        removed = 0
-        for frame_key in list(self.buffer.keys()):
-            if current_time - frame_key > 2.0:
-                del self.buffer[frame_key]
-                removed += 1
-        if removed > 0:
-            print(f"🧹 Cleaned up {removed} old buffer(s)")
+                assembler.release(frame)
+
+    def receive_stream(self):
+        """Receive in the background and show the newest decoded frame until 'q' is pressed."""
+        if cv2 is None:
+            raise RuntimeError("opencv-python is required to display the stream")
+        self.start()
+        shown = 0
+        last_report = time.time()
+        while True:
+            if self.decoder.latest_id != shown:
+                shown = self.decoder.latest_id
+                cv2.imshow("RimWorld Camera Stream", self.decoder.latest)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+            if time.time() - last_report >= 5.0:
+                last_report = time.time()
+                print(self.format_stats())
+
+    def stats(self):
+        a = self.assembler
+        stats = {
+            "packets": a.packets,
+            "bytes": a.bytes,
+            "bad_packets": a.bad_packets,
+            "duplicate_chunks": a.duplicate_chunks,
+            "frames_completed": a.frames_completed,
+            "frames_superseded": a.frames_superseded,
+        }
+        if a.first_sequence is not None:
+            latency = a.latency_percentiles()
+            stats.update(
+                loss_rate=a.loss_rate(),
+                late_packets=a.late_packets,
+                reordered_packets=a.reordered_packets,
+                last_capture_tick=a.last_capture_tick,
+                latency_p50_ms=latency[0] if latency else None,
+                latency_p95_ms=latency[1] if latency else None,
+                latency_max_ms=latency[2] if latency else None,
+            )
+        if self.decoder:
+            stats.update(
+                frames_decoded=self.decoder.frames_decoded,
+                frames_skipped=self.decoder.frames_skipped,
+                decode_failures=self.decoder.decode_failures,
+            )
+        return stats
+
+    def format_stats(self):
+        s = self.stats()
+        text = (
+            f"📊 {s['packets']} packets, {s['frames_completed']} frames complete, "
+            f"{s['frames_superseded']} partial dropped, {s.get('frames_decoded', 0)} decoded, "
+            f"{s.get('frames_skipped', 0)} skipped"
+        )
+        if "loss_rate" in s:
+            text += (
+                f"\n   loss {s['loss_rate'] * 100:.2f}%, {s['reordered_packets']} reordered / "
+                f"{s['late_packets']} late packets, tick {s['last_capture_tick']}"
+            )
+            if s["latency_p50_ms"] is not None:
+                text += (
+                    f", latency p50 {s['latency_p50_ms']:.1f} ms / p95 {s['latency_p95_ms']:.1f} ms"
+                    f" / max {s['latency_max_ms']:.1f} ms"
+                )
+        return text
+
+    def close(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        if self.decoder:
+            self.decoder.close()
+        self.socket.close()
+
 
 if __name__ == "__main__":
     print("🚀 Starting RimWorld Camera Stream Receiver")
     print("===========================================")
-    
+
     # Try multiple ports
     ports_to_try = [5007]
-    
+
     for port in ports_to_try:
         try:
             print(f"🔌 Trying port {port}...")
@@ -146,11 +452,11 @@ if __name__ == "__main__":
     else:
         print("💥 No available ports found!")
         exit(1)
-    
+
     print("\n🎮 Client Ready")
     print("   Start: http://localhost:8765/api/v1/stream/start")
     print("   Stop: http://localhost:8765/api/v1/stream/stop")
-    
+
     try:
         receiver.receive_stream()
     except KeyboardInterrupt:
@@ -159,4 +465,5 @@ if __name__ == "__main__":
         print(f"💥 Fatal error: {e}")
     finally:
         receiver.close()
-        print("👋 Receiver closed")
\ No newline at end of file
+        print(receiver.format_stats())
+        print("👋 Receiver closed")
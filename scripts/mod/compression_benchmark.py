@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark: bytes on the wire and end-to-end latency per
+Accept-Encoding, over the largest RIMAPI endpoints.
+
+Every endpoint is requested with `identity`, `deflate` and `gzip`. Wire bytes
+are the body as sent (before requests decompresses it); latency covers the
+request, the download, decompression and JSON parsing, reported as the median
+and p95 of --repeat runs after one warm-up request (which also fills the
+response cache for cached endpoints, so every encoding is compared warm).
+
+Requires a running game with the RIMAPI server. Bodies under the server's
+"Minimum response size to compress" setting are always sent uncompressed.
+
+Usage:
+    python compression_benchmark.py
+    python compression_benchmark.py --url http://localhost:8765 --map-id 0 --repeat 20
+    python compression_benchmark.py --image-item Steel
+"""
+
+import argparse
+import json
+import statistics
+import time
+import zlib
+
+import requests
+
+ENCODINGS = ["identity", "deflate", "gzip"]
+
+
+def endpoints(map_id, image_item):
+    return [
+        ("map/things", "/api/v1/map/things", {"map_id": map_id}),
+        ("def/all", "/api/v1/def/all", {}),
+        ("world/grid", "/api/v1/world/grid", {}),
+        ("item/image", "/api/v1/item/image", {"name": image_item}),
+    ]
+
+
+def decompress(raw, content_encoding):
+    if content_encoding == "gzip":
+        return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    if content_encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+def fetch(session, url, params, encoding):
+    """Returns (wire bytes, Content-Encoding, ms) for one request, parsing the JSON body."""
+    start = time.perf_counter()
+    resp = session.get(url, params=params, headers={"Accept-Encoding": encoding}, stream=True, timeout=60)
+    resp.raise_for_status()
+    raw = resp.raw.read(decode_content=False)
+    content_encoding = resp.headers.get("Content-Encoding", "identity")
+    json.loads(decompress(raw, content_encoding))
+    return len(raw), content_encoding, (time.perf_counter() - start) * 1000.0
+
+
+def p95(values):
+    return sorted(values)[max(0, int(round(len(values) * 0.95)) - 1)]
+
+
+def run(url, map_id, image_item, repeat):
+    session = requests.Session()
+    print(f"🔗 {url}, map {map_id}, {repeat} runs per encoding")
+    print(f"{'endpoint':<12}{'accept':<10}{'sent as':<10}{'wire bytes':>12}{'ratio':>8}{'median ms':>11}{'p95 ms':>9}")
+
+    for name, path, params in endpoints(map_id, image_item):
+        baseline = None
+        for encoding in ENCODINGS:
+            try:
+                fetch(session, url + path, params, encoding)
+                runs = [fetch(session, url + path, params, encoding) for _ in range(repeat)]
+            except requests.RequestException as e:
+                print(f"{name:<12}{encoding:<10}❌ {e}")
+                break
+
+            wire, sent_as, _ = runs[-1]
+            times = [ms for _, _, ms in runs]
+            baseline = baseline or wire
+            print(
+                f"{name:<12}{encoding:<10}{sent_as:<10}{wire:>12}{wire / baseline:>7.2f}x"
+                f"{statistics.median(times):>11.2f}{p95(times):>9.2f}"
+            )
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8765")
+    parser.add_argument("--map-id", type=int, default=0)
+    parser.add_argument("--image-item", default="Steel", help="ThingDef name for /item/image")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per endpoint and encoding")
+    args = parser.parse_args()
+
+    try:
+        requests.get(f"{args.url.rstrip('/')}/api/v1/version", timeout=5)
+    except requests.RequestException as e:
+        print(f"❌ Could not connect to {args.url}. Is RimWorld running? ({e})")
+        return
+    run(args.url.rstrip("/"), args.map_id, args.image_item, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
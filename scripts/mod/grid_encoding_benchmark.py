@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Map grid encoding benchmark: payload bytes and encode/decode time per ?encoding=.
+
+Offline mode (default) builds synthetic 250x250 and 400x400 maps - a fog grid
+with a revealed area and fogged mountain pockets, noisy terrain with ~12 terrain
+types and a few constructed floors - and encodes them with Python ports of the
+server encoders (GridEncodingHelper / MapService.EncodeFogGrid). Encode times
+are therefore relative, not the server's own; decode times use rimapi_grid.
+
+With --url it instead requests /map/fog-grid and /map/terrain from a running
+game once per encoding and reports response bytes, round-trip time (includes
+server encoding) and decode time.
+
+Usage:
+    python grid_encoding_benchmark.py
+    python grid_encoding_benchmark.py --sizes 250,400 --repeat 20
+    python grid_encoding_benchmark.py --url http://localhost:8765 --map-id 0
+"""
+
+import argparse
+import base64
+import json
+import time
+import zlib
+
+import numpy as np
+import requests
+
+from rimapi_grid import decode_fog, decode_terrain
+
+ENCODINGS = ["default", "varint", "bitpacked", "deflate"]
+TERRAIN_TYPES = 12
+
+
+# --- Python ports of the server encoders ------------------------------------
+
+
+def runs_of(values):
+    """[count, value, count, value, ...] for a flat array."""
+    change = np.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = np.r_[0, change]
+    counts = np.diff(np.r_[starts, values.size])
+    pairs = np.empty(counts.size * 2, dtype=np.int64)
+    pairs[0::2] = counts
+    pairs[1::2] = values[starts]
+    return pairs
+
+
+def fog_runs(fogged):
+    """Alternating revealed/fogged run lengths, starting with revealed."""
+    pairs = runs_of(fogged.reshape(-1).astype(np.int8))
+    counts = pairs[0::2]
+    return np.r_[0, counts] if pairs[1] else counts
+
+
+def write_varints(values):
+    out = bytearray()
+    for v in values.tolist():
+        while v >= 0x80:
+            out.append((v & 0x7F) | 0x80)
+            v >>= 7
+        out.append(v)
+    return bytes(out)
+
+
+def bit_pack(values, bits):
+    cells = ((values[:, None] >> np.arange(bits)) & 1).astype(np.uint8).reshape(-1)
+    return np.packbits(cells, bitorder="little").tobytes()
+
+
+def bits_for(value_count):
+    return max(1, int(value_count - 1).bit_length())
+
+
+def encode_runs(runs, encoding):
+    if encoding == "default":
+        return base64.b64encode(runs.astype("<i4").tobytes()).decode()
+    raw = write_varints(runs)
+    if encoding == "deflate":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        raw = compressor.compress(raw) + compressor.flush()
+    return base64.b64encode(raw).decode()
+
+
+def encode_fog(fogged, encoding):
+    height, width = fogged.shape
+    data = {"map_id": 0, "width": width, "height": height}
+    if encoding == "bitpacked":
+        data["fog_data"] = base64.b64encode(bit_pack(fogged.reshape(-1).astype(np.int64), 1)).decode()
+    else:
+        data["fog_data"] = encode_runs(fog_runs(fogged), encoding)
+    if encoding != "default":
+        data["encoding"] = encoding
+    return json.dumps(data)
+
+
+def encode_terrain(terrain, floors, encoding):
+    height, width = terrain.shape
+    data = {
+        "width": width,
+        "height": height,
+        "palette": [f"Terrain{i}" for i in range(TERRAIN_TYPES)],
+        "floor_palette": ["WoodPlankFloor", "Concrete"],
+    }
+    if encoding == "default":
+        data["grid"] = runs_of(terrain.reshape(-1)).tolist()
+        data["floor_grid"] = runs_of(floors.reshape(-1)).tolist()
+    elif encoding == "bitpacked":
+        data["bits_per_cell"] = bits_for(TERRAIN_TYPES)
+        data["floor_bits_per_cell"] = bits_for(len(data["floor_palette"]) + 1)
+        data["grid_data"] = base64.b64encode(bit_pack(terrain.reshape(-1), data["bits_per_cell"])).decode()
+        data["floor_grid_data"] = base64.b64encode(bit_pack(floors.reshape(-1), data["floor_bits_per_cell"])).decode()
+    else:
+        data["grid_data"] = encode_runs(runs_of(terrain.reshape(-1)), encoding)
+        data["floor_grid_data"] = encode_runs(runs_of(floors.reshape(-1)), encoding)
+    if encoding != "default":
+        data["encoding"] = encoding
+    return json.dumps(data)
+
+
+# --- Synthetic maps ----------------------------------------------------------
+
+
+def synthetic_map(size, seed=0):
+    rng = np.random.default_rng(seed)
+
+    # Fog: revealed disc around the colony, fogged mountain pockets inside it
+    z, x = np.mgrid[0:size, 0:size]
+    fogged = (x - size / 2) ** 2 + (z - size / 2) ** 2 > (size * 0.42) ** 2
+    for _ in range(size // 25):
+        cx, cz, r = rng.integers(0, size, 2).tolist() + [int(rng.integers(4, 18))]
+        fogged |= (x - cx) ** 2 + (z - cz) ** 2 < r**2
+
+    # Terrain: blocky biomes upscaled from a coarse grid, plus 15% per-cell noise
+    coarse = rng.integers(0, TERRAIN_TYPES, (size // 8 + 1, size // 8 + 1))
+    terrain = np.kron(coarse, np.ones((8, 8), dtype=np.int64))[:size, :size]
+    noise = rng.random((size, size)) < 0.15
+    terrain[noise] = rng.integers(0, TERRAIN_TYPES, int(noise.sum()))
+
+    # Floors: a few rectangular rooms
+    floors = np.zeros((size, size), dtype=np.int64)
+    for _ in range(size // 20):
+        x0, z0 = rng.integers(0, size - 20, 2)
+        floors[z0 : z0 + int(rng.integers(5, 20)), x0 : x0 + int(rng.integers(5, 20))] = rng.integers(1, 3)
+
+    return fogged, terrain, floors
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def run_offline(sizes, repeat):
+    print(f"{'grid':<14}{'encoding':<11}{'bytes':>10}{'vs default':>12}{'encode ms':>11}{'decode ms':>11}")
+    for size in sizes:
+        fogged, terrain, floors = synthetic_map(size)
+        cases = [
+            (f"fog {size}", lambda e: encode_fog(fogged, e), decode_fog, lambda d: (d == fogged).all()),
+            (
+                f"terrain {size}",
+                lambda e: encode_terrain(terrain, floors, e),
+                decode_terrain,
+                lambda d: (d[0] == terrain).all() and (d[1] == floors).all(),
+            ),
+        ]
+        for name, encode, decode, check in cases:
+            baseline = None
+            for encoding in ENCODINGS:
+                body, encode_ms = timed(lambda: encode(encoding), repeat)
+                decoded, decode_ms = timed(lambda: decode(json.loads(body)), repeat)
+                if not check(decoded):
+                    raise AssertionError(f"{name} {encoding} did not round-trip")
+                baseline = baseline or len(body)
+                print(
+                    f"{name:<14}{encoding:<11}{len(body):>10}{len(body) / baseline:>11.2f}x"
+                    f"{encode_ms:>11.2f}{decode_ms:>11.2f}"
+                )
+        print()
+
+
+def run_live(url, map_id, repeat):
+    session = requests.Session()
+    print(f"🔗 {url}, map {map_id}")
+    print(f"{'grid':<10}{'encoding':<11}{'bytes':>10}{'vs default':>12}{'request ms':>12}{'decode ms':>11}")
+    for name, path, decode in (("fog", "fog-grid", decode_fog), ("terrain", "terrain", decode_terrain)):
+        baseline = None
+        for encoding in ENCODINGS:
+            params = {"map_id": map_id}
+            if encoding != "default":
+                params["encoding"] = encoding
+            resp, request_ms = timed(
+                lambda: session.get(f"{url}/api/v1/map/{path}", params=params, timeout=30), repeat
+            )
+            resp.raise_for_status()
+            data = resp.json()["data"]
+            decoded, decode_ms = timed(lambda: decode(data), repeat)
+            shape = decoded.shape if name == "fog" else decoded[0].shape
+            baseline = baseline or len(resp.content)
+            print(
+                f"{name:<10}{encoding:<11}{len(resp.content):>10}{len(resp.content) / baseline:>11.2f}x"
+                f"{request_ms:>12.2f}{decode_ms:>11.2f}  {shape[1]}x{shape[0]}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="250,400", help="Comma separated synthetic map sizes")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs averaged per measurement")
+    parser.add_argument("--url", help="Benchmark a running game instead of synthetic maps")
+    parser.add_argument("--map-id", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.url:
+        try:
+            run_live(args.url.rstrip("/"), args.map_id, args.repeat)
+        except requests.RequestException as e:
+            print(f"❌ {e}")
+    else:
+        run_offline([int(s) for s in args.sizes.split(",")], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Pawn spawn stress test: wall time to spawn N pawns (and give them a lord) one
+request at a time versus one /api/v1/pawns/spawn/batch request.
+
+For every count in --counts (default 10, 100 and 500) the pawns are spawned
+on a square grid around --center:
+  single  one POST /api/v1/pawn/spawn per pawn, then POST /api/v1/lords/create
+  batch   one POST /api/v1/pawns/spawn/batch with the same specs and lord
+Wall time covers every request of a run. Spawned pawns are destroyed with
+/api/v1/map/destroy/rect after each run unless --keep is given, so run it on
+a test map.
+
+Usage:
+    python pawn_spawn_benchmark.py
+    python pawn_spawn_benchmark.py --counts 50 --mode batch --lord DefendPoint
+    python pawn_spawn_benchmark.py --faction Pirate --kind Pirate --center 60 60
+"""
+
+import argparse
+import math
+import time
+
+import requests
+
+MODES = ["single", "batch"]
+
+
+def spawn_specs(count, kind, faction, map_id, center):
+    side = math.ceil(math.sqrt(count))
+    cx, cz = center
+    specs = []
+    for i in range(count):
+        specs.append({
+            "pawn_kind": kind,
+            "faction": faction,
+            "map_id": str(map_id),
+            "position": {"x": cx - side // 2 + i % side, "y": 0, "z": cz - side // 2 + i // side},
+            "biological_age": 25,
+        })
+    return specs, side
+
+
+def lord_spec(job, center):
+    if not job:
+        return None
+    return {"job_type": job, "position": {"x": center[0], "y": 0, "z": center[1]}}
+
+
+def run_single(session, url, specs, lord, map_id):
+    pawn_ids = []
+    for spec in specs:
+        resp = session.post(f"{url}/api/v1/pawn/spawn", json=spec).json()
+        if resp.get("success"):
+            pawn_ids.append(resp["data"]["pawn_id"])
+    if lord and pawn_ids:
+        session.post(f"{url}/api/v1/lords/create", json=dict(
+            lord, faction=specs[0]["faction"], map_id=str(map_id), pawn_ids=pawn_ids))
+    return len(pawn_ids), len(specs) + (1 if lord else 0)
+
+
+def run_batch(session, url, specs, lord, map_id):
+    payload = {"pawns": specs}
+    if lord:
+        payload["lord"] = lord
+    resp = session.post(f"{url}/api/v1/pawns/spawn/batch", json=payload).json()
+    for warning in resp.get("warnings", []):
+        print(f"   ⚠️  {warning}")
+    pawns = (resp.get("data") or {}).get("pawns") or []
+    return len(pawns), 1
+
+
+def clear_area(session, url, map_id, center, side):
+    half = side // 2 + 6  # Spawns on unstandable cells move up to 5 cells away
+    session.post(f"{url}/api/v1/map/destroy/rect", json={
+        "map_id": map_id,
+        "point_a": {"x": center[0] - half, "y": 0, "z": center[1] - half},
+        "point_b": {"x": center[0] + half, "y": 0, "z": center[1] + half},
+    })
+
+
+def run(args):
+    url = args.url.rstrip("/")
+    center = tuple(args.center)
+    lord = lord_spec(args.lord, center)
+    modes = MODES if args.mode == "both" else [args.mode]
+    runners = {"single": run_single, "batch": run_batch}
+
+    print(f"🔗 {url}, map {args.map_id}, {args.kind} of {args.faction}, lord: {args.lord or 'none'}")
+    print(f"{'pawns':>7}{'mode':>8}{'requests':>10}{'spawned':>9}{'wall s':>9}{'ms/pawn':>9}")
+    session = requests.Session()
+    for count in args.counts:
+        specs, side = spawn_specs(count, args.kind, args.faction, args.map_id, center)
+        for mode in modes:
+            start = time.perf_counter()
+            spawned, request_count = runners[mode](session, url, specs, lord, args.map_id)
+            wall = time.perf_counter() - start
+            print(f"{count:>7}{mode:>8}{request_count:>10}{spawned:>9}{wall:>9.2f}"
+                  f"{wall * 1000 / max(spawned, 1):>9.1f}")
+            if not args.keep:
+                clear_area(session, url, args.map_id, center, side)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8765")
+    parser.add_argument("--map-id", type=int, default=0)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--mode", choices=MODES + ["both"], default="both")
+    parser.add_argument("--kind", default="Mercenary_Gunner", help="PawnKindDef name")
+    parser.add_argument("--faction", default="OutlanderCivil", help="Faction def name")
+    parser.add_argument("--lord", default="DefendPoint", help="Lord job type for the spawned pawns, '' for none")
+    parser.add_argument("--center", type=int, nargs=2, default=[40, 40], metavar=("X", "Z"))
+    parser.add_argument("--keep", action="store_true", help="Leave the spawned pawns on the map")
+    args = parser.parse_args()
+
+    try:
+        requests.get(f"{args.url.rstrip('/')}/api/v1/version", timeout=5)
+    except requests.RequestException as e:
+        print(f"❌ Could not connect to {args.url}. Is RimWorld running? ({e})")
+        return
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
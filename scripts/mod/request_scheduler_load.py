@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Request scheduler load generator: per-class latency under mixed load.
+
+Runs closed-loop workers for each priority class of the server's request
+scheduler for --duration seconds:
+  control      POST /api/v1/dev/events/emit (harmless), plus POST /api/v1/game/speed
+               when --speed is given
+  interactive  GET /api/v1/version, /api/v1/game/state, /api/v1/datetime
+  bulk         GET /api/v1/map/things, /api/v1/map/buildings, /api/v1/map/terrain
+
+Each worker sends its next request as soon as the previous one returns, so
+bulk workers keep the queue full. Client-side latency p50/p99 per class is
+printed next to the server's own queue wait percentiles from
+/api/v1/scheduler/stats. With the scheduler working, control and interactive
+latency stays flat as --bulk-workers grows; bulk requests absorb the wait.
+
+Usage:
+    python request_scheduler_load.py
+    python request_scheduler_load.py --bulk-workers 16 --duration 20
+    python request_scheduler_load.py --speed 1 --control-workers 2
+"""
+
+import argparse
+import itertools
+import threading
+import time
+
+import requests
+
+BASE_URL = "http://localhost:8765"
+CLASSES = ["control", "interactive", "bulk"]
+
+
+def class_requests(map_id, speed):
+    control = [("POST", "/api/v1/dev/events/emit", {"type": "test.scheduler_load", "count": 1})]
+    if speed is not None:
+        control.append(("POST", "/api/v1/game/speed", {"speed": speed}))
+    return {
+        "control": control,
+        "interactive": [
+            ("GET", "/api/v1/version", {}),
+            ("GET", "/api/v1/game/state", {}),
+            ("GET", "/api/v1/datetime", {}),
+        ],
+        "bulk": [
+            ("GET", "/api/v1/map/things", {"map_id": map_id}),
+            ("GET", "/api/v1/map/buildings", {"map_id": map_id}),
+            ("GET", "/api/v1/map/terrain", {"map_id": map_id}),
+        ],
+    }
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+
+def get_scheduler_stats(base_url):
+    resp = requests.get(f"{base_url}/api/v1/scheduler/stats", timeout=10)
+    resp.raise_for_status()
+    return resp.json()["data"]
+
+
+class Worker(threading.Thread):
+    """Closed loop: one request in flight at a time, cycling through the class's requests."""
+
+    def __init__(self, base_url, requests_, deadline):
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.requests = itertools.cycle(requests_)
+        self.deadline = deadline
+        self.latencies_ms = []
+        self.errors = 0
+
+    def run(self):
+        session = requests.Session()
+        while time.perf_counter() < self.deadline:
+            method, path, params = next(self.requests)
+            start = time.perf_counter()
+            try:
+                resp = session.request(method, f"{self.base_url}{path}", params=params, timeout=30)
+                ok = resp.status_code < 500
+            except requests.RequestException:
+                ok = False
+            if ok:
+                self.latencies_ms.append((time.perf_counter() - start) * 1000.0)
+            else:
+                self.errors += 1
+
+
+def run(base_url, workers_per_class, duration, map_id, speed):
+    reqs = class_requests(map_id, speed)
+    deadline = time.perf_counter() + duration
+    workers = {
+        name: [Worker(base_url, reqs[name], deadline) for _ in range(workers_per_class[name])] for name in CLASSES
+    }
+    for worker in itertools.chain.from_iterable(workers.values()):
+        worker.start()
+    for worker in itertools.chain.from_iterable(workers.values()):
+        worker.join()
+    return workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--control-workers", type=int, default=1)
+    parser.add_argument("--interactive-workers", type=int, default=4)
+    parser.add_argument("--bulk-workers", type=int, default=8)
+    parser.add_argument("--map-id", type=int, default=0)
+    parser.add_argument("--speed", type=int, help="Also send POST /game/speed with this speed as a control request")
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    workers_per_class = {
+        "control": args.control_workers,
+        "interactive": args.interactive_workers,
+        "bulk": args.bulk_workers,
+    }
+
+    try:
+        before = {c["priority"]: c for c in get_scheduler_stats(base_url)["classes"]}
+    except requests.RequestException as e:
+        print(f"❌ Cannot reach {base_url}: {e}")
+        return
+
+    print(
+        f"🚀 {args.duration:g}s, workers control={args.control_workers} "
+        f"interactive={args.interactive_workers} bulk={args.bulk_workers}"
+    )
+    workers = run(base_url, workers_per_class, args.duration, args.map_id, args.speed)
+    stats = get_scheduler_stats(base_url)
+    after = {c["priority"]: c for c in stats["classes"]}
+
+    print(
+        f"{'class':<13}{'requests':>9}{'errors':>8}{'req/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+        f"{'wait p50':>10}{'wait p99':>10}"
+    )
+    for name in CLASSES:
+        latencies = sorted(itertools.chain.from_iterable(w.latencies_ms for w in workers[name]))
+        errors = sum(w.errors for w in workers[name])
+        server = after.get(name, {})
+        print(
+            f"{name:<13}{len(latencies):>9}{errors:>8}{len(latencies) / args.duration:>8.1f}"
+            f"{percentile(latencies, 0.50):>9.1f}{percentile(latencies, 0.99):>9.1f}"
+            f"{(latencies[-1] if latencies else 0.0):>9.1f}"
+            f"{server.get('p50_wait_ms', 0.0):>10.1f}{server.get('p99_wait_ms', 0.0):>10.1f}"
+        )
+
+    dispatched = sum(after[n]["dispatched"] - before.get(n, {}).get("dispatched", 0) for n in after)
+    print(
+        f"\n📊 server: {dispatched} dispatched, frame budget {stats['frame_budget_ms']} ms, "
+        f"avg frame {stats['avg_frame_ms']:.2f} ms, max {stats['max_frame_ms']:.2f} ms, "
+        f"{stats['over_budget_frames']} frames over budget"
+    )
+    print("   (wait p50/p99 are the server's queue wait over each class's last 1024 requests)")
+    for route in stats["routes"][:5]:
+        print(f"   {route['priority']:<12}{route['avg_ms']:>8.2f} ms  {route['route']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+NumPy decoders for RIMAPI map grids.
+
+/api/v1/map/fog-grid returns the fog of war as Base64 encoded little-endian
+Int32 run lengths. Runs alternate between revealed and fogged, starting with
+revealed (a leading 0 means the first cell is fogged). Cell index is
+z * width + x, so the decoded array is indexed grid[z, x].
+
+    grid = FogGrid.fetch("http://localhost:8765", map_id=0)
+    grid.update()          # applies only the cells changed since the last fetch
+    grid.fogged[z, x]
+
+FogGrid.watch() keeps the grid current by fetching a delta whenever the
+server publishes a fog_updated event for the map.
+
+Both /map/fog-grid and /map/terrain accept ?encoding= to shrink the payload:
+  varint     the same runs as unsigned LEB128 varints
+  bitpacked  every cell in the fewest bits that hold its palette (1 bit for fog), LSB first
+  deflate    the varint runs compressed with raw DEFLATE
+decode_fog() and decode_terrain() turn any of them into NumPy arrays.
+"""
+
+import asyncio
+import base64
+import zlib
+
+import numpy as np
+import requests
+
+from rimapi_sse import SseClient
+
+# Run values alternate False (revealed), True (fogged), ...
+_RUN_VALUES = np.array([False, True])
+
+
+def decode_int32(base64_str):
+    """Base64 little-endian Int32 payload -> int32 array (no copy of the decoded bytes)."""
+    return np.frombuffer(base64.b64decode(base64_str), dtype="<i4")
+
+
+def decode_varints(buf):
+    """Unsigned LEB128 varints -> int64 array, vectorized."""
+    data = np.frombuffer(buf, dtype=np.uint8)
+    if data.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    # Position of every byte inside its varint gives the shift of its 7 payload bits
+    shifts = 7 * (np.arange(data.size) - np.repeat(starts, ends - starts + 1))
+    parts = (data & 0x7F).astype(np.int64) << shifts
+    return np.add.reduceat(parts, starts)
+
+
+def unpack_bits(buf, count, bits):
+    """Values packed LSB first with `bits` bits each -> int array of length count."""
+    flat = np.unpackbits(np.frombuffer(buf, dtype=np.uint8), bitorder="little")
+    if bits == 1:
+        return flat[:count]
+    cells = flat[: count * bits].reshape(count, bits).astype(np.int32)
+    return cells @ (1 << np.arange(bits, dtype=np.int32))
+
+
+def decode_runs(base64_str, encoding):
+    """Run list of a fog or terrain payload for the int32 (default), varint and deflate encodings."""
+    if encoding in (None, "default"):
+        return decode_int32(base64_str)
+    raw = base64.b64decode(base64_str)
+    if encoding == "deflate":
+        raw = zlib.decompress(raw, -zlib.MAX_WBITS)
+    elif encoding != "varint":
+        raise ValueError(f"Not a run-length encoding: {encoding}")
+    return decode_varints(raw)
+
+
+def decode_fog(data):
+    """Decode a /map/fog-grid response (any encoding) into a (height, width) bool array."""
+    width, height, encoding = data["width"], data["height"], data.get("encoding")
+    if encoding == "bitpacked":
+        cells = unpack_bits(base64.b64decode(data["fog_data"]), width * height, 1)
+        return cells.astype(bool).reshape(height, width)
+    return _expand_fog_runs(decode_runs(data["fog_data"], encoding), width, height)
+
+
+def decode_terrain(data):
+    """
+    Decode a /map/terrain response (any encoding) into two (height, width) int
+    arrays of palette indices: terrain (into "palette") and floors (0 = no
+    floor, otherwise 1 + index into "floor_palette").
+    """
+    width, height, encoding = data["width"], data["height"], data.get("encoding")
+    count = width * height
+    if encoding is None:
+        grids = [np.asarray(data["grid"]), np.asarray(data["floor_grid"])]
+    elif encoding == "bitpacked":
+        return (
+            unpack_bits(base64.b64decode(data["grid_data"]), count, data["bits_per_cell"]).reshape(height, width),
+            unpack_bits(base64.b64decode(data["floor_grid_data"]), count, data["floor_bits_per_cell"]).reshape(
+                height, width
+            ),
+        )
+    else:
+        grids = [decode_runs(data["grid_data"], encoding), decode_runs(data["floor_grid_data"], encoding)]
+
+    # Terrain runs are [count, palette_index, count, palette_index, ...]
+    decoded = []
+    for runs in grids:
+        cells = np.repeat(runs[1::2], runs[0::2])
+        if cells.size != count:
+            raise ValueError(f"Decoded {cells.size} cells, expected {width}x{height}")
+        decoded.append(cells.reshape(height, width))
+    return tuple(decoded)
+
+
+def decode_fog_rle(base64_str, width, height):
+    """Decode default fog_data into a (height, width) bool array where True means fogged."""
+    return _expand_fog_runs(decode_int32(base64_str), width, height)
+
+
+def _expand_fog_runs(runs, width, height):
+    values = np.resize(_RUN_VALUES, len(runs))
+    grid = np.repeat(values, runs)
+    if grid.size != width * height:
+        raise ValueError(f"Decoded {grid.size} cells, expected {width}x{height}")
+    return grid.reshape(height, width)
+
+
+def apply_fog_delta(fogged, delta):
+    """
+    Apply a since_tick response to a grid in place and return the number of
+    cells that changed. A response with "full" set replaces the whole grid.
+    """
+    if delta.get("full"):
+        full = decode_fog(delta)
+        changed = int(np.count_nonzero(full != fogged))
+        fogged[...] = full
+        return changed
+
+    flat = fogged.reshape(-1)
+    revealed = decode_int32(delta.get("revealed") or "")
+    newly_fogged = decode_int32(delta.get("fogged") or "")
+    flat[revealed] = False
+    flat[newly_fogged] = True
+    return len(revealed) + len(newly_fogged)
+
+
+class FogGrid:
+    """Client-side copy of one map's fog grid, kept up to date with deltas."""
+
+    def __init__(self, base_url, map_id, fogged, tick, encoding=None, session=None):
+        self.base_url = base_url.rstrip("/")
+        self.map_id = map_id
+        self.encoding = encoding
+        self.fogged = fogged
+        self.tick = tick
+        self.session = session or requests.Session()
+        self.full_fetches = 1
+        self.delta_fetches = 0
+
+    @classmethod
+    def fetch(cls, base_url, map_id=0, encoding=None, session=None):
+        session = session or requests.Session()
+        data = _get(session, base_url, {"map_id": map_id, "encoding": encoding})
+        return cls(base_url, data["map_id"], decode_fog(data), data.get("tick", 0), encoding, session)
+
+    @property
+    def width(self):
+        return self.fogged.shape[1]
+
+    @property
+    def height(self):
+        return self.fogged.shape[0]
+
+    def update(self):
+        """Fetch the cells changed since the last update. Returns the number of cells changed."""
+        data = _get(
+            self.session, self.base_url, {"map_id": self.map_id, "since_tick": self.tick, "encoding": self.encoding}
+        )
+        if data.get("full"):
+            self.full_fetches += 1
+        else:
+            self.delta_fetches += 1
+        changed = apply_fog_delta(self.fogged, data)
+        self.tick = data["tick"]
+        return changed
+
+    async def watch(self, on_change=None):
+        """
+        Apply a delta for every fog_updated event on this map. Runs until cancelled.
+        on_change(grid, event_data, cells_changed) is called after each update.
+        """
+        client = SseClient(self.base_url, types=["fog_updated"])
+        async for event in client.events():
+            if event.event != "fog_updated":
+                continue
+            data = event.json()
+            if data.get("map_id") != self.map_id:
+                continue
+            changed = await asyncio.to_thread(self.update)
+            if on_change:
+                on_change(self, data, changed)
+
+
+def _get(session, base_url, params):
+    resp = session.get(f"{base_url.rstrip('/')}/api/v1/map/fog-grid", params=params, timeout=10)
+    resp.raise_for_status()
+    body = resp.json()
+    if not body.get("success", True):
+        raise RuntimeError(f"API error: {body.get('errors') or body.get('message')}")
+    return body.get("data", body)
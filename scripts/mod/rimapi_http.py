@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Conditional GET helper for polling RIMAPI endpoints.
+
+Cached endpoints (e.g. /api/v1/colonists, /api/v1/resources/stored) return a
+strong ETag. ConditionalClient remembers the ETag and parsed body of every
+URL + query it fetched and sends `If-None-Match` on the next poll; while the
+data is unchanged the server answers `304 Not Modified` with no body and the
+previous JSON is returned again without downloading or parsing anything.
+
+    client = ConditionalClient()
+    data = client.get_json("http://localhost:8765/api/v1/colonists")
+    client.not_modified    # polls answered with 304 so far
+
+Usage:
+    python rimapi_http.py                       # polls /api/v1/colonists
+    python rimapi_http.py http://localhost:8765/api/v1/resources/stored --count 20
+"""
+
+import argparse
+import time
+
+import requests
+
+
+class ConditionalClient:
+    """requests.Session wrapper that revalidates repeated GETs with If-None-Match."""
+
+    def __init__(self, session=None):
+        self.session = session or requests.Session()
+        self._cache = {}  # (url, sorted params) -> (etag, json)
+        self.requests = 0
+        self.not_modified = 0
+
+    def get_json(self, url, params=None, timeout=5.0):
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+
+        resp = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        self.requests += 1
+        if resp.status_code == 304 and cached:
+            self.not_modified += 1
+            return cached[1]
+
+        resp.raise_for_status()
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._cache[key] = (etag, data)
+        else:
+            self._cache.pop(key, None)
+        return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url", nargs="?", default="http://localhost:8765/api/v1/colonists")
+    parser.add_argument("--count", type=int, default=10, help="Number of polls")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between polls")
+    args = parser.parse_args()
+
+    client = ConditionalClient()
+    for _ in range(args.count):
+        start = time.perf_counter()
+        before = client.not_modified
+        try:
+            client.get_json(args.url)
+        except requests.RequestException as e:
+            print(f"❌ {e}")
+            return
+        status = "304" if client.not_modified > before else "200"
+        print(f"{status}  {(time.perf_counter() - start) * 1000.0:7.2f} ms")
+        time.sleep(args.interval)
+
+    print(f"\n📊 {client.not_modified}/{client.requests} polls answered with 304 Not Modified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Asyncio SSE client for the RimWorld REST API event stream (/api/v1/events).
+
+Shared by the scripts in this folder and in tests/ instead of each one
+re-implementing the stream parsing on top of requests.iter_lines.
+
+- Parses the raw byte stream incrementally: complete frames are decoded in
+  one call per read instead of line by line.
+- Handles multi-line `data:`, `id:`, `retry:` and comment lines.
+- Reconnects automatically and sends `Last-Event-ID` on reconnect.
+- Passes event filters to the server (`?types=`), so unwanted events are
+  never serialized or sent.
+- Optional server-side batching (`?batch_ms=`); `batch` frames are unpacked
+  so callers still see one SseEvent per game event.
+- Optional pawn watches (`?watch_pawns=`): the server pushes
+  `pawn_state_changed` events when a watched pawn's health, downed/dead state,
+  position or job changes, instead of the caller polling pawn details.
+- Standard library only, so a single process can follow the streams of many
+  RimWorld instances without a thread per connection.
+
+Usage:
+    python rimapi_sse.py                                  # localhost:8765
+    python rimapi_sse.py http://host-a:8765 http://host-b:8765
+    python rimapi_sse.py "localhost:8765/api/v1/events?types=colonist_ate,pawn_*"
+"""
+
+import asyncio
+import json
+import re
+import sys
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_URL = "http://localhost:8765/api/v1/events"
+EVENTS_PATH = "/api/v1/events"
+DEFAULT_RETRY_MS = 3000
+# Server sends a heartbeat every 3 seconds, so a silent socket for longer than
+# this is treated as a dead connection.
+DEFAULT_READ_TIMEOUT = 15.0
+READ_SIZE = 64 * 1024
+
+
+_UNSET = object()
+
+
+class SseEvent:
+    """A single dispatched server-sent event."""
+
+    __slots__ = ("event", "_data", "id", "retry", "source", "_payload")
+
+    def __init__(
+        self,
+        event: str = "message",
+        data: Optional[str] = "",
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+        source: Optional[str] = None,
+        payload: Any = _UNSET,
+    ):
+        self.event = event
+        self._data = data
+        self.id = id
+        self.retry = retry
+        self.source = source
+        self._payload = payload
+
+    @property
+    def data(self) -> str:
+        """Raw data field. Events unpacked from a batch are re-encoded only if asked for."""
+        if self._data is None:
+            self._data = json.dumps(self._payload, separators=(",", ":"), ensure_ascii=False)
+        return self._data
+
+    def json(self):
+        """Return the decoded JSON payload, or None if data is not valid JSON."""
+        if self._payload is _UNSET:
+            if not self._data:
+                self._payload = {}
+            else:
+                try:
+                    self._payload = json.loads(self._data)
+                except json.JSONDecodeError:
+                    self._payload = None
+        return self._payload
+
+    def __repr__(self):
+        return f"SseEvent(event={self.event!r}, data={self.data!r}, id={self.id!r}, retry={self.retry!r}, source={self.source!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, SseEvent):
+            return NotImplemented
+        return (self.event, self.data, self.id, self.retry, self.source) == (
+            other.event, other.data, other.id, other.retry, other.source
+        )
+
+
+def unpack_batch(batch: SseEvent) -> List[SseEvent]:
+    """Split a `batch` event (JSON array of {id, event, data}) into single events."""
+    items = batch.json()
+    if not isinstance(items, list):
+        return []
+    events = []
+    for item in items:
+        item_id = item.get("id")
+        events.append(SseEvent(
+            item.get("event", "message"),
+            None,
+            str(item_id) if item_id is not None else batch.id,
+            source=batch.source,
+            payload=item.get("data"),
+        ))
+    return events
+
+
+class SseHttpError(Exception):
+    """Raised when the events endpoint answers with a non-200 status."""
+
+    def __init__(self, status: int, reason: str = ""):
+        super().__init__(f"SSE endpoint returned {status} {reason}".strip())
+        self.status = status
+
+
+class SseParser:
+    """
+    Incremental text/event-stream parser.
+
+    Feed it raw bytes as they arrive from the socket; it returns every event
+    completed by that chunk. Lines end with LF or CRLF (the server only ever
+    sends LF).
+
+    Frames in the shape the server writes (`id`, `event`, one `data` line) are
+    matched in a single regex step; anything else goes through the generic
+    line-by-line path.
+    """
+
+    _FRAME = re.compile(r"(?:id: ?([^\n\0]*)\n)?(?:event: ?([^\n]*)\n)?data: ?([^\n]*)")
+
+    def __init__(self):
+        self._pending = b""
+        self._event_type: Optional[str] = None
+        self._data: List[str] = []
+        self._retry: Optional[int] = None
+        self.last_event_id: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[SseEvent]:
+        buffer = self._pending + chunk if self._pending else chunk
+        if b"\r" in buffer:
+            buffer = buffer.replace(b"\r\n", b"\n")
+
+        # Only complete frames (terminated by a blank line) are parsed; the
+        # tail waits for the next chunk. Since a frame never ends inside a
+        # UTF-8 sequence, the complete part is decoded in one call.
+        cut = buffer.rfind(b"\n\n")
+        if cut < 0:
+            self._pending = buffer
+            return []
+        self._pending = buffer[cut + 2:]
+        text = buffer[:cut].decode("utf-8", errors="replace")
+
+        events = []
+        match_frame = self._FRAME.fullmatch
+        last_id = self.last_event_id
+        for frame in text.split("\n\n"):
+            match = match_frame(frame)
+            if match:
+                event_id, event_type, data = match.groups()
+                if event_id is not None:
+                    last_id = event_id
+                events.append(SseEvent(event_type or "message", data, last_id))
+                continue
+
+            self.last_event_id = last_id
+            for line in frame.split("\n"):
+                self._process_line(line)
+            last_id = self.last_event_id
+            if self._data:
+                events.append(self._dispatch())
+            else:
+                self._event_type = None
+                self._retry = None
+
+        self.last_event_id = last_id
+        return events
+
+    def _process_line(self, line: str):
+        if not line or line[0] == ":":
+            return
+
+        field, sep, value = line.partition(":")
+        if sep and value[:1] == " ":
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self._retry = int(value)
+
+    def _dispatch(self) -> SseEvent:
+        event = SseEvent(
+            self._event_type or "message",
+            "\n".join(self._data),
+            self.last_event_id,
+            self._retry,
+        )
+        self._event_type = None
+        self._data = []
+        self._retry = None
+        return event
+
+
+class SseClient:
+    """
+    Follows /api/v1/events of a single RimWorld instance.
+
+    `events()` is an async generator that yields SseEvent objects forever,
+    reconnecting after `retry_ms` (or the server supplied `retry:` value) and
+    resuming with `Last-Event-ID` when the connection drops. The server replays
+    the events logged since that id; `replay_gaps` counts reconnects where it
+    could not replay all of them.
+
+    `types` limits the stream to the given event names or glob patterns
+    (e.g. `["colonist_ate", "pawn_*"]`). `connected` and `error` are always
+    delivered, and filtered-out heartbeats arrive as keep-alive comments.
+
+    `batch_ms` asks the server to coalesce events into one frame per window;
+    the batches are unpacked here, so `events()` yields the same events either way.
+
+    `watch_pawns` registers pawn IDs for `pawn_state_changed` events, limited to
+    `watch_fields` (`health`, `downed`, `dead`, `position`, `job`; default all).
+    Health changes smaller than `health_threshold` and moves shorter than
+    `position_threshold` cells are not reported. The first event after each
+    (re)connect holds the full state of every watched pawn.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        *,
+        types: Optional[Iterable[str]] = None,
+        batch_ms: int = 0,
+        watch_pawns: Optional[Iterable[int]] = None,
+        watch_fields: Optional[Iterable[str]] = None,
+        health_threshold: Optional[float] = None,
+        position_threshold: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reconnect: bool = True,
+        retry_ms: int = DEFAULT_RETRY_MS,
+        connect_timeout: float = 10.0,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+    ):
+        self.url = with_query(normalize_events_url(url), types=",".join(types) if types is not None else None,
+                              batch_ms=str(batch_ms) if batch_ms else None)
+        if watch_pawns is not None:
+            self.url = with_query(
+                self.url,
+                watch_pawns=",".join(str(i) for i in watch_pawns),
+                watch_fields=",".join(watch_fields) if watch_fields is not None else None,
+                health_threshold=str(health_threshold) if health_threshold is not None else None,
+                position_threshold=str(position_threshold) if position_threshold is not None else None,
+            )
+        self.batch_ms = batch_ms
+        self.headers = dict(headers or {})
+        self.reconnect = reconnect
+        self.retry_ms = retry_ms
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.last_event_id: Optional[str] = None
+        self.connected = False
+        self.reconnects = 0
+        self.replay_gaps = 0
+        self.reads = 0
+        self.frames = 0
+
+    async def events(self) -> AsyncIterator[SseEvent]:
+        while True:
+            try:
+                async for event in self._stream_once():
+                    yield event
+            except SseHttpError as e:
+                if not self.reconnect or 400 <= e.status < 500:
+                    raise
+                print(f"[SSE] {self.url}: {e}", file=sys.stderr)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                if not self.reconnect:
+                    raise
+                print(f"[SSE] {self.url}: connection lost ({e!r})", file=sys.stderr)
+            finally:
+                self.connected = False
+
+            if not self.reconnect:
+                return
+
+            self.reconnects += 1
+            await asyncio.sleep(self.retry_ms / 1000.0)
+
+    async def _stream_once(self) -> AsyncIterator[SseEvent]:
+        parts = urlsplit(self.url)
+        host = parts.hostname or "localhost"
+        port = parts.port or 80
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), self.connect_timeout
+        )
+        try:
+            writer.write(self._build_request(host, port, target))
+            await writer.drain()
+
+            headers = await self._read_response_head(reader)
+            chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+            self.connected = True
+
+            parser = SseParser()
+            parser.last_event_id = self.last_event_id
+            body = _read_chunked(reader, self.read_timeout) if chunked else _read_raw(reader, self.read_timeout)
+
+            async for chunk in body:
+                self.reads += 1
+                for event in parser.feed(chunk):
+                    self.frames += 1
+                    if event.retry is not None:
+                        self.retry_ms = event.retry
+                    if event.event == "connected":
+                        self._check_replay(event)
+                    self.last_event_id = parser.last_event_id
+                    event.source = self.url
+                    if event.event == "batch" and self.batch_ms:
+                        for item in unpack_batch(event):
+                            yield item
+                    else:
+                        yield event
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _check_replay(self, event: SseEvent):
+        """The server reports in `connected` whether it could replay everything we missed."""
+        replay = (event.json() or {}).get("replay")
+        if replay and not replay.get("complete", True):
+            self.replay_gaps += 1
+            print(
+                f"[SSE] {self.url}: events after id {replay.get('from')} were lost "
+                f"(replayed {replay.get('events', 0)})",
+                file=sys.stderr,
+            )
+
+    def _build_request(self, host: str, port: int, target: str) -> bytes:
+        headers = {
+            "Host": f"{host}:{port}",
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "User-Agent": "RimAPI-SSE/1.0",
+        }
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        headers.update(self.headers)
+
+        lines = [f"GET {target} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _read_response_head(self, reader: asyncio.StreamReader) -> Dict[str, str]:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.connect_timeout)
+        lines = head.decode("latin-1").split("\r\n")
+
+        status_parts = lines[0].split(" ", 2)
+        status = int(status_parts[1])
+        if status != 200:
+            raise SseHttpError(status, status_parts[2] if len(status_parts) > 2 else "")
+
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        return headers
+
+
+async def _read_raw(reader: asyncio.StreamReader, timeout: Optional[float]) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await asyncio.wait_for(reader.read(READ_SIZE), timeout)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _read_chunked(reader: asyncio.StreamReader, timeout: Optional[float]) -> AsyncIterator[bytes]:
+    while True:
+        size_line = await asyncio.wait_for(reader.readline(), timeout)
+        if not size_line:
+            return
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            return
+        chunk = await asyncio.wait_for(reader.readexactly(size + 2), timeout)
+        yield chunk[:-2]
+
+
+def normalize_events_url(url: str) -> str:
+    """Accept either a full events URL or just a server base URL."""
+    parts = urlsplit(url if "://" in url else f"http://{url}")
+    if parts.path in ("", "/"):
+        url = f"{parts.scheme}://{parts.netloc}{EVENTS_PATH}"
+        if parts.query:
+            url += "?" + parts.query
+        return url
+    return parts.geturl()
+
+
+def with_query(url: str, **params: Optional[str]) -> str:
+    """Add (or replace) query parameters of an events URL; None values are left alone."""
+    params = {k: v for k, v in params.items() if v is not None}
+    if not params:
+        return url
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in params]
+    query.extend(params.items())
+    return urlunsplit(parts._replace(query=urlencode(query, safe=",*?")))
+
+
+async def merge_streams(clients: Iterable[SseClient]) -> AsyncIterator[SseEvent]:
+    """
+    Follow several instances at once and yield their events as they arrive.
+
+    Every event carries `source` so callers can tell instances apart.
+    """
+    clients = list(clients)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+    finished = object()
+
+    async def pump(client: SseClient):
+        try:
+            async for event in client.events():
+                await queue.put(event)
+        except Exception as e:
+            print(f"[SSE] {client.url}: stopped ({e})", file=sys.stderr)
+        finally:
+            await queue.put(finished)
+
+    tasks = [asyncio.create_task(pump(c)) for c in clients]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is finished:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _print_events(urls: List[str]):
+    clients = [SseClient(url) for url in urls]
+    for client in clients:
+        print(f"🔗 Following {client.url}")
+
+    async for event in merge_streams(clients):
+        print(f"[{event.source}] {event.event} (id={event.id}): {event.data}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_print_events(sys.argv[1:] or [DEFAULT_URL]))
+    except KeyboardInterrupt:
+        print("\n👋 Disconnected")
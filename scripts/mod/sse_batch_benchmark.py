@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+SSE batching benchmark: socket writes/reads and client CPU per batch window.
+
+For every window in --windows it subscribes with /api/v1/events?batch_ms=N,
+pushes a steady stream of synthetic events through POST /api/v1/dev/events/emit
+and reports:
+  - server writes   socket writes made by the server for this client
+  - client reads    chunks read from the socket by the client
+  - frames          SSE frames parsed (one per batch when batching)
+  - cpu             CPU time of the event loop thread (socket reads, parsing,
+                    unpacking); REST calls run on worker threads and are excluded
+
+batch_ms=0 is the unbatched baseline.
+
+Usage:
+    python sse_batch_benchmark.py
+    python sse_batch_benchmark.py --windows 0,50,250,1000 --rate 2000 --duration 10
+"""
+
+import argparse
+import asyncio
+import time
+
+import requests
+
+from rimapi_sse import SseClient
+
+BASE_URL = "http://localhost:8765"
+EMIT_INTERVAL = 0.02  # seconds between emit calls
+
+
+def emit(base_url, event_type, count, size):
+    resp = requests.post(
+        f"{base_url}/api/v1/dev/events/emit",
+        params={"type": event_type, "count": count, "size": size},
+        timeout=10,
+    )
+    resp.raise_for_status()
+
+
+def client_stats(base_url, event_type):
+    resp = requests.get(f"{base_url}/api/v1/events/stats", timeout=10)
+    resp.raise_for_status()
+    for client in resp.json()["data"].get("clients", []):
+        if client.get("types") == [event_type]:
+            return client
+    return {}
+
+
+async def produce(base_url, event_type, rate, duration, size):
+    per_call = max(1, int(rate * EMIT_INTERVAL))
+    sent = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        await asyncio.to_thread(emit, base_url, event_type, per_call, size)
+        sent += per_call
+        await asyncio.sleep(EMIT_INTERVAL)
+    return sent
+
+
+async def measure(base_url, batch_ms, rate, duration, size):
+    # A distinct event type per run lets us find this client in /events/stats
+    event_type = f"test.sse_batch_bench_{batch_ms}"
+    client = SseClient(base_url, types=[event_type], batch_ms=batch_ms, reconnect=False)
+    received = 0
+    connected = asyncio.Event()
+
+    async def consume():
+        nonlocal received
+        async for event in client.events():
+            if event.event == "connected":
+                connected.set()
+            elif event.event == event_type:
+                event.json()
+                received += 1
+
+    task = asyncio.create_task(consume())
+    try:
+        await asyncio.wait_for(connected.wait(), 10)
+        cpu_start = time.thread_time()
+        sent = await produce(base_url, event_type, rate, duration, size)
+
+        deadline = time.perf_counter() + 5 + batch_ms / 1000.0
+        while received < sent and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        cpu = time.thread_time() - cpu_start
+        stats = await asyncio.to_thread(client_stats, base_url, event_type)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    return {
+        "batch_ms": batch_ms,
+        "sent": sent,
+        "received": received,
+        "server_writes": stats.get("writes", 0),
+        "client_reads": client.reads,
+        "frames": client.frames,
+        "cpu_ms": cpu * 1000.0,
+    }
+
+
+async def main_async(args):
+    print(f"🔗 {args.url}: ~{args.rate} events/s for {args.duration}s, {args.size} byte payloads")
+    print(
+        f"{'batch_ms':>9}{'received':>16}{'srv writes':>12}{'cli reads':>11}"
+        f"{'frames':>9}{'cpu ms':>9}{'us/event':>10}"
+    )
+    for batch_ms in args.windows:
+        r = await measure(args.url, batch_ms, args.rate, args.duration, args.size)
+        per_event = r["cpu_ms"] * 1000.0 / r["received"] if r["received"] else 0.0
+        flag = "" if r["received"] == r["sent"] else "  ⚠️ incomplete"
+        print(
+            f"{r['batch_ms']:>9}{r['received']:>8}/{r['sent']:<7}{r['server_writes']:>12}"
+            f"{r['client_reads']:>11}{r['frames']:>9}{r['cpu_ms']:>9.1f}{per_event:>10.2f}{flag}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--windows", default="0,50,250,1000", help="Comma separated batch_ms values")
+    parser.add_argument("--rate", type=int, default=1000, help="Target events per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per window")
+    parser.add_argument("--size", type=int, default=128, help="Payload padding in bytes")
+    args = parser.parse_args()
+    args.windows = [int(w) for w in args.windows.split(",")]
+
+    try:
+        asyncio.run(main_async(args))
+    except requests.RequestException as e:
+        print(f"❌ {e}")
+
+
+if __name__ == "__main__":
+    main()
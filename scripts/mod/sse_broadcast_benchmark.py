@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SSE broadcast load generator: main-thread tick cost vs. number of subscribers.
+
+For every subscriber count it opens that many /api/v1/events connections,
+fires a burst of synthetic events through POST /api/v1/dev/events/emit, waits
+until every subscriber received them and reads /api/v1/events/stats before
+and after. The server measures the time SseService.ProcessTick spends on the
+game thread, so the numbers are the cost the game actually pays.
+
+Usage:
+    python sse_broadcast_benchmark.py
+    python sse_broadcast_benchmark.py --clients 1,10,50,100,200 --events 500 --size 512
+"""
+
+import argparse
+import asyncio
+import time
+
+import requests
+
+from rimapi_sse import SseClient
+
+BASE_URL = "http://localhost:8765"
+EVENT_TYPE = "test.sse_benchmark"
+
+
+def get_stats(base_url):
+    resp = requests.get(f"{base_url}/api/v1/events/stats", timeout=10)
+    resp.raise_for_status()
+    return resp.json()["data"]
+
+
+def emit(base_url, count, size):
+    resp = requests.post(
+        f"{base_url}/api/v1/dev/events/emit",
+        params={"type": EVENT_TYPE, "count": count, "size": size},
+        timeout=10,
+    )
+    resp.raise_for_status()
+
+
+class Subscriber:
+    def __init__(self, base_url):
+        self.client = SseClient(base_url, types=[EVENT_TYPE], reconnect=False, read_timeout=None)
+        self.received = 0
+        self.connected = asyncio.Event()
+
+    async def run(self):
+        async for event in self.client.events():
+            if event.event == "connected":
+                self.connected.set()
+            elif event.event == EVENT_TYPE:
+                self.received += 1
+
+
+async def measure(base_url, client_count, events, size, timeout):
+    subscribers = [Subscriber(base_url) for _ in range(client_count)]
+    tasks = [asyncio.create_task(s.run()) for s in subscribers]
+    try:
+        await asyncio.wait_for(asyncio.gather(*(s.connected.wait() for s in subscribers)), timeout)
+
+        before = await asyncio.to_thread(get_stats, base_url)
+        start = time.perf_counter()
+        await asyncio.to_thread(emit, base_url, events, size)
+
+        deadline = start + timeout
+        while any(s.received < events for s in subscribers) and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        after = await asyncio.to_thread(get_stats, base_url)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    delivered = sum(s.received for s in subscribers)
+    broadcast = after["events_broadcast"] - before["events_broadcast"]
+    tick_ms = after["total_tick_ms"] - before["total_tick_ms"]
+    busy_ticks = after["busy_ticks"] - before["busy_ticks"]
+
+    return {
+        "clients": client_count,
+        "delivered": delivered,
+        "expected": client_count * events,
+        "encoded": after["frames_encoded"] - before["frames_encoded"],
+        "tick_ms": tick_ms,
+        "us_per_event": tick_ms * 1000.0 / broadcast if broadcast else 0.0,
+        "avg_tick_ms": tick_ms / busy_ticks if busy_ticks else 0.0,
+        "max_tick_ms": after["max_tick_ms"],
+        "wall_s": elapsed,
+    }
+
+
+async def main_async(args):
+    print(f"🔗 {args.url}: {args.events} events of {args.size} bytes per run")
+    print(
+        f"{'clients':>8}{'delivered':>14}{'encoded':>10}{'tick ms':>10}"
+        f"{'us/event':>10}{'avg tick':>10}{'max tick':>10}{'wall s':>8}"
+    )
+    for client_count in args.clients:
+        r = await measure(args.url, client_count, args.events, args.size, args.timeout)
+        flag = "" if r["delivered"] == r["expected"] else "  ⚠️ incomplete"
+        print(
+            f"{r['clients']:>8}{r['delivered']:>7}/{r['expected']:<6}{r['encoded']:>10}"
+            f"{r['tick_ms']:>10.2f}{r['us_per_event']:>10.1f}{r['avg_tick_ms']:>10.3f}"
+            f"{r['max_tick_ms']:>10.3f}{r['wall_s']:>8.2f}{flag}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=BASE_URL)
+    parser.add_argument("--clients", default="1,10,50,100,200", help="Comma separated subscriber counts")
+    parser.add_argument("--events", type=int, default=500, help="Events per run")
+    parser.add_argument("--size", type=int, default=256, help="Payload padding in bytes")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+    args.clients = [int(c) for c in args.clients.split(",")]
+
+    try:
+        asyncio.run(main_async(args))
+    except requests.RequestException as e:
+        print(f"❌ {e}")
+
+
+if __name__ == "__main__":
+    main()
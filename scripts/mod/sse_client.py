@@ -3,11 +3,12 @@
 SSE Client for RimWorld REST API - Filtered Events Only
 """
 
-import requests
+import asyncio
 import json
-import time
 import sys
 
+from rimapi_sse import SseClient, SseHttpError
+
 # Configuration - Edit these to filter events
 FILTERED_EVENTS = {
     'colonist_ate': True,      # Food consumption events
@@ -19,7 +20,7 @@ FILTERED_EVENTS = {
     'test': False,             # Test events
 }
 
-def rimworld_sse_client():
+async def rimworld_sse_client():
     """SSE client that only shows filtered events"""
     url = "http://localhost:8765/api/v1/events"
     
@@ -30,86 +31,51 @@ def rimworld_sse_client():
             print(f"   ✅ {event_type}")
     print("=" * 50)
     
-    headers = {
-        'Accept': 'text/event-stream',
-        'Cache-Control': 'no-cache',
-        'User-Agent': 'RimWorld-SSE-Test/1.0'
-    }
+    # Let the server drop everything else; verbose mode still wants to see what is filtered out
+    verbose = '-v' in sys.argv or '--verbose' in sys.argv
+    types = None if verbose else [event_type for event_type, enabled in FILTERED_EVENTS.items() if enabled]
+    client = SseClient(url, types=types or None, headers={'User-Agent': 'RimWorld-SSE-Test/1.0'})
+    total_messages = 0
+    filtered_messages = 0
+    
+    print("✅ Waiting for filtered events...")
+    print("💡 Make colonists eat food to test 'colonist_ate' events")
+    print("=" * 50)
     
     try:
-        response = requests.get(url, stream=True, timeout=30, headers=headers)
-        
-        if response.status_code != 200:
-            print(f"❌ SSE endpoint returned: {response.status_code}")
-            return
-        
-        print("✅ Connected! Waiting for filtered events...")
-        print("💡 Make colonists eat food to test 'colonist_ate' events")
-        print("=" * 50)
-        
-        buffer = ""
-        total_messages = 0
-        filtered_messages = 0
-        
-        for line in response.iter_lines(decode_unicode=True):
-            if line is None:
-                continue
-                
-            if line.strip() == "":  # Empty line = end of message
-                if buffer.strip():
-                    total_messages += 1
-                    if process_and_filter_message(buffer):
-                        filtered_messages += 1
-                    buffer = ""
-                continue
-                
-            buffer += line + "\n"
-            
-    except requests.exceptions.ConnectTimeout:
-        print("❌ Connection timeout")
-    except requests.exceptions.ConnectionError:
-        print("❌ Connection refused")
-    except KeyboardInterrupt:
+        async for event in client.events():
+            total_messages += 1
+            if process_and_filter_message(event):
+                filtered_messages += 1
+    except SseHttpError as e:
+        print(f"❌ SSE endpoint returned: {e.status}")
+    except asyncio.CancelledError:
+        pass
+    finally:
         print(f"\n👋 Disconnected - Received {total_messages} total messages, displayed {filtered_messages}")
-    except Exception as e:
-        print(f"💥 Error: {e}")
 
-def process_and_filter_message(message):
+def process_and_filter_message(event):
     """Process message and only display if it matches our filters"""
-    lines = [line.strip() for line in message.strip().split('\n') if line.strip()]
-    
-    event_type = "message"
-    data_content = ""
-    
-    for line in lines:
-        if line.startswith('event:'):
-            event_type = line[6:].strip()
-        elif line.startswith('data:'):
-            data_content = line[5:].strip()
+    event_type = event.event
     
     # Check if this event type should be displayed
     if event_type in FILTERED_EVENTS and FILTERED_EVENTS[event_type]:
         print(f"\n🎉 NEW {event_type.upper()} EVENT:")
         print("=" * 50)
         
-        # Parse and display all message details
-        for line in lines:
-            if line.startswith('event:'):
-                print(f"🎪 Event Type: {line[6:].strip()}")
-            elif line.startswith('id:'):
-                print(f"🆔 ID: {line[3:].strip()}")
-            elif line.startswith('retry:'):
-                print(f"🔁 Retry: {line[6:].strip()}")
-            elif line.startswith(':'):
-                print(f"💬 Comment: {line[1:].strip()}")
+        print(f"🎪 Event Type: {event_type}")
+        if event.id is not None:
+            print(f"🆔 ID: {event.id}")
+        if event.retry is not None:
+            print(f"🔁 Retry: {event.retry}")
         
-        if data_content:
-            try:
-                data_obj = json.loads(data_content)
+        if event.data:
+            data_obj = event.json()
+            if data_obj is not None:
                 print("📊 Data:")
                 print(json.dumps(data_obj, indent=2, ensure_ascii=False))
-            except json.JSONDecodeError:
-                print(f"📝 Data (raw): {data_content}")
+            else:
+                print(f"📝 Data (raw): {event.data}")
         
         print("=" * 50)
         return True
@@ -174,4 +140,7 @@ Available events: colonist_ate, gameUpdate, connected, gameState, heartbeat, res
     show_config()
     print("=" * 50)
     
-    rimworld_sse_client()
\ No newline at end of file
+    try:
+        asyncio.run(rimworld_sse_client())
+    except KeyboardInterrupt:
+        pass
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
-import json
+import asyncio
 import sys
-import time
 from collections import defaultdict
 
-import requests
+from rimapi_http import ConditionalClient
+from rimapi_sse import SseClient
 
 # --- CONFIG ---
 
@@ -12,8 +12,16 @@ SSE_URL = "http://localhost:8765/api/v1/events"
 RESOURCES_URL = "http://localhost:8765/api/v1/resources/stored"
 COLONISTS_URL = "http://localhost:8765/api/v1/colonists"
 
+# Polls send If-None-Match, so unchanged resources and colonists come back as 304
+HTTP = ConditionalClient()
+
 TICKS_PER_DAY = 60000  # RimWorld vanilla
 
+# Only these events are requested from the server (?types=)
+SSE_EVENT_TYPES = ["colonist_ate", "make_recipe_product", "date_changed"]
+# Daily stats don't need every meal the instant it happens; let the server batch them
+SSE_BATCH_MS = 250
+
 
 # --- Data aggregation ---
 
@@ -407,9 +415,7 @@ class FoodStats:
 def fetch_stored_items(map_id=0, category="food_meals", timeout=5.0):
     try:
         params = {"map_id": map_id, "category": category}
-        resp = requests.get(RESOURCES_URL, params=params, timeout=timeout)
-        resp.raise_for_status()
-        return resp.json()
+        return HTTP.get_json(RESOURCES_URL, params=params, timeout=timeout)
     except Exception as e:
         print(f"[WARN] Failed to fetch stored resources: {e}", file=sys.stderr)
         return []
@@ -421,9 +427,7 @@ def fetch_colonist_hunger(timeout=5.0):
     """
     try:
         params = {"fields": "id,age,hunger"}
-        resp = requests.get(COLONISTS_URL, params=params, timeout=timeout)
-        resp.raise_for_status()
-        colonists = resp.json() or []
+        colonists = HTTP.get_json(COLONISTS_URL, params=params, timeout=timeout) or []
 
         count = len(colonists)
         if count == 0:
@@ -473,96 +477,64 @@ def fetch_colonist_hunger(timeout=5.0):
 
 # --- SSE client ---
 
-def sse_client(url: str):
+async def sse_client(url: str, types=None, batch_ms=0):
     """
-    Minimal SSE client.
+    Yields (event_type, data) pairs; reconnects every 3s while the game is down.
+    Events missed while disconnected are replayed by the server (Last-Event-ID),
+    so meals eaten during a reconnect still count.
     """
-    with requests.get(url, stream=True) as resp:
-        resp.raise_for_status()
-
-        event_type = None
-        data_lines = []
+    async for event in SseClient(url, types=types, batch_ms=batch_ms, retry_ms=3000).events():
+        data = event.json()
+        if data is None:
+            print(
+                f"[WARN] Failed to decode JSON for event '{event.event}': {event.data!r}",
+                file=sys.stderr
+            )
+            data = {}
+        yield event.event, data
 
-        for raw_line in resp.iter_lines(decode_unicode=False):
-            if raw_line is None:
-                continue
 
-            line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+# --- Main loop ---
 
-            if not line:
-                if event_type and data_lines:
-                    raw_data = "\n".join(data_lines)
-                    try:
-                        data = json.loads(raw_data)
-                    except json.JSONDecodeError:
-                        print(
-                            f"[WARN] Failed to decode JSON for event '{event_type}': {raw_data!r}",
-                            file=sys.stderr
-                        )
-                        data = {}
-                    yield event_type, data
+async def print_previous_day(stats: FoodStats, day: int):
+    # REST calls are blocking, keep them off the event loop so the stream keeps draining
+    stored_items = await asyncio.to_thread(fetch_stored_items, map_id=0, category="food_meals")
+    stored_summary = stats.build_stored_summary(stored_items)
+    colonist_snapshot = await asyncio.to_thread(fetch_colonist_hunger)
+    stats.print_day(day, stored_summary, colonist_snapshot)
 
-                event_type = None
-                data_lines = []
-                continue
 
-            if line.startswith("event:"):
-                event_type = line[len("event:"):].strip()
-            elif line.startswith("data:"):
-                data_lines.append(line[len("data:"):].strip())
+async def run(stats: FoodStats):
+    last_day_seen = None
 
+    print(f"Connecting to SSE at {SSE_URL} ...")
+    async for event_type, data in sse_client(SSE_URL, SSE_EVENT_TYPES, SSE_BATCH_MS):
+        if event_type == "colonist_ate":
+            stats.handle_colonist_ate(data)
+        elif event_type == "make_recipe_product":
+            stats.handle_make_recipe_product(data)
+        elif event_type == "date_changed":
+            ticks = data.get("ticksGame") or data.get("ticks") or 0
+            current_day = ticks // TICKS_PER_DAY
+
+            if last_day_seen is None:
+                previous_day = current_day - 1
+                if previous_day >= 0:
+                    await print_previous_day(stats, previous_day)
+                last_day_seen = current_day
+            elif current_day > last_day_seen:
+                await print_previous_day(stats, last_day_seen)
+                last_day_seen = current_day
 
-# --- Main loop ---
 
 def main():
     stats = FoodStats()
-    last_day_seen = None
-
-    while True:
-        print(f"Connecting to SSE at {SSE_URL} ...")
-        try:
-            for event_type, data in sse_client(SSE_URL):
-                if event_type == "colonist_ate":
-                    stats.handle_colonist_ate(data)
-                elif event_type == "make_recipe_product":
-                    stats.handle_make_recipe_product(data)
-                elif event_type == "date_changed":
-                    ticks = data.get("ticksGame") or data.get("ticks") or 0
-                    current_day = ticks // TICKS_PER_DAY
-
-                    if last_day_seen is None:
-                        previous_day = current_day - 1
-                        if previous_day >= 0:
-                            stored_items = fetch_stored_items(map_id=0, category="food_meals")
-                            stored_summary = stats.build_stored_summary(stored_items)
-                            colonist_snapshot = fetch_colonist_hunger()
-                            stats.print_day(previous_day, stored_summary, colonist_snapshot)
-                        last_day_seen = current_day
-                    else:
-                        if current_day > last_day_seen:
-                            previous_day = last_day_seen
-                            stored_items = fetch_stored_items(map_id=0, category="food_meals")
-                            stored_summary = stats.build_stored_summary(stored_items)
-                            colonist_snapshot = fetch_colonist_hunger()
-                            stats.print_day(previous_day, stored_summary, colonist_snapshot)
-                            last_day_seen = current_day
-
-                time.sleep(0.01)
-
-            print("[INFO] SSE stream ended (server closed connection). Reconnecting in 3s...")
-            time.sleep(3)
-
-        except KeyboardInterrupt:
-            print("\nInterrupted by user. Printing full summary...")
-            stats.print_summary()
-            return
-        except requests.RequestException as e:
-            print(f"[ERROR] SSE connection error: {e}. Reconnecting in 3s...")
-            time.sleep(3)
-        except Exception as e:
-            print(f"[ERROR] Unexpected error in main loop: {e}. Reconnecting in 3s...")
-            time.sleep(3)
+    try:
+        asyncio.run(run(stats))
+    except KeyboardInterrupt:
+        print("\nInterrupted by user. Printing full summary...")
+        stats.print_summary()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: legacy requests.iter_lines SSE parsing vs rimapi_sse.SseParser.
+
+Feeds a recorded (or synthesized) /api/v1/events byte stream through:
+  - legacy_concat: sse_client.py style (decoded lines, `buffer += line + "\\n"`)
+  - legacy_lines:  sse_food_analyze.py style (per-line decode, data_lines list)
+  - rimapi_sse:    incremental byte parser from rimapi_sse.py
+and reports events/sec for each.
+
+Record a real stream with:
+    curl -sN http://localhost:8765/api/v1/events > events.raw
+
+Usage:
+    python sse_parser_benchmark.py                      # synthesize 8 MB
+    python sse_parser_benchmark.py --size-mb 32
+    python sse_parser_benchmark.py --input events.raw --chunk-size 512
+"""
+
+import argparse
+import json
+import random
+import time
+
+from rimapi_sse import SseParser
+
+# requests.Response.iter_lines default chunk size
+ITER_CHUNK_SIZE = 512
+
+
+# --- Stream synthesis ---
+
+def synthesize_stream(size_mb: float, seed: int = 1) -> bytes:
+    """Build a stream that looks like a busy colony: meals, updates, heartbeats."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts = []
+    total = 0
+    tick = 0
+    event_id = 0
+
+    while total < target:
+        tick += rng.randint(1, 120)
+        event_id += 1
+        roll = rng.random()
+
+        if roll < 0.45:
+            event_type = "colonist_ate"
+            payload = {
+                "colonist": {"name": f"Pawn{rng.randint(1, 50)}", "hungerBefore": rng.random(), "hungerAfter": 1.0},
+                "food": {"defName": "MealSimple", "label": "simple meal", "nutrition": 0.9, "foodType": "Meal"},
+                "ticks": tick,
+            }
+        elif roll < 0.75:
+            event_type = "gameUpdate"
+            payload = {"ticks": tick, "colonists": [{"id": i, "mood": rng.random()} for i in range(10)]}
+        elif roll < 0.9:
+            event_type = "make_recipe_product"
+            payload = {
+                "worker": {"id": rng.randint(100, 999), "name": "Cook"},
+                "result": [{"thing_id": rng.randint(1000, 9999), "def_name": "MealSimple", "label": "simple meal", "nutrition": 0.9}],
+                "recipeDef": {"def_name": "CookMealSimple"},
+                "ticks": tick,
+            }
+        else:
+            event_type = "heartbeat"
+            payload = {"timestamp": "2026-01-01T00:00:00Z", "tick": tick}
+
+        data = json.dumps(payload, separators=(",", ":"))
+        if roll > 0.97:
+            # Multi-line data split over several data: fields
+            data_lines = "".join(f"data: {line}\n" for line in json.dumps(payload, indent=1).split("\n"))
+            frame = f"id: {event_id}\nevent: {event_type}\n{data_lines}\n"
+        else:
+            frame = f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n"
+
+        if roll < 0.01:
+            frame = ": keep-alive\n\n" + frame
+
+        encoded = frame.encode("utf-8")
+        parts.append(encoded)
+        total += len(encoded)
+
+    return b"".join(parts)
+
+
+def chunked(stream: bytes, chunk_size: int):
+    view = memoryview(stream)
+    for i in range(0, len(stream), chunk_size):
+        yield bytes(view[i:i + chunk_size])
+
+
+def iter_lines(chunks, decode_unicode=False):
+    """Same algorithm as requests.Response.iter_lines(delimiter=None)."""
+    pending = None
+    for chunk in chunks:
+        if decode_unicode:
+            chunk = chunk.decode("utf-8", errors="replace")
+        if pending is not None:
+            chunk = pending + chunk
+        lines = chunk.splitlines()
+        if lines and lines[-1] and chunk and lines[-1][-1] == chunk[-1]:
+            pending = lines.pop()
+        else:
+            pending = None
+        yield from lines
+    if pending is not None:
+        yield pending
+
+
+# --- Parsers ---
+
+def parse_legacy_concat(chunks):
+    """sse_client.py: decoded lines glued into a string buffer, then re-split."""
+    events = []
+    buffer = ""
+    for line in iter_lines(chunks, decode_unicode=True):
+        if line.strip() == "":
+            if buffer.strip():
+                lines = [l.strip() for l in buffer.strip().split("\n") if l.strip()]
+                event_type = "message"
+                data_content = ""
+                for l in lines:
+                    if l.startswith("event:"):
+                        event_type = l[6:].strip()
+                    elif l.startswith("data:"):
+                        data_content = l[5:].strip()
+                events.append((event_type, data_content))
+                buffer = ""
+            continue
+        buffer += line + "\n"
+    return events
+
+
+def parse_legacy_lines(chunks):
+    """sse_food_analyze.py: bytes lines decoded one at a time."""
+    events = []
+    event_type = None
+    data_lines = []
+    for raw_line in iter_lines(chunks):
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+        if not line:
+            if event_type and data_lines:
+                events.append((event_type, "\n".join(data_lines)))
+            event_type = None
+            data_lines = []
+            continue
+        if line.startswith("event:"):
+            event_type = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
+    return events
+
+
+def parse_rimapi_sse(chunks):
+    parser = SseParser()
+    events = []
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            events.append((event.event, event.data))
+    return events
+
+
+PARSERS = {
+    "legacy_concat": parse_legacy_concat,
+    "legacy_lines": parse_legacy_lines,
+    "rimapi_sse": parse_rimapi_sse,
+}
+
+
+def run(stream: bytes, chunk_size: int, repeats: int):
+    chunks = list(chunked(stream, chunk_size))
+    mb = len(stream) / (1024 * 1024)
+    print(f"Stream: {mb:.2f} MB in {len(chunks)} chunks of {chunk_size} bytes, best of {repeats}")
+    print(f"{'parser':<16}{'events':>10}{'seconds':>10}{'events/s':>14}{'MB/s':>10}")
+
+    baseline = None
+    for name, parse in PARSERS.items():
+        best = float("inf")
+        count = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            count = len(parse(chunks))
+            best = min(best, time.perf_counter() - start)
+
+        rate = count / best if best else 0.0
+        speedup = f"  x{rate / baseline:.2f}" if baseline else ""
+        baseline = baseline or rate
+        print(f"{name:<16}{count:>10}{best:>10.3f}{rate:>14,.0f}{mb / best:>10.1f}{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="Recorded raw event stream (curl -N output)")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="Size of the synthesized stream")
+    parser.add_argument("--chunk-size", type=int, default=ITER_CHUNK_SIZE, help="Bytes per simulated socket read")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "rb") as f:
+            stream = f.read()
+    else:
+        stream = synthesize_stream(args.size_mb)
+
+    run(stream, args.chunk_size, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
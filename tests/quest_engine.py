@@ -1,9 +1,13 @@
 import requests
-import json
+import asyncio
+import os
 import time
 import threading
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "mod"))
+from rimapi_sse import SseClient
+
 # --- CONFIGURATION ---
 BASE_URL = "http://localhost:8765/api/v1"
 SSE_URL  = f"{BASE_URL}/events"
@@ -122,27 +126,20 @@ def process_event(event_type, data):
         if found_id:
             handle_choice(found_id)
 
+async def listen_for_events():
+    client = SseClient(SSE_URL, types=["dialog_option_selected"])
+    async for event in client.events():
+        if not quest_active: break
+        if not client.reconnects and event.event == "connected":
+            print("[+] Listener: Connected & Ready.")
+        data = event.json()
+        if data is not None:
+            process_event(event.event, data)
+
 def sse_listener_thread():
     print("[-] Listener: Connecting to Event Stream...")
-    current_event_type = None
-
     try:
-        with requests.get(SSE_URL, stream=True) as response:
-            if response.status_code == 200:
-                print("[+] Listener: Connected & Ready.")
-                for line in response.iter_lines():
-                    if not quest_active: break
-                    if line:
-                        decoded = line.decode('utf-8')
-                        if decoded.startswith("event:"):
-                            current_event_type = decoded[6:].strip()
-                        elif decoded.startswith("data:"):
-                            json_str = decoded[5:].strip()
-                            try:
-                                data = json.loads(json_str)
-                                process_event(current_event_type, data)
-                            except json.JSONDecodeError:
-                                pass
+        asyncio.run(listen_for_events())
     except Exception as e:
         print(f"[!] Listener Error: {e}")
 
@@ -1,23 +1,30 @@
+import asyncio
+import os
 import requests
 import sys
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "mod"))
+from rimapi_sse import SseClient
+
 # --- CONFIGURATION ---
 BASE_URL = "http://localhost:8765/api/v1"
 
 # Endpoints
 URL_GET_FACTIONS   = f"{BASE_URL}/factions"
 URL_SET_GOODWILL   = f"{BASE_URL}/faction/goodwill"
-URL_SPAWN_PAWN     = f"{BASE_URL}/pawn/spawn"
+URL_SPAWN_PAWNS    = f"{BASE_URL}/pawns/spawn/batch"
 URL_CLEAR_RECT     = f"{BASE_URL}/map/destroy/rect"
 URL_REPAIR_RECT     = f"{BASE_URL}/map/repair/rect"
 URL_PAWN_DETAILS   = f"{BASE_URL}/pawns/details"
 URL_CREATE_LORD    = f"{BASE_URL}/lords/create"
 URL_ANNOUNCE = f"{BASE_URL}/ui/announce"
+URL_EVENTS         = f"{BASE_URL}/events"
 
 # Battle Settings
-CHECK_INTERVAL = 2.0  # Seconds between checks
 CRITICAL_HEALTH = 0.15 # 15% health (Assumed downed/dying threshold)
+WATCH_FIELDS = ["health", "downed", "dead", "job"]
+HEALTH_THRESHOLD = 0.02 # Smaller health changes are not pushed
 
 def announce_winner(text, color_hex):
     print(f"[-] Announcing: {text}")
@@ -58,43 +65,66 @@ def clear_arena():
     except Exception as e:
         print(f"[!] Error clearing arena: {e}")
 
-def get_pawn_status(pawn_id):
+# Only what the monitor reads, for every pawn in one request
+STATUS_FIELDS = ",".join([
+    "colonist.name",
+    "colonist_medical_info.is_dead",
+    "colonist_medical_info.is_downed",
+    "colonist_medical_info.moving",
+    "colonist_medical_info.consciousness",
+    "colonist_medical_info.health",
+])
+
+def get_pawns_status(pawn_ids):
     """
-    Returns a dictionary with status flags.
+    Returns {pawn_id: status dict} for all pawns, fetched with one bulk details request.
+    Pawns that were not found (or a failed request) count as dead.
     """
+    lost = {"dead": True, "downed": True, "hp": 0, "moving": 0, "name": None}
     try:
-        resp = requests.get(f"{URL_PAWN_DETAILS}?id={pawn_id}")
+        resp = requests.get(URL_PAWN_DETAILS, params={
+            "ids": ",".join(str(i) for i in pawn_ids),
+            "fields": STATUS_FIELDS,
+        })
         if resp.status_code != 200:
-            return {"dead": True, "downed": True, "hp": 0}
-        
-        data = resp.json().get("data", {})
-        med_info = data.get("colonist_medical_info", {})
-        
-        return {
-            "name": data.get("colonist", {}).get('name'),
-            "dead": med_info.get("is_dead", False),
-            "downed": med_info.get("is_downed", False),
-            "moving": med_info.get("moving", 1.0),
-            "consciousness": med_info.get("consciousness", 1.0),
-            "hp": med_info.get("health", 0.0)
-        }
+            return {pawn_id: dict(lost) for pawn_id in pawn_ids}
+
+        statuses = {pawn_id: dict(lost) for pawn_id in pawn_ids}
+        for data in resp.json().get("data", {}).get("pawns", []):
+            med_info = data.get("colonist_medical_info", {})
+            statuses[data["id"]] = {
+                "name": data.get("colonist", {}).get("name"),
+                "dead": med_info.get("is_dead", False),
+                "downed": med_info.get("is_downed", False),
+                "moving": med_info.get("moving", 1.0),
+                "consciousness": med_info.get("consciousness", 1.0),
+                "hp": med_info.get("health", 0.0)
+            }
+        return statuses
     except Exception as e:
-        print(f"[!] Error checking pawn {pawn_id}: {e}")
-        return {"dead": True, "downed": True, "hp": 0}
+        print(f"[!] Error checking pawns {pawn_ids}: {e}")
+        return {pawn_id: dict(lost) for pawn_id in pawn_ids}
 
-def spawn_pawn(x, z, faction, kind):
-    payload = {
+def spawn_pawns(specs):
+    """
+    Spawns every (x, z, faction, kind) spec with one batch request.
+    Returns the pawn IDs in spec order, or None when any pawn failed.
+    """
+    payload = {"pawns": [{
         "pawn_kind": kind,
         "faction": faction,
         "position": {"x": x, "y": 0, "z": z},
         "biological_age": 25
-    }
+    } for x, z, faction, kind in specs]}
     try:
-        resp = requests.post(URL_SPAWN_PAWN, json=payload)
+        resp = requests.post(URL_SPAWN_PAWNS, json=payload)
         if resp.status_code == 200:
             data = resp.json()
-            # Handle different casing from API (Pascal vs Snake)
-            return data.get("data", {}).get("pawn_id") or data.get("pawn_id")
+            for warning in data.get("warnings", []):
+                print(f"[!] {warning}")
+            pawns = (data.get("data") or {}).get("pawns") or []
+            if len(pawns) == len(specs):
+                return [p["pawn_id"] for p in pawns]
     except Exception as e:
         print(f"[!] Spawn failed: {e}")
     return None
@@ -104,12 +134,15 @@ def setup_battle(p_faction, e_faction):
     print("\n--- NEW ROUND STARTING ---")
     
     # 1. Spawn Units
-    def_id = spawn_pawn(11, 11, p_faction, "Mercenary_Gunner")
-    att_id = spawn_pawn(28, 28, e_faction, "Mercenary_Gunner")
+    pawn_ids = spawn_pawns([
+        (11, 11, p_faction, "Mercenary_Gunner"),
+        (28, 28, e_faction, "Mercenary_Gunner"),
+    ])
 
-    if not def_id or not att_id:
+    if not pawn_ids:
         print("[!] Failed to spawn one or both pawns.")
         return None, None
+    def_id, att_id = pawn_ids
 
     print(f"[+] Spawned Defender ({def_id}) vs Attacker ({att_id})")
 
@@ -130,18 +163,41 @@ def create_lord(faction, pawns, job, targets):
     requests.post(URL_CREATE_LORD, json=payload)
 
 def monitor_battle(id_a, id_b):
-    """Loops until one pawn is incapacitated."""
-    print("[-] Monitoring battle...")
-    
-    while True:
-        time.sleep(1.0) # Check every second
+    """Follows both pawns until one is incapacitated."""
+    return asyncio.run(watch_battle(id_a, id_b))
 
-        stat_a = get_pawn_status(id_a)
-        stat_b = get_pawn_status(id_b)
+async def watch_battle(id_a, id_b):
+    """
+    Subscribes to pawn_state_changed events for both pawns. The server pushes
+    only the values that changed, so nothing is polled while they fight.
+    """
+    print("[-] Monitoring battle...")
+    statuses = get_pawns_status([id_a, id_b])
+    for status in statuses.values():
+        status["job"] = None
+
+    client = SseClient(URL_EVENTS, types=["pawn_state_changed"], watch_pawns=[id_a, id_b],
+                       watch_fields=WATCH_FIELDS, health_threshold=HEALTH_THRESHOLD)
+    async for event in client.events():
+        if event.event != "pawn_state_changed":
+            continue
+
+        for pawn in event.json().get("pawns", []):
+            status = statuses[pawn["id"]]
+            if pawn.get("missing"):
+                status.update(dead=True, downed=True, hp=0)
+                continue
+            status["hp"] = pawn.get("health", status["hp"])
+            status["downed"] = pawn.get("downed", status["downed"])
+            status["dead"] = pawn.get("dead", status["dead"])
+            status["job"] = pawn.get("job", status["job"])
+
+        stat_a = statuses[id_a]
+        stat_b = statuses[id_b]
 
         # Log detailed status
-        print(f"    A: {int(stat_a['hp']*100)}% HP (Mov: {int(stat_a['moving']*100)}%) | "
-              f"B: {int(stat_b['hp']*100)}% HP (Mov: {int(stat_b['moving']*100)}%)")
+        print(f"    A: {int(stat_a['hp']*100)}% HP ({stat_a['job']}) | "
+              f"B: {int(stat_b['hp']*100)}% HP ({stat_b['job']})")
 
         # WIN CONDITION: Enemy is Dead OR Downed
         if stat_a['dead'] or stat_a['downed']:
@@ -1,11 +1,17 @@
-import requests
+import asyncio
 import json
-import time
+import os
 import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "mod"))
+from rimapi_sse import SseClient
 
 # --- CONFIGURATION ---
 SSE_URL = "http://localhost:8765/api/v1/events"
 RECONNECT_DELAY = 2  # Seconds to wait before reconnecting
+# Optional server-side filter, e.g. `python sse_debugger.py "pawn_*,colonist_ate"`
+EVENT_TYPES = sys.argv[1].split(",") if len(sys.argv) > 1 else None
 
 def format_json(text):
     """Tries to pretty-print JSON data."""
@@ -15,52 +21,23 @@ def format_json(text):
     except:
         return text
 
-def listen_to_sse():
+async def listen_to_sse():
     print(f"[-] Connecting to Event Stream at {SSE_URL}...")
     
-    session = requests.Session()
+    # SseClient reconnects on its own and resumes with Last-Event-ID
+    client = SseClient(SSE_URL, types=EVENT_TYPES, retry_ms=RECONNECT_DELAY * 1000)
     
-    while True:
-        try:
-            # stream=True is critical for SSE to keep the connection open
-            with session.get(SSE_URL, stream=True, timeout=None) as response:
-                if response.status_code == 200:
-                    print("[+] Connected! Waiting for events...\n")
-                    
-                    # Iterates over lines as they arrive
-                    for line in response.iter_lines():
-                        if line:
-                            decoded_line = line.decode('utf-8')
-                            
-                            if decoded_line.startswith("event:"):
-                                raw_data = decoded_line[6:].strip()
-                                print(f"============ EVENT RECEIVED: {raw_data} ============")
-                                                  
-                            # SSE format usually sends "data: {json}"
-                            if decoded_line.startswith("data:"):
-                                raw_data = decoded_line[5:].strip() # Remove "data:" prefix
-                                
-                                # Print Timestamp
-                                timestamp = time.strftime("%H:%M:%S")
-                                print(f"[{timestamp}] EVENT RECEIVED:")
-                                print(format_json(raw_data))
-                                print("-" * 40)
-                                
-                            elif decoded_line.startswith(":"):
-                                # This is a heartbeat/comment
-                                pass
-                else:
-                    print(f"[!] Server returned status: {response.status_code}")
-                    
-        except requests.exceptions.ConnectionError:
-            print(f"[!] Connection failed. Retrying in {RECONNECT_DELAY}s...")
-        except KeyboardInterrupt:
-            print("\n[!] Stopping Debugger.")
-            sys.exit(0)
-        except Exception as e:
-            print(f"[!] Unexpected Error: {e}")
+    async for event in client.events():
+        print(f"============ EVENT RECEIVED: {event.event} ============")
         
-        time.sleep(RECONNECT_DELAY)
+        # Print Timestamp
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] EVENT RECEIVED:")
+        print(format_json(event.data))
+        print("-" * 40)
 
 if __name__ == "__main__":
-    listen_to_sse()
\ No newline at end of file
+    try:
+        asyncio.run(listen_to_sse())
+    except KeyboardInterrupt:
+        print("\n[!] Stopping Debugger.")
@@ -0,0 +1,78 @@
+import threading
+import unittest
+
+import requests
+
+# CONFIGURATION
+BASE_URL = "http://localhost:8765"
+CONCURRENT_REQUESTS = 50
+# Expensive on the game thread, which is what the single-flight cache protects
+ENDPOINT = "/api/v1/def/all"
+PARAMS = {"include": "things_defs"}
+
+
+def get_cache_status():
+    resp = requests.get(f"{BASE_URL}/api/v1/cache/status", timeout=10)
+    resp.raise_for_status()
+    return resp.json()["data"]
+
+
+def fire_simultaneously(count):
+    """Sends `count` identical requests released at the same moment; returns the responses."""
+    barrier = threading.Barrier(count)
+    responses = [None] * count
+
+    def worker(i):
+        session = requests.Session()
+        barrier.wait()
+        responses[i] = session.get(f"{BASE_URL}{ENDPOINT}", params=PARAMS, timeout=60)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return responses
+
+
+class TestCacheSingleFlight(unittest.TestCase):
+    """
+    Identical requests arriving together must run the data factory once.
+    Requires a running game with the RIMAPI server and no other API traffic.
+    """
+
+    def setUp(self):
+        try:
+            self.was_enabled = get_cache_status()["enabled"]
+        except requests.exceptions.ConnectionError:
+            self.skipTest(f"Could not connect to {BASE_URL}. Is RimWorld running?")
+        if not self.was_enabled:
+            requests.post(f"{BASE_URL}/api/v1/cache/enable", timeout=10).raise_for_status()
+        requests.post(f"{BASE_URL}/api/v1/cache/clear", timeout=10).raise_for_status()
+
+    def tearDown(self):
+        if not self.was_enabled:
+            requests.post(f"{BASE_URL}/api/v1/cache/disable", timeout=10)
+
+    def test_factory_runs_once(self):
+        before = get_cache_status()["statistics"]
+        responses = fire_simultaneously(CONCURRENT_REQUESTS)
+        after = get_cache_status()["statistics"]
+
+        for resp in responses:
+            self.assertEqual(resp.status_code, 200, resp.text[:200])
+        etags = {resp.headers.get("ETag") for resp in responses}
+        self.assertEqual(len(etags), 1, f"Responses differ: {etags}")
+
+        misses = after["misses"] - before["misses"]
+        hits = after["hits"] - before["hits"]
+        coalesced = after["coalesced"] - before["coalesced"]
+        print(f"misses={misses} hits={hits} coalesced={coalesced}")
+
+        # A miss is the only path that calls the data factory
+        self.assertEqual(misses, 1)
+        self.assertEqual(hits + coalesced, CONCURRENT_REQUESTS - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -180,5 +180,28 @@ class TestPawnEditEndpoints(unittest.TestCase):
         }
         self._post("/pawn/edit/faction", payload)
 
+    # --- 11. Batch ---
+    def test_edit_batch(self):
+        print("Testing Batch Edit...")
+        payload = {
+            "pawns": [
+                {
+                    "pawn_id": TEST_PAWN_ID,
+                    "health": {"heal_all_injuries": True},
+                    "needs": {"food": 1.0, "rest": 1.0, "mood": 1.0},
+                    "status": {"is_drafted": False}
+                },
+                {
+                    "pawn_id": -1,  # Never a valid ID, reported per item
+                    "needs": {"food": 1.0}
+                }
+            ]
+        }
+        data = self._post("/pawns/edit/batch", payload)["data"]
+        self.assertEqual(data["succeeded"], 1)
+        self.assertEqual(data["failed"], 1)
+        self.assertEqual(data["results"][0]["applied"], ["health", "needs", "status"])
+        self.assertFalse(data["results"][1]["success"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import socket
+import statistics
+import time
+import unittest
+
+import requests
+
+# CONFIGURATION
+BASE_URL = "http://localhost:8765"
+ROUNDS = 12
+EVENTS_PER_ROUND = 200
+EVENT_SIZE = 8 * 1024  # Large payloads fill the stalled socket quickly
+
+
+def get_stats():
+    resp = requests.get(f"{BASE_URL}/api/v1/events/stats", timeout=10)
+    resp.raise_for_status()
+    return resp.json()["data"]
+
+
+def emit(count, size):
+    resp = requests.post(
+        f"{BASE_URL}/api/v1/dev/events/emit",
+        params={"type": "test.slow_client", "count": count, "size": size},
+        timeout=10,
+    )
+    resp.raise_for_status()
+
+
+def open_stalled_subscriber():
+    """Subscribe to /api/v1/events and never read from the socket."""
+    host, port = BASE_URL.split("://", 1)[1].split(":")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect((host, int(port)))
+    sock.sendall(
+        f"GET /api/v1/events HTTP/1.1\r\nHost: {host}:{port}\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    return sock
+
+
+class TestSseSlowClient(unittest.TestCase):
+    """
+    A subscriber that never reads must not slow down the game thread.
+    Requires a running game with the RIMAPI server.
+    """
+
+    def setUp(self):
+        try:
+            self.baseline = get_stats()
+        except requests.exceptions.ConnectionError:
+            self.skipTest(f"Could not connect to {BASE_URL}. Is RimWorld running?")
+        self.sock = open_stalled_subscriber()
+        time.sleep(1.0)
+
+    def tearDown(self):
+        self.sock.close()
+
+    def test_tick_time_stays_flat(self):
+        per_event_us = []
+        last = get_stats()
+
+        for i in range(ROUNDS):
+            emit(EVENTS_PER_ROUND, EVENT_SIZE)
+            time.sleep(0.5)
+            stats = get_stats()
+
+            broadcast = stats["events_broadcast"] - last["events_broadcast"]
+            tick_ms = stats["total_tick_ms"] - last["total_tick_ms"]
+            if broadcast:
+                per_event_us.append(tick_ms * 1000.0 / broadcast)
+            print(
+                f"round {i + 1:>2}: {tick_ms:7.2f} ms for {broadcast} events, "
+                f"dropped {stats['frames_dropped']}, evicted {stats['clients_evicted']}"
+            )
+            last = stats
+
+        self.assertGreaterEqual(len(per_event_us), ROUNDS // 2, "Events were not broadcast")
+
+        # Once the stalled socket is full, later rounds must cost about the same as the first ones
+        early = statistics.median(per_event_us[:3])
+        late = statistics.median(per_event_us[-3:])
+        print(f"per-event cost: early {early:.1f} us, late {late:.1f} us")
+        self.assertLess(late, max(early * 3, early + 50), "Tick cost grew while a client was stalled")
+
+        # The stalled client is either shedding events or has been disconnected
+        backpressure = (last["frames_dropped"] - self.baseline["frames_dropped"]) + (
+            last["clients_evicted"] - self.baseline["clients_evicted"]
+        )
+        self.assertGreater(backpressure, 0, "Stalled client never hit its queue limit")
+
+
+if __name__ == "__main__":
+    unittest.main()